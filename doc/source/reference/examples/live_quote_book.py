@@ -0,0 +1,12 @@
+import threading
+import yfinance as yf
+
+book = yf.LiveQuoteBook()
+
+ws = yf.WebSocket(verbose=False)
+ws.subscribe(["AAPL", "MSFT", "BTC-USD"])
+threading.Thread(target=ws.listen, args=(book.update,), daemon=True).start()
+
+# Later, from any thread:
+print(book.get("AAPL", "price"))
+print(book.snapshot())
@@ -7,6 +7,7 @@ dat.history(period='1mo')
 
 # options
 dat.option_chain(dat.options[0]).calls
+dat.option_chains()  # all expirations, one table
 
 # get financials
 dat.balance_sheet
@@ -7,5 +7,12 @@ tickers.tickers['MSFT'].info
 tickers.tickers['AAPL'].history(period="1mo")
 tickers.tickers['GOOG'].actions
 
+# holders, analysis & ESG of all tickers, one table per attribute
+tables = tickers.fetch_modules(['institutional_holders', 'earnings_estimate', 'sustainability'])
+tables['institutional_holders']
+
+# fast_info of all tickers, one row per ticker
+tickers.fast_info_frame(['lastPrice', 'dayHigh', 'dayLow', 'marketCap'])
+
 # websocket
 tickers.live()
@@ -0,0 +1,70 @@
+"""
+Offline benchmarks for parsing fundamentals-timeseries payloads.
+
+Run with: python -m tests.benchmark_fundamentals
+No network: payloads are generated in the shape Yahoo returns, for every
+key of each statement.
+"""
+from tests.context import yfinance as yf  # noqa: F401
+
+import timeit
+
+import numpy as _np
+import pandas as _pd
+
+from yfinance import const
+from yfinance.scrapers.fundamentals import Financials
+
+
+def _make_payload(keys, prefix, n_periods, seed=0):
+    rng = _np.random.default_rng(seed)
+    timestamps = [int(t.timestamp()) for t in _pd.date_range(end='2025-06-30', periods=n_periods, freq='QE')]
+    payload = []
+    for k in keys:
+        payload.append({
+            'meta': {'symbol': ['BENCH'], 'type': [prefix + k]},
+            'timestamp': timestamps,
+            prefix + k: [{'asOfDate': _pd.Timestamp(t, unit='s').strftime('%Y-%m-%d'), 'periodType': '3M',
+                          'currencyCode': 'USD', 'reportedValue': {'raw': float(v), 'fmt': ''}}
+                         for t, v in zip(timestamps, rng.normal(1e9, 1e8, n_periods))],
+        })
+    return payload
+
+
+def _parse_rowwise(data_raw, timescale, keys):
+    # Previous reshape: one row assignment per item into an object frame
+    timestamps = set()
+    data_unpacked = {}
+    for x in data_raw:
+        for k, v in x.items():
+            if k == 'timestamp':
+                timestamps.update(v)
+            elif k != 'meta':
+                data_unpacked[k] = v
+    dates = _pd.to_datetime(sorted(timestamps), unit='s')
+    df = _pd.DataFrame(columns=dates, index=list(data_unpacked.keys()))
+    for k, v in data_unpacked.items():
+        df.loc[k] = {_pd.Timestamp(x['asOfDate']): x['reportedValue']['raw'] for x in v}
+    df.index = df.index.str.replace('^' + timescale, '', regex=True)
+    for d in df.columns:
+        df[d] = df[d].astype('float')
+    df = df.reindex([k for k in keys if k in df.index])
+    return df[sorted(df.columns, reverse=True)]
+
+
+def bench_parse_financials_time_series(n_periods=5, repeat=5):
+    financials = Financials(None, 'BENCH')
+    results = {}
+    for name in ('financials', 'balance-sheet', 'cash-flow'):
+        keys = const.fundamentals_keys[name]
+        payload = _make_payload(keys, 'quarterly', n_periods)
+        t_old = min(timeit.repeat(lambda: _parse_rowwise(payload, 'quarterly', keys), number=1, repeat=repeat))
+        t_new = min(timeit.repeat(lambda: financials._parse_financials_time_series(payload, 'quarterly', keys), number=1, repeat=repeat))
+        results[name] = (t_old, t_new)
+        print(f"_parse_financials_time_series: {name}, {len(keys)} keys x {n_periods} periods: "
+              f"{t_new*1000:.1f} ms (row-wise {t_old*1000:.1f} ms, {t_old/t_new:.0f}x)")
+    return results
+
+
+if __name__ == '__main__':
+    bench_parse_financials_time_series()
@@ -0,0 +1,82 @@
+"""
+Offline benchmarks for price-repair hot spots.
+
+Run with: python -m tests.benchmark_price_repair
+No network: finer-grain fetches are stubbed to return nothing, so the
+timings cover the local analysis only.
+"""
+from tests.context import yfinance as yf  # noqa: F401
+
+import timeit
+
+import numpy as _np
+import pandas as _pd
+
+from yfinance import utils
+from yfinance.scrapers.history import PriceHistory
+
+
+def _make_price_history(tkr='BENCH', tz='America/New_York', currency='USD'):
+    hist = PriceHistory(None, tkr, tz)
+    hist._history_metadata = {'currency': currency, 'exchangeTimezoneName': tz}
+    hist.history = lambda *args, **kwargs: utils.empty_df()
+    return hist
+
+
+def _make_daily_bars(n, tz='America/New_York', seed=0):
+    rng = _np.random.default_rng(seed)
+    index = _pd.bdate_range(end='2020-01-01', periods=n, tz=tz, name='Date')
+    close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = close * (1 + rng.normal(0, 0.003, n))
+    high = _np.maximum(open_, close) * (1 + _np.abs(rng.normal(0, 0.003, n)))
+    low = _np.minimum(open_, close) * (1 - _np.abs(rng.normal(0, 0.003, n)))
+    df = _pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Adj Close': close,
+                        'Volume': rng.integers(1e5, 1e6, n), 'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+    return df
+
+
+def bench_fix_unit_random_mixups(n_rows=10000, n_errors=50, repeat=5):
+    df = _make_daily_bars(n_rows)
+    rng = _np.random.default_rng(1)
+    cols = ['Open', 'High', 'Low', 'Close', 'Adj Close']
+    values = df[cols].to_numpy(copy=True)
+    values[rng.integers(0, n_rows, n_errors), rng.integers(0, len(cols), n_errors)] *= 100
+    df[cols] = values
+    hist = _make_price_history()
+    t = min(timeit.repeat(lambda: hist._fix_unit_random_mixups(df, '1d', 'America/New_York', False), number=1, repeat=repeat))
+    print(f"_fix_unit_random_mixups: {n_rows} rows, {n_errors} errors: {t*1000:.1f} ms")
+    return t
+
+
+def _make_dividend_bars(n_divs, period=21, div_yield=0.01, seed=0):
+    # Regular dividends with matching price drop and correct Adj Close
+    df = _make_daily_bars(n_divs * period, seed=seed)
+    div_idx = _np.arange(period - 1, len(df), period)
+    close = df['Close'].to_numpy()
+    divs = _np.round(close[div_idx - 1] * div_yield, 4)
+    df.iloc[div_idx, df.columns.get_loc('Dividends')] = divs
+    adj = _np.ones(len(df))
+    for i, d in zip(div_idx, divs):
+        adj[:i] *= 1.0 - d / close[i - 1]
+    df['Adj Close'] = close * adj
+    return df, div_idx
+
+
+def bench_fix_bad_div_adjust(n_divs_list=(25, 50, 100, 200, 400), n_errors=5, repeat=3):
+    results = {}
+    for n_divs in n_divs_list:
+        df, div_idx = _make_dividend_bars(n_divs)
+        # Some dividends 100x too big, i.e. currency unit mixup
+        rng = _np.random.default_rng(1)
+        bad = rng.choice(div_idx, size=min(n_errors, len(div_idx)), replace=False)
+        df.iloc[bad, df.columns.get_loc('Dividends')] *= 100
+        hist = _make_price_history()
+        t = min(timeit.repeat(lambda: hist._fix_bad_div_adjust(df, '1d', False, 'USD'), number=1, repeat=repeat))
+        results[n_divs] = t
+        print(f"_fix_bad_div_adjust: {len(df)} rows, {n_divs} dividends: {t*1000:.1f} ms")
+    return results
+
+
+if __name__ == '__main__':
+    bench_fix_unit_random_mixups()
+    bench_fix_bad_div_adjust()
@@ -13,6 +13,11 @@ from tests.context import yfinance as yf
 import unittest
 import tempfile
 import os
+import sqlite3
+import datetime as _dt
+
+import numpy as _np
+import pandas as _pd
 
 
 class TestCache(unittest.TestCase):
@@ -26,8 +31,15 @@ class TestCache(unittest.TestCase):
     def tearDownClass(cls):
         yf.cache._TzDBManager.close_db()
         yf.cache._TzCacheManager._tz_cache = None
+        yf.cache._CookieDBManager.close_db()
         yf.cache._CookieCacheManager._Cookie_cache = None
         yf.cache._ISINCacheManager._isin_cache = None
+        yf.cache._RepairPriceDBManager.close_db()
+        yf.cache._RepairPriceCacheManager._repair_price_cache = None
+        yf.cache._RepairResultDBManager.close_db()
+        yf.cache._RepairResultCacheManager._repair_result_cache = None
+        yf.cache._FundamentalsDBManager.close_db()
+        yf.cache._FundamentalsStoreManager._fundamentals_store = None
         cls.tempCacheDir.cleanup()
         yf.set_tz_cache_location(cls.original_cache_dir)
 
@@ -51,5 +63,239 @@ class TestCache(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "tkr-tz.db")))
 
 
+    def test_tzCacheBatch(self):
+        cache = yf.cache.get_tz_cache()
+        tzs = {f"TKR{i}": "America/New_York" for i in range(250)}
+        tzs["TKR0"] = "Europe/London"
+        cache.store_many(tzs)
+        cache.clear()  # forget memory, read back from SQLite
+
+        found = cache.lookup_many(list(tzs) + ["MISSING"])
+        self.assertEqual(found, tzs)
+        self.assertEqual(cache.lookup("TKR0"), "Europe/London")
+
+        # Upsert overwrites, None deletes
+        cache.store_many({"TKR0": "Asia/Tokyo", "TKR1": None})
+        cache.clear()
+        self.assertEqual(cache.lookup("TKR0"), "Asia/Tokyo")
+        self.assertIsNone(cache.lookup("TKR1"))
+
+    def test_cookieCache(self):
+        cache = yf.cache.get_cookie_cache()
+        cache.store("basic", {"A3": "abc"})
+        cookie = cache.lookup("basic")
+        self.assertEqual(cookie["cookie"], {"A3": "abc"})
+        self.assertLess(cookie["age"], _dt.timedelta(minutes=1))
+        # Each lookup gets own copy
+        cookie["cookie"]["A3"] = "changed"
+        self.assertEqual(cache.lookup("basic")["cookie"], {"A3": "abc"})
+        cache.store("basic", None)
+        self.assertIsNone(cache.lookup("basic"))
+
+    def test_tzCacheLocked(self):
+        # Another process holding the write lock: store only in memory, then recover
+        original = (yf.config.cache.busy_timeout, yf.config.cache.lock_retries)
+        yf.config.cache.busy_timeout = 0.01
+        yf.config.cache.lock_retries = 1
+        yf.cache._TzDBManager.close_db()
+        yf.cache._TzDBManager._db = None
+        yf.cache._TzCacheManager._tz_cache = None
+        other = sqlite3.connect(os.path.join(self.tempCacheDir.name, "tkr-tz.db"))
+        try:
+            cache = yf.cache.get_tz_cache()
+            cache.lookup("AMZN")  # initialise
+            before = yf.cache.get_cache_stats()["TzCache"]
+            other.execute("BEGIN IMMEDIATE")
+            cache.store("LOCKED", "Asia/Tokyo")
+            self.assertEqual(cache.lookup("LOCKED"), "Asia/Tokyo")
+            after = yf.cache.get_cache_stats()["TzCache"]
+            self.assertEqual(after["lock_failures"] - before["lock_failures"], 1)
+            self.assertEqual(after["retries"] - before["retries"], 1)
+            self.assertGreater(after["memory_hits"], before["memory_hits"])
+            other.rollback()
+
+            cache.store("LOCKED", "Europe/Paris")
+            cache.clear()
+            self.assertEqual(cache.lookup("LOCKED"), "Europe/Paris")
+        finally:
+            other.close()
+            yf.config.cache.busy_timeout, yf.config.cache.lock_retries = original
+            yf.cache._TzDBManager.close_db()
+            yf.cache._TzDBManager._db = None
+            yf.cache._TzCacheManager._tz_cache = None
+
+    def test_cacheBackend(self):
+        backend = yf.cache.MemoryCacheBackend()
+        yf.cache.set_cache_backend(backend, prefix='test:')
+        try:
+            tz_cache = yf.cache.get_tz_cache()
+            tz_cache.store_many({"SHARED": "Asia/Tokyo", "DROPPED": "Europe/Paris"})
+            tz_cache.store("DROPPED", None)
+            tz_cache.clear()  # another node only sees the backend
+            self.assertEqual(backend.get("test:TzCache:SHARED"), b"Asia/Tokyo")
+            self.assertEqual(tz_cache.lookup_many(["SHARED", "DROPPED"]), {"SHARED": "Asia/Tokyo"})
+
+            cookie_cache = yf.cache.get_cookie_cache()
+            cookie_cache.store("shared", {"A3": "abc"})
+            cookie_cache.clear()
+            self.assertEqual(cookie_cache.lookup("shared")["cookie"], {"A3": "abc"})
+
+            responses = yf.cache.get_response_cache()
+            self.assertIsNone(responses.lookup("https://example.com", {"a": 1}))
+            responses.store("https://example.com", {"a": 1}, "https://example.com/?a=1", b'{"x": 1}')
+            self.assertEqual(responses.lookup("https://example.com", {"a": 1}), ("https://example.com/?a=1", b'{"x": 1}'))
+            self.assertIsNone(responses.lookup("https://example.com", {"a": 2}))
+
+            # Failing backend is a miss, not an error
+            before = yf.cache.get_cache_stats()["TzCache"]["backend_errors"]
+            backend.mget = None
+            tz_cache.clear()
+            self.assertIsNone(tz_cache.lookup("SHARED"))
+            self.assertEqual(yf.cache.get_cache_stats()["TzCache"]["backend_errors"], before + 1)
+        finally:
+            yf.cache.set_cache_backend(None)
+            yf.cache.get_tz_cache().clear()
+            yf.cache.get_cookie_cache().clear()
+
+    def test_repairPriceCache(self):
+        tz = "America/New_York"
+        index = _pd.date_range("2020-01-01 09:30", "2020-01-10 16:30", freq="1h", tz=tz)
+        prices = _pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+        d = _dt.date
+        cache = yf.cache.get_repair_price_cache()
+
+        self.assertIsNone(cache.lookup("AMZN", "1h", False, d(2020, 1, 2), d(2020, 1, 4)))
+        cache.store("AMZN", "1h", False, d(2020, 1, 1), d(2020, 1, 6), prices[:"2020-01-05"])
+        cache.store("AMZN", "1h", False, d(2020, 1, 6), d(2020, 1, 11), prices["2020-01-06":])
+
+        # Adjacent fetches merge, so a request spanning both is a slice
+        df = cache.lookup("AMZN", "1h", False, d(2020, 1, 3), d(2020, 1, 8))
+        self.assertEqual(df.index[0].date(), d(2020, 1, 3))
+        self.assertEqual(df.index[-1].date(), d(2020, 1, 7))
+        self.assertIsNone(cache.lookup("AMZN", "1h", False, d(2020, 1, 3), d(2020, 1, 12)))
+        self.assertIsNone(cache.lookup("AMZN", "1h", True, d(2020, 1, 3), d(2020, 1, 8)))
+        self.assertIsNone(cache.lookup("MSFT", "1h", False, d(2020, 1, 3), d(2020, 1, 8)))
+
+        # Persistent entries survive clearing memory
+        cache.store("MSFT", "1d", False, d(2020, 1, 1), d(2020, 1, 11), prices, persistent=True)
+        cache.clear()
+        self.assertIsNone(cache.lookup("AMZN", "1h", False, d(2020, 1, 3), d(2020, 1, 8)))
+        df = cache.lookup("MSFT", "1d", False, d(2020, 1, 1), d(2020, 1, 11), persistent=True)
+        self.assertEqual(len(df), len(prices))
+        self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "repair-prices.db")))
+
+        # Only the range actually returned is covered
+        cache.store("AAPL", "1h", False, d(2019, 12, 1), d(2020, 3, 1), prices)
+        self.assertIsNotNone(cache.lookup("AAPL", "1h", False, d(2020, 1, 3), d(2020, 1, 8)))
+        self.assertIsNone(cache.lookup("AAPL", "1h", False, d(2019, 12, 1), d(2020, 1, 8)))
+        self.assertIsNone(cache.lookup("AAPL", "1h", False, d(2020, 1, 3), d(2020, 2, 1)))
+        cache.store("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11), prices.iloc[:0])
+        self.assertIsNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11)))
+
+        # A split/dividend newer than the cached prices makes them stale
+        cache.store("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11), prices, last_event=d(2019, 6, 1))
+        self.assertIsNotNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11), last_event=d(2019, 6, 1)))
+        self.assertIsNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11), last_event=d(2020, 6, 1)))
+        cache.store("AAPL", "1d", False, d(2020, 1, 6), d(2020, 1, 11), prices["2020-01-06":], last_event=d(2020, 6, 1))
+        self.assertIsNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 1), d(2020, 1, 11), last_event=d(2020, 6, 1)))
+        self.assertIsNotNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 6), d(2020, 1, 11), last_event=d(2020, 6, 1)))
+
+        # Fetched ranges expire
+        cache._now = lambda: _dt.datetime.now() + _dt.timedelta(seconds=yf.config.repair.cache_ttl + 1)
+        try:
+            self.assertIsNone(cache.lookup("AAPL", "1d", False, d(2020, 1, 6), d(2020, 1, 11)))
+        finally:
+            del cache._now
+
+    def test_repairResultCache(self):
+        tz = "America/New_York"
+        index = _pd.date_range("2020-01-01", "2020-01-10", freq="1D", tz=tz)
+        prices = _pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+        hashes = _pd.util.hash_pandas_object(prices, index=True).to_numpy()
+        cache = yf.cache.get_repair_result_cache()
+
+        self.assertIsNone(cache.lookup("AMZN", "1d", False, "USD"))
+        cache.store("AMZN", "1d", False, "USD", list(prices.columns), hashes, prices, "USD")
+        columns, row_hashes, df, currency, state = cache.lookup("AMZN", "1d", False, "USD")
+        self.assertEqual(columns, ("Close",))
+        self.assertTrue((row_hashes == hashes).all())
+        self.assertTrue(df.equals(prices))
+        self.assertIsNone(state)
+        self.assertIsNone(cache.lookup("AMZN", "1d", True, "USD"))
+        self.assertIsNone(cache.lookup("AMZN", "1d", False, "GBp"))
+
+        # Persistent entries survive clearing memory
+        cache.store("MSFT", "1d", False, "USD", list(prices.columns), hashes, prices, "USD", {100: {}}, persistent=True)
+        cache.clear()
+        self.assertIsNone(cache.lookup("AMZN", "1d", False, "USD"))
+        entry = cache.lookup("MSFT", "1d", False, "USD", persistent=True)
+        self.assertEqual(len(entry[2]), len(prices))
+        self.assertEqual(entry[4], {100: {}})
+        self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "repair-results.db")))
+
+    def test_fundamentalsStore(self):
+        store = yf.cache.get_fundamentals_store()
+        t = _pd.Timestamp
+        df = _pd.DataFrame({t("2024-06-30"): [1.0, 2.0], t("2023-06-30"): [3.0, _np.nan]},
+                           index=["TotalRevenue", "NetIncome"])
+        self.assertTrue(store.is_stale("AMZN", "income", "yearly"))
+        self.assertIsNone(store.lookup("AMZN", "income", "yearly"))
+
+        store._now = lambda: _dt.datetime(2025, 7, 1)
+        try:
+            store.store("AMZN", "income", "yearly", df)
+        finally:
+            del store._now
+        _pd.testing.assert_frame_equal(store.lookup("AMZN", "income", "yearly").reindex(df.index), df,
+                                       check_column_type=False)
+
+        # Next report due ~90 days after the next year end
+        self.assertFalse(store.is_stale("AMZN", "income", "yearly", now=_dt.datetime(2025, 7, 1, 12)))
+        self.assertFalse(store.is_stale("AMZN", "income", "yearly", now=_dt.datetime(2025, 9, 1)))
+        self.assertTrue(store.is_stale("AMZN", "income", "yearly", now=_dt.datetime(2025, 10, 1)))
+        # ... or just after an earnings release
+        store.set_earnings_date("AMZN", _dt.date(2025, 7, 30))
+        self.assertFalse(store.is_stale("AMZN", "income", "yearly", now=_dt.datetime(2025, 7, 30)))
+        self.assertTrue(store.is_stale("AMZN", "income", "yearly", now=_dt.datetime(2025, 8, 1)))
+
+        # Restated value is a new version, the old one still visible as of before
+        restated = df.copy()
+        restated.loc["TotalRevenue", t("2024-06-30")] = 1.5
+        store.store("AMZN", "income", "yearly", restated)
+        self.assertEqual(store.lookup("AMZN", "income", "yearly").loc["TotalRevenue", t("2024-06-30")], 1.5)
+        snapshot = store.lookup("AMZN", "income", "yearly", as_of="2025-07-01")
+        self.assertEqual(snapshot.loc["TotalRevenue", t("2024-06-30")], 1.0)
+        self.assertEqual(snapshot.loc["NetIncome", t("2024-06-30")], 2.0)
+        self.assertIsNone(store.lookup("AMZN", "income", "yearly", as_of="2000-01-01"))
+        self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "fundamentals.db")))
+
+    def test_fundamentalsStoreFinancials(self):
+        from yfinance.scrapers.fundamentals import Financials
+        calls = []
+
+        def fake_fetch_types(types):
+            calls.append(types)
+            return [{"meta": {"type": [k]}, "timestamp": [1719705600],
+                     k: [{"asOfDate": "2024-06-30", "reportedValue": {"raw": 1.0}}]} for k in types]
+
+        yf.config.cache.fundamentals = True
+        try:
+            financials = Financials(None, "MSFT")
+            financials._fetch_types = fake_fetch_types
+            df = financials.get_balance_sheet_time_series("quarterly")
+            self.assertEqual(len(calls), 1)
+
+            # New session reads the store instead of fetching
+            financials = Financials(None, "MSFT")
+            financials._fetch_types = fake_fetch_types
+            self.assertTrue(financials.get_balance_sheet_time_series("quarterly").equals(df))
+            tables = financials._fetch_time_series_many(["balance-sheet", "cash-flow"], ["quarterly"])
+            self.assertTrue(tables[("balance-sheet", "quarterly")].equals(df))
+            self.assertEqual(len(calls), 2)
+            self.assertFalse(any(t.startswith("quarterlyTotalAssets") for t in calls[1]))
+        finally:
+            yf.config.cache.fundamentals = False
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,7 +2,14 @@
 import unittest
 from functools import lru_cache
 
+from unittest.mock import Mock, patch
+
+import tempfile
+import threading
+
+from yfinance import cache
 from yfinance._http import new_session
+from yfinance.config import YfConfig
 from yfinance.data import SingletonMeta, YfData, _normalize_proxy, lru_cache_freezeargs
 from yfinance.exceptions import YFDataException
 from yfinance.utils import frozendict
@@ -169,5 +176,138 @@ class TestSetSessionCacheDetection(unittest.TestCase):
             self.data._set_session(session)
 
 
+class TestCrumbSharing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Persist crumbs in a throwaway cache folder, not the user's
+        cls.original_cache_dir = cache._CookieDBManager.get_location()
+        cls.tempCacheDir = tempfile.TemporaryDirectory()
+        cache.set_cache_location(cls.tempCacheDir.name)
+        cache._CookieCacheManager._Cookie_cache = None
+
+    @classmethod
+    def tearDownClass(cls):
+        cache._CookieDBManager.close_db()
+        cache._CookieCacheManager._Cookie_cache = None
+        cls.tempCacheDir.cleanup()
+        cache.set_cache_location(cls.original_cache_dir)
+
+    def setUp(self):
+        # No background fetch racing the cookie/crumb state tests poke
+        self.original_prewarm = YfConfig.network.prewarm
+        YfConfig.network.prewarm = False
+        SingletonMeta._instances.pop(YfData, None)
+        self.data = YfData()
+        self.data._session.cookies.clear()
+        self.data._session.cookies.set("A3", "a3val", domain=".yahoo.com")
+
+    def tearDown(self):
+        cache.get_cookie_cache().store('crumb', None)
+        SingletonMeta._instances.pop(YfData, None)
+        YfConfig.network.prewarm = self.original_prewarm
+
+    def test_read_without_lock_once_valid(self):
+        self.data._valid_crumb = ("crumb-value", "basic")
+        with self.data._cookie_lock:
+            # Would deadlock if reading needed the lock
+            self.assertEqual(self.data._get_cookie_and_crumb(), ("crumb-value", "basic"))
+        self.data._set_cookie_strategy('csrf')
+        self.assertIsNone(self.data._valid_crumb)
+
+    def test_persisted_crumb_matches_cookie(self):
+        self.data._crumb = "crumb-value"
+        self.assertTrue(self.data._save_crumb())
+
+        # New process, same cookie: reuse crumb
+        self.data._crumb = None
+        self.assertTrue(self.data._load_crumb())
+        self.assertEqual(self.data._crumb, "crumb-value")
+
+        # Crumb was minted for a different cookie
+        self.data._crumb = None
+        self.data._session.cookies.clear()
+        self.data._session.cookies.set("A3", "other", domain=".yahoo.com")
+        self.assertFalse(self.data._load_crumb())
+        self.assertIsNone(self.data._crumb)
+
+    def test_rejected_crumb_drops_persisted_crumb(self):
+        self.data._crumb = "crumb-value"
+        self.data._save_crumb()
+        self.data._set_cookie_strategy('csrf')
+        self.assertTrue(self.data._load_crumb())
+        self.data._set_cookie_strategy('basic', crumb_rejected=True)
+        self.assertFalse(self.data._load_crumb())
+
+    def test_new_session_drops_crumb(self):
+        self.data._valid_crumb = ("crumb-value", "basic")
+        self.data._set_session(self.data._session)
+        self.assertEqual(self.data._valid_crumb, ("crumb-value", "basic"))
+        self.data._set_session(new_session())
+        self.assertIsNone(self.data._valid_crumb)
+
+    def test_prewarm_opt_in(self):
+        with patch.object(YfData, "_prewarm") as prewarm:
+            SingletonMeta._instances.pop(YfData, None)
+            YfData()
+            prewarm.assert_not_called()
+
+            YfConfig.network.prewarm = True
+            SingletonMeta._instances.pop(YfData, None)
+            YfData()
+            prewarm.assert_called_once()
+
+    def test_prewarm(self):
+        done = threading.Event()
+        with patch.object(self.data, "_get_cookie_and_crumb", side_effect=lambda: done.set()):
+            self.data._prewarm()
+            self.assertTrue(done.wait(5))
+
+
+class TestSharedResponses(unittest.TestCase):
+    def setUp(self):
+        SingletonMeta._instances.pop(YfData, None)
+        self.data = YfData()
+        cache.set_cache_backend(cache.MemoryCacheBackend())
+
+    def tearDown(self):
+        cache.set_cache_backend(None)
+        SingletonMeta._instances.pop(YfData, None)
+
+    def test_shared_response_reused_by_other_process(self):
+        url = "https://query2.finance.yahoo.com/v8/finance/chart/TEST-SHARED"
+        params = {"period1": 1, "period2": 2}
+        response = Mock(status_code=200, url=url + "?period1=1", content=b'{"chart": {}}')
+        with patch.object(self.data, "get", return_value=response) as get:
+            self.assertIs(self.data.cache_get(url, params, shared=True), response)
+            self.assertEqual(get.call_count, 1)
+
+        # Fresh in-process cache, e.g. another node: served from backend
+        self.data.cache_get.cache_clear()
+        with patch.object(self.data, "get") as get:
+            shared = self.data.cache_get(url, params, shared=True)
+            get.assert_not_called()
+        self.assertEqual(shared.json(), {"chart": {}})
+        self.assertEqual(shared.url, url + "?period1=1")
+
+    def test_shared_response_expires(self):
+        # Past prices are re-adjusted after a new split or dividend
+        backend = Mock()
+        backend.get.return_value = None
+        cache.set_cache_backend(backend)
+        url = "https://query2.finance.yahoo.com/v8/finance/chart/TEST-TTL"
+        response = Mock(status_code=200, url=url, content=b'{"chart": {}}')
+        with patch.object(self.data, "get", return_value=response):
+            self.data.cache_get(url, shared=True)
+        backend.set.assert_called_once()
+        self.assertEqual(backend.set.call_args.kwargs['ex'], 15*60)
+
+    def test_failed_response_not_shared(self):
+        url = "https://query2.finance.yahoo.com/v8/finance/chart/TEST-FAILED"
+        response = Mock(status_code=404, url=url, content=b'')
+        with patch.object(self.data, "get", return_value=response):
+            self.data.cache_get(url, shared=True)
+        self.assertIsNone(cache.get_response_cache().lookup(url))
+
+
 if __name__ == "__main__":
     unittest.main()
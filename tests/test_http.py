@@ -70,6 +70,52 @@ class TestHttpBackend(unittest.TestCase):
         self.assertTrue(mod.is_supported_session(_stdlib_requests.Session()))
         self.assertFalse(mod.is_supported_session(object()))
 
+    def test_pool_config_requests_session(self):
+        from yfinance.config import YfConfig
+        mod = _reload_http(curl_cffi_available=False, disable_env=False)
+        original = (YfConfig.network.pool_maxsize, YfConfig.network.keepalive)
+        try:
+            YfConfig.network.pool_maxsize = 4
+            YfConfig.network.keepalive = False
+            session = mod.new_session()
+        finally:
+            YfConfig.network.pool_maxsize, YfConfig.network.keepalive = original
+        adapter = session.get_adapter("https://query2.finance.yahoo.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(session.headers["Connection"], "close")
+
+        # Sized for download threads, never shrunk
+        def pool_size(s):
+            return s.get_adapter("https://query2.finance.yahoo.com").poolmanager.connection_pool_kw["maxsize"]
+        mod.size_pool(session, 32)
+        self.assertEqual(pool_size(session), 32)
+        mod.size_pool(session, 8)
+        self.assertEqual(pool_size(session), 32)
+
+        # User's own session is theirs to configure
+        import requests as _stdlib_requests
+        user_session = _stdlib_requests.Session()
+        user_adapter = user_session.get_adapter("https://query2.finance.yahoo.com")
+        mod.size_pool(user_session, 32)
+        self.assertIs(user_session.get_adapter("https://query2.finance.yahoo.com"), user_adapter)
+        self.assertEqual(pool_size(user_session), 10)
+
+    def test_pool_config_curl_cffi_session(self):
+        from yfinance.config import YfConfig
+        mod = _reload_http(curl_cffi_available=True, disable_env=False)
+        if not mod.HAS_CURL_CFFI:
+            self.skipTest("curl_cffi not installed")
+        from curl_cffi import CurlOpt
+        original = YfConfig.network.http2
+        try:
+            YfConfig.network.http2 = False
+            session = mod.new_session()
+        finally:
+            YfConfig.network.http2 = original
+        self.assertEqual(session.http_version, "v1")
+        self.assertEqual(session.curl_options[CurlOpt.MAXCONNECTS], YfConfig.network.pool_maxsize)
+        self.assertEqual(session.curl_options[CurlOpt.TCP_KEEPALIVE], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
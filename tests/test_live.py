@@ -1,7 +1,14 @@
+import asyncio
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock
 
-from yfinance.live import BaseWebSocket
+from yfinance.live import AsyncWebSocket, BaseWebSocket, LiveQuoteBook, LiveRecorder, WebSocket, read_recording, _replay_delays
+
+
+_BTC_MESSAGE = ("CgdCVEMtVVNEFYoMuUcYwLCVgIplIgNVU0QqA0NDQzApOAFFPWrEP0iAgOrxvANVx/25R12csrRHZYD8skR9/"
+                "7i0R7ABgIDq8bwD2AEE4AGAgOrxvAPoAYCA6vG8A/IBA0JUQ4ECAAAAwPrjckGJAgAA2P5ZT3tC")
 
 
 class TestWebSocket(unittest.TestCase):
@@ -28,3 +35,77 @@ class TestWebSocket(unittest.TestCase):
         assert "error" in decoded
         assert "raw_base64" in decoded
         self.assertEqual(base64_message, decoded["raw_base64"])
+
+
+class TestLiveQuoteBook(unittest.TestCase):
+    def test_update_and_lookup(self):
+        book = LiveQuoteBook(capacity=1)
+        book.update({'id': 'AAPL', 'price': 190.5, 'time': '1736509140000', 'day_volume': '1000'})
+        book.update({'id': 'MSFT', 'price': 410.0, 'bid': 409.9, 'ask': 410.1})
+        book.update({'id': 'AAPL', 'change': 1.25})
+
+        self.assertEqual(2, len(book))
+        self.assertIn('MSFT', book)
+        self.assertEqual(190.5, book.get('AAPL', 'price'))
+        self.assertEqual(1.25, book['AAPL']['change'])
+        self.assertEqual(1736509140000, book['AAPL']['time'])
+        self.assertIsNone(book.get('AAPL', 'bid'))
+        self.assertIsNone(book.get('TSLA', 'price'))
+
+    def test_snapshot(self):
+        book = LiveQuoteBook(['AAPL'])
+        book({'id': 'AAPL', 'price': 190.5})
+
+        copied = book.snapshot()
+        shared = book.snapshot(copy=False)
+        book.update({'id': 'AAPL', 'price': 191.0})
+
+        self.assertEqual(['AAPL'], list(copied.index))
+        self.assertEqual(list(LiveQuoteBook.fields), list(copied.columns))
+        self.assertEqual(190.5, copied.loc['AAPL', 'price'])
+        self.assertEqual(191.0, shared.loc['AAPL', 'price'])
+        self.assertEqual(191.0, book.to_numpy()[0, 0])
+
+    def test_empty_book_as_handler(self):
+        book = LiveQuoteBook()
+        self.assertEqual(0, len(book))
+        self.assertTrue(book)
+        WebSocket(verbose=False)._handle_message(_BTC_MESSAGE, book)
+        self.assertEqual(94745.08, round(book.get('BTC-USD', 'price'), 2))
+
+
+class TestRecordReplay(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.yfws')
+        os.close(fd)
+        recorder = LiveRecorder(self.path)
+        recorder.write(_BTC_MESSAGE, timestamp=100.0)
+        recorder.write(_BTC_MESSAGE, timestamp=102.0)
+        recorder.close()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_read_recording(self):
+        records = list(read_recording(self.path))
+        self.assertEqual([(100.0, _BTC_MESSAGE), (102.0, _BTC_MESSAGE)], records)
+
+        # A truncated trailing record is ignored
+        with open(self.path, 'ab') as f:
+            f.write(b'\x00\x01')
+        self.assertEqual(2, len(list(read_recording(self.path))))
+
+    def test_replay_delays(self):
+        self.assertEqual([0.0, 0.5], [d for d, _ in _replay_delays(self.path, 4.0)])
+        self.assertEqual([0.0, 0.0], [d for d, _ in _replay_delays(self.path, None)])
+
+    def test_replay_sync(self):
+        received = []
+        WebSocket(verbose=False).replay(self.path, received.append, speed=None)
+        self.assertEqual(2, len(received))
+        self.assertEqual('BTC-USD', received[0]['id'])
+
+    def test_replay_async(self):
+        book = LiveQuoteBook()
+        asyncio.run(AsyncWebSocket(verbose=False).replay(self.path, book, speed=None))
+        self.assertEqual(94745.08, round(book.get('BTC-USD', 'price'), 2))
@@ -59,5 +59,137 @@ class TestDownloadThreadSafety(unittest.TestCase):
         self.assertEqual(msft_tickers, ['MSFT'])
 
 
+def _fake_timeseries_get(urls):
+    # Serve every requested type with 2 annual/quarterly values, except for ticker 'BAD'
+    import json
+    from unittest.mock import MagicMock
+
+    def cache_get(url=None, **kwargs):
+        urls.append(url)
+        symbol = url.split('?symbol=')[1].split('&')[0]
+        if symbol == 'BAD':
+            raise ValueError('no data')
+        result = []
+        for kf in url.split('&type=')[1].split('&')[0].split(','):
+            result.append({
+                'meta': {'symbol': [symbol], 'type': [kf]},
+                'timestamp': [1719705600, 1751241600],
+                kf: [{'asOfDate': '2024-06-30', 'reportedValue': {'raw': 1.0}},
+                     {'asOfDate': '2025-06-30', 'reportedValue': {'raw': 2.0}}],
+            })
+        resp = MagicMock()
+        resp.text = json.dumps({'timeseries': {'result': result}})
+        return resp
+    return cache_get
+
+
+class TestDownloadFinancials(unittest.TestCase):
+    def test_long_table_few_requests(self):
+        from yfinance import const
+        urls = []
+        data = yf.data.YfData()
+        data.fundamentals_use_chunked = False
+        with patch.object(yf.data.YfData, 'cache_get', side_effect=_fake_timeseries_get(urls)):
+            df = yf.download_financials(['AAPL', 'MSFT', 'BAD'], statements=['income', 'balance-sheet'],
+                                        freqs=['yearly', 'trailing'], threads=2)
+
+        self.assertEqual(['ticker', 'statement', 'freq', 'item', 'period_end', 'value'], list(df.columns))
+        self.assertEqual(['AAPL', 'MSFT'], df['ticker'].unique().tolist())
+        aapl = df[df['ticker'] == 'AAPL']
+        self.assertEqual({('income', 'yearly'), ('income', 'trailing'), ('balance-sheet', 'yearly')},
+                         set(zip(aapl['statement'], aapl['freq'])))
+        income = aapl[(aapl['statement'] == 'income') & (aapl['freq'] == 'yearly')]
+        self.assertEqual(2 * len(const.fundamentals_keys['financials']), len(income))
+        self.assertEqual(2.0, income[income['item'] == 'TotalRevenue'].sort_values('period_end')['value'].iloc[-1])
+        # Trailing keeps latest period only
+        trailing = aapl[aapl['freq'] == 'trailing']
+        self.assertEqual(len(const.fundamentals_keys['financials']), len(trailing))
+
+        # 6 statement tables merged into fewer requests
+        urls.clear()
+        session = data._session
+        with patch.object(yf.data.YfData, 'cache_get', side_effect=_fake_timeseries_get(urls)), \
+                patch('yfinance.multi.Ticker', wraps=yf.Ticker) as ticker:
+            df = yf.download_financials('AAPL', session=session)
+        self.assertEqual(6, len(set(zip(df['statement'], df['freq']))))
+        self.assertLess(len(urls), 6)
+        ticker.assert_called_once_with('AAPL', session=session)
+
+
+class TestTickersFetchModules(unittest.TestCase):
+    def test_fetch_modules(self):
+        requests = []
+        lock = threading.Lock()
+
+        def get_raw_json(url, params=None, **kwargs):
+            symbol = url.rsplit('/', 1)[1]
+            with lock:
+                requests.append((symbol, params['modules']))
+            if symbol == 'BAD':
+                raise ValueError('no data')
+            holder = {'maxAge': 1, 'reportDate': {'raw': 1719705600}, 'organization': f'{symbol} holder',
+                      'pctHeld': {'raw': 0.1}, 'position': {'raw': 10}, 'value': {'raw': 100}, 'pctChange': {'raw': 0.0}}
+            return {'quoteSummary': {'result': [{
+                'institutionOwnership': {'ownershipList': [holder]},
+                'esgScores': {'totalEsg': 20.0, 'maxAge': 86400},
+            }], 'error': None}}
+
+        tickers = yf.Tickers('AAPL MSFT BAD')
+        with patch.object(yf.data.YfData, 'get_raw_json', side_effect=get_raw_json):
+            tables = tickers.fetch_modules(['institutional_holders', 'sustainability'], max_workers=3)
+
+        # One request per ticker for both modules
+        self.assertEqual(['AAPL', 'BAD', 'MSFT'], sorted(s for s, _ in requests))
+        holders = tables['institutional_holders']
+        self.assertEqual(['AAPL', 'MSFT'], holders['ticker'].tolist())
+        self.assertEqual(['AAPL holder', 'MSFT holder'], holders['Holder'].tolist())
+        sustainability = tables['sustainability']
+        self.assertEqual(['ticker', 'index', 'esgScores'], list(sustainability.columns))
+        self.assertEqual(20.0, sustainability.set_index(['ticker', 'index']).loc[('MSFT', 'totalEsg'), 'esgScores'])
+        # Ticker objects keep the parsed data
+        self.assertIsNotNone(tickers.tickers['AAPL']._holders._institutional)
+
+        with self.assertRaises(ValueError):
+            tickers.fetch_modules(['info'])
+
+class TestTickersFastInfoFrame(unittest.TestCase):
+    def test_fast_info_frame(self):
+        requests = []
+        lock = threading.Lock()
+
+        def history(price_history, period='1mo', interval='1d', **kwargs):
+            with lock:
+                requests.append((price_history.ticker, period))
+            if price_history.ticker == 'BAD':
+                raise ValueError('no data')
+            price_history._history_metadata = {
+                'currency': 'USD', 'instrumentType': 'EQUITY', 'exchangeName': 'NMS',
+                'exchangeTimezoneName': 'America/New_York',
+                'currentTradingPeriod': {'regular': {'start': 1704465000, 'end': 1704488400,
+                                                     'timezone': 'EST', 'gmtoffset': -18000}}}
+            price_history._history_metadata_formatted = False
+            idx = pd.date_range(end='2024-01-05', periods=5, freq='D', tz='America/New_York')
+            close = [1.0, 2.0, 3.0, 4.0, 100.0 if price_history.ticker == 'MSFT' else 5.0]
+            return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close,
+                                 'Volume': [10] * 5}, index=idx)
+
+        tickers = yf.Tickers('AAPL MSFT BAD')
+        for t in tickers.tickers.values():
+            t._tz = 'America/New_York'
+        with patch('yfinance.scrapers.history.PriceHistory.history', autospec=True, side_effect=history):
+            df = tickers.fast_info_frame(['lastPrice', 'regular_market_previous_close', 'currency'], max_workers=3)
+
+        # Unrequested fields cost nothing: one short chart request per ticker
+        self.assertEqual([('AAPL', '5d'), ('BAD', '5d'), ('MSFT', '5d')], sorted(requests))
+        self.assertEqual(['AAPL', 'MSFT', 'BAD'], df.index.tolist())
+        self.assertEqual(['lastPrice', 'regular_market_previous_close', 'currency'], list(df.columns))
+        self.assertEqual(100.0, df.loc['MSFT', 'lastPrice'])
+        self.assertEqual(4.0, df.loc['AAPL', 'regular_market_previous_close'])
+        self.assertTrue(df.loc['BAD'].isna().all())
+
+        with self.assertRaises(ValueError):
+            tickers.fast_info_frame(['notAField'])
+
+
 if __name__ == '__main__':
     unittest.main()
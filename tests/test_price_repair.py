@@ -4,6 +4,7 @@ from tests.context import session_gbl
 import unittest
 
 import os
+import threading
 import datetime as _dt
 import numpy as _np
 import pandas as _pd
@@ -135,6 +136,314 @@ class TestPriceRepair(unittest.TestCase):
             start_dt = end_dt - td_60d
             dat.history(start=start_dt, end=end_dt, interval="2m", repair=True)
 
+    def test_dbscan_1d(self):
+        from yfinance.scrapers.history import _dbscan_1d
+
+        x = _np.array([0.5, 0.51, 0.52, 0.53, 2.0, 0.0, 0.01, 0.02])
+        labels = _dbscan_1d(x, eps=0.05, min_samples=3)
+        self.assertEqual([0, 0, 0, 0, -1, 1, 1, 1], labels.tolist())
+
+        # Border points (not core) join the cluster of a core point within eps
+        x = _np.array([0.0, 0.04, 0.08, 0.12])
+        self.assertEqual([0, 0, 0, 0], _dbscan_1d(x, eps=0.05, min_samples=3).tolist())
+
+        # No cluster dense enough
+        self.assertEqual([-1, -1], _dbscan_1d(_np.array([0.0, 1.0]), eps=0.05, min_samples=3).tolist())
+
+    def test_reconstruct_batches_fetches(self):
+        # Offline: finer-grain fetches are served from a known daily series.
+        from yfinance.scrapers.history import PriceHistory
+
+        tz = 'America/New_York'
+        rng = _np.random.default_rng(0)
+        index = _pd.bdate_range('2015-01-05', '2021-01-01', tz=tz)
+        close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.01, len(index))))
+        df_1d = _pd.DataFrame({'Open': close * 1.001, 'High': close * 1.01, 'Low': close * 0.99,
+                               'Close': close, 'Adj Close': close, 'Volume': 1000.0,
+                               'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+        df = df_1d.resample('W-MON', label='left', closed='left').agg(
+            {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Adj Close': 'last',
+             'Volume': 'sum', 'Dividends': 'sum', 'Stock Splits': 'sum'})
+        df_bad = df.copy()
+        # Two bad weeks years apart = two repair groups
+        df_bad.iloc[20, df_bad.columns.get_loc('Close')] = -1
+        df_bad.iloc[250, df_bad.columns.get_loc('Open')] = -1
+
+        fetches = []
+        def fetch(start, end, interval, prepost, last_event=None):
+            fetches.append((start, end, interval))
+            df_fine = df_1d.loc[str(start):str(end - _dt.timedelta(days=1))].copy()
+            df_fine['Repaired?'] = False
+            return df_fine
+
+        hist = PriceHistory(None, 'TEST', tz)
+        hist._fetch_fine_prices = fetch
+        repaired = hist._reconstruct_intervals_batch(df_bad, '1wk', False, -1)
+
+        self.assertEqual(2, len(fetches))
+        self.assertTrue(all(f[2] == '1d' for f in fetches))
+        cols = ['Open', 'High', 'Low', 'Close', 'Adj Close']
+        self.assertTrue(_np.isclose(repaired[cols].to_numpy(), df[cols].to_numpy()).all())
+        self.assertEqual(2, repaired['Repaired?'].sum())
+
+        # Overlapping windows are fetched once
+        fetches.clear()
+        d = _dt.date(2020, 1, 6)
+        windows = {0: (d, d + _dt.timedelta(days=10)), 1: (d + _dt.timedelta(days=5), d + _dt.timedelta(days=12)),
+                   2: (d + _dt.timedelta(days=100), d + _dt.timedelta(days=110))}
+        fine = hist._fetch_reconstruct_windows(windows, '1d', False)
+        self.assertEqual(2, len(fetches))
+        self.assertIs(fine[0], fine[1])
+        self.assertIsNot(fine[0], fine[2])
+
+        # Fetch errors aren't printed, without silencing other threads' logging
+        def fetch_fails(start, end, interval, prepost, last_event=None):
+            yf.utils.get_yf_logger().error(f'{interval} fetch failed')
+            other = threading.Thread(target=lambda: yf.utils.get_yf_logger().error('other error'))
+            other.start()
+            other.join()
+            return None
+        hist._fetch_fine_prices = fetch_fails
+        with self.assertLogs('yfinance', level='ERROR') as logs:
+            hist._fetch_reconstruct_windows({0: windows[0]}, '1d', False)
+        self.assertEqual(['ERROR:yfinance:other error'], logs.output)
+
+    def test_repair_supplied_data(self):
+        # Offline: yf.repair() on stored bars, fetcher has no finer data
+        fetches = []
+        def fetch(symbol, start, end, interval, prepost):
+            fetches.append((symbol, interval))
+            return None
+
+        for tkr, currency, tz, suffix in [('AET.L', 'GBp', 'Europe/London', '100x-error'),
+                                          ('DODFX', 'USD', 'America/New_York', 'cg-double-count')]:
+            fp = os.path.join(self.dp, "data", tkr.replace('.', '-') + "-1d-" + suffix + ".csv")
+            df_bad = _pd.read_csv(fp, index_col="Date")
+            df_bad.index = _pd.to_datetime(df_bad.index, utc=True)
+            fp = os.path.join(self.dp, "data", tkr.replace('.', '-') + "-1d-" + suffix + "-fixed.csv")
+            correct_df = _pd.read_csv(fp, index_col="Date")
+            correct_df.index = _pd.to_datetime(correct_df.index, utc=True)
+
+            repaired_df = yf.repair(df_bad, tkr, '1d', currency, tz, fetcher=fetch)
+
+            self.assertIn('Repaired?', repaired_df.columns)
+            self.assertEqual(str(repaired_df.index.tz), tz)
+            correct_df = correct_df.sort_index()
+            self.assertEqual(len(repaired_df), len(correct_df))
+            for c in ["Open", "Low", "High", "Close", "Adj Close"]:
+                self.assertTrue(_np.isclose(repaired_df[c].to_numpy(), correct_df[c].to_numpy(), rtol=5e-6).all())
+        self.assertTrue(all(f[0] in ('AET.L', 'DODFX') for f in fetches))
+
+        with self.assertRaises(ValueError):
+            yf.repair(df_bad, 'DODFX', '1wk', 'USD', 'America/New_York', fetcher=fetch)
+
+    def test_repair_supplied_fetcher(self):
+        # Offline: yf.repair() reconstructs a zeroed daily bar from the fetcher's hourly bars
+        tz = 'America/New_York'
+        rng = _np.random.default_rng(1)
+        days = _pd.bdate_range(end=_pd.Timestamp.now(tz).normalize() - _pd.Timedelta(7, unit="D"), periods=60, tz=tz)
+        close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.01, len(days))))
+        df = _pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+                            'Close': close, 'Adj Close': close, 'Volume': 1e6}, index=days)
+        df_bad = df.copy()
+        n = 40
+        df_bad.iloc[n, :5] = 0.0
+
+        fetches = []
+        def fetch(symbol, start, end, interval, prepost):
+            fetches.append(interval)
+            rows = []
+            for d, c in zip(days, close):
+                if start <= d.date() < end:
+                    for h in range(7):
+                        dt = d + _pd.Timedelta(hours=9, minutes=30) + _pd.Timedelta(hours=h)
+                        rows.append((dt, c, c * 1.01 if h == 3 else c, c * 0.99 if h == 4 else c, c, c, 1e6 / 7))
+            return _pd.DataFrame(rows, columns=['Datetime', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']).set_index('Datetime')
+
+        repaired = yf.repair(df_bad, 'TEST', '1d', 'USD', tz, fetcher=fetch)
+
+        self.assertEqual(['1h'], fetches)
+        self.assertTrue(repaired['Repaired?'].iloc[n])
+        self.assertEqual(1, repaired['Repaired?'].sum())
+        for c in ['Open', 'High', 'Low', 'Close']:
+            self.assertAlmostEqual(df[c].iloc[n], repaired[c].iloc[n], places=4)
+
+    def test_repair_result_cache(self):
+        # Offline: synthetic daily bars, no finer data available
+        tz = 'America/New_York'
+        rng = _np.random.default_rng(0)
+        n = 1000
+        close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.01, n)))
+        df = _pd.DataFrame({'Open': close * 1.001, 'High': close * 1.01, 'Low': close * 0.99,
+                            'Close': close, 'Adj Close': close,
+                            'Volume': rng.integers(100000, 1000000, n).astype(float),
+                            'Dividends': 0.0, 'Stock Splits': 0.0},
+                           index=_pd.bdate_range('2015-01-05', periods=n, tz=tz))
+        df.iloc[995, df.columns.get_loc('Close')] *= 100
+
+        def make_hist():
+            hist = yf.scrapers.history.PriceHistory(None, 'TEST', tz)
+            hist._history_metadata = {'currency': 'USD', 'exchangeTimezoneName': tz, 'regularMarketPrice': _np.nan}
+            hist._fetch_fine_prices = lambda *args: None
+            repaired_lengths = []
+            repair_full = hist._repair_prices_full
+            def counted(df, *args, **kwargs):
+                repaired_lengths.append(len(df))
+                return repair_full(df, *args, **kwargs)
+            hist._repair_prices_full = counted
+            return hist, repaired_lengths
+
+        cache = yf.cache.get_repair_result_cache()
+        cache.clear()
+        original_mode = yf.config.repair.result_cache
+        try:
+            yf.config.repair.result_cache = 'memory'
+            hist, repaired_lengths = make_hist()
+            r1 = hist._repair_prices(df.iloc[:990], '1d', tz, False, 'USD')
+            r1b = hist._repair_prices(df.iloc[:990], '1d', tz, False, 'USD')
+            self.assertEqual(repaired_lengths, [990])  # unchanged data reuses result
+            _pd.testing.assert_frame_equal(r1, r1b)
+
+            # Appended bars only repair the tail
+            r2 = hist._repair_prices(df, '1d', tz, False, 'USD')
+            self.assertEqual(len(repaired_lengths), 2)
+            self.assertLess(repaired_lengths[1], 300)
+
+            yf.config.repair.result_cache = None
+            hist, repaired_lengths = make_hist()
+            ref = hist._repair_prices(df, '1d', tz, False, 'USD')
+            self.assertEqual(repaired_lengths, [n])
+            _pd.testing.assert_frame_equal(r2, ref)
+            self.assertAlmostEqual(r2['Close'].iloc[995], df['Close'].iloc[995] / 100)
+
+            # Older unit switch outside the window: window continues from full-history scan
+            df.iloc[300:310, :5] *= 100
+            yf.config.repair.result_cache = 'memory'
+            hist, repaired_lengths = make_hist()
+            hist._repair_prices(df.iloc[:990], '1d', tz, False, 'USD')
+            state = cache.lookup('TEST', '1d', False, 'USD')[4][100]
+            self.assertEqual(len(state['signals']), 2)
+            r3 = hist._repair_prices(df, '1d', tz, False, 'USD')
+            self.assertLess(repaired_lengths[1], 300)
+            yf.config.repair.result_cache = None
+            hist, repaired_lengths = make_hist()
+            _pd.testing.assert_frame_equal(r3, hist._repair_prices(df, '1d', tz, False, 'USD'))
+            self.assertAlmostEqual(r3['Close'].iloc[305], df['Close'].iloc[305] / 100)
+        finally:
+            yf.config.repair.result_cache = original_mode
+            cache.clear()
+
+    def test_repair_result_cache_split(self):
+        # Offline: synthetic 15m bars, new unit switch in appended bars after an older split
+        tz = 'America/New_York'
+        rng = _np.random.default_rng(0)
+        days = _pd.bdate_range('2024-01-08', periods=160, tz=tz)
+        index = _pd.DatetimeIndex([d + _pd.Timedelta(hours=9, minutes=30+15*k) for d in days for k in range(26)])
+        n = len(index)
+        close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.002, n)))
+        df_switch = _pd.DataFrame({'Open': close * 1.0005, 'High': close * 1.002, 'Low': close * 0.998,
+                                   'Close': close, 'Adj Close': close,
+                                   'Volume': rng.integers(10000, 100000, n).astype(float),
+                                   'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+        df_switch.iloc[n-60:n-35, :5] *= 100
+
+        def repair(df, result_cache):
+            yf.config.repair.result_cache = result_cache
+            hist = yf.scrapers.history.PriceHistory(None, 'TEST', tz)
+            hist._history_metadata = {'currency': 'USD', 'exchangeTimezoneName': tz, 'regularMarketPrice': _np.nan}
+            hist._fetch_fine_prices = lambda *args, **kwargs: None
+            repaired_lengths = []
+            repair_full = hist._repair_prices_full
+            def counted(df, *args, **kwargs):
+                repaired_lengths.append(len(df))
+                return repair_full(df, *args, **kwargs)
+            hist._repair_prices_full = counted
+            if result_cache is not None:
+                hist._repair_prices(df.iloc[:n-70], '15m', tz, False, 'USD')
+            return hist._repair_prices(df, '15m', tz, False, 'USD'), repaired_lengths
+
+        cache = yf.cache.get_repair_result_cache()
+        original_mode = yf.config.repair.result_cache
+        try:
+            # Split just before the incremental window is too near the switch,
+            # so must repair full history. Far older split doesn't matter.
+            for split_row, expect_full, expect_repaired in [(n-70-260, True, False), (5*26, False, True)]:
+                df = df_switch.copy()
+                df.iloc[split_row, df.columns.get_loc('Stock Splits')] = 2.0
+                cache.clear()
+                r, repaired_lengths = repair(df, 'memory')
+                self.assertEqual(len(repaired_lengths), 3 if expect_full else 2)
+                self.assertLess(repaired_lengths[1], 400)
+                ref, _ = repair(df, None)
+                _pd.testing.assert_frame_equal(r, ref)
+                self.assertEqual(expect_repaired, bool(r['Repaired?'].iloc[n-50]))
+        finally:
+            yf.config.repair.result_cache = original_mode
+            cache.clear()
+
+    def test_repair_result_cache_inputs(self):
+        # Offline: recent daily bars quoted in pence
+        tz = 'Europe/London'
+        n = 300
+        close = _np.linspace(100, 130, n)
+        df = _pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+                            'Close': close, 'Adj Close': close, 'Volume': 1e6,
+                            'Dividends': 0.0, 'Stock Splits': 0.0},
+                           index=_pd.bdate_range(end=_pd.Timestamp.now(tz).normalize(), periods=n, tz=tz))
+
+        def repair(regular_market_price, skip=False):
+            hist = yf.scrapers.history.PriceHistory(None, 'TEST.L', tz)
+            hist._history_metadata = {'currency': 'GBp', 'exchangeTimezoneName': tz, 'regularMarketPrice': regular_market_price}
+            hist._fetch_fine_prices = lambda *args: None
+            hist._repair_result_cache_skip = skip
+            repaired_lengths = []
+            repair_full = hist._repair_prices_full
+            def counted(df, *args, **kwargs):
+                repaired_lengths.append(len(df))
+                return repair_full(df, *args, **kwargs)
+            hist._repair_prices_full = counted
+            hist._repair_prices(df, '1d', tz, False, 'GBp')
+            return repaired_lengths
+
+        cache = yf.cache.get_repair_result_cache()
+        cache.clear()
+        original_mode = yf.config.repair.result_cache
+        try:
+            yf.config.repair.result_cache = 'memory'
+            # Reconstruction fetchers don't use the cache
+            repair(close[-1], skip=True)
+            self.assertEqual(0, len(cache._entries))
+
+            self.assertEqual(repair(close[-1]), [n])
+            self.assertEqual(repair(close[-1]), [])
+            # Same data but live price says it's in pounds: currency handling differs, so repair again
+            self.assertEqual(repair(close[-1] * 100), [n])
+        finally:
+            yf.config.repair.result_cache = original_mode
+            cache.clear()
+
+    def test_repair_100x_random_keeps_order(self):
+        # Offline: synthetic daily bars in reverse order, no finer data available
+        tz = 'America/New_York'
+        rng = _np.random.default_rng(0)
+        index = _pd.bdate_range('2020-01-06', periods=30, tz=tz)
+        close = 50 * _np.exp(_np.cumsum(rng.normal(0, 0.01, len(index))))
+        df = _pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+                            'Close': close, 'Adj Close': close, 'Volume': 1e6}, index=index)
+        df_bad = df.copy()
+        df_bad.iloc[10, :5] *= 100
+        df_bad.iloc[20, :5] = 0.0
+        df_bad = df_bad.iloc[::-1]
+
+        hist = yf.scrapers.history.PriceHistory(None, 'TEST', tz)
+        hist._history_metadata = {'currency': 'USD', 'exchangeTimezoneName': tz, 'regularMarketPrice': _np.nan}
+        hist._fetch_fine_prices = lambda *args, **kwargs: None
+        df_repaired = hist._fix_unit_random_mixups(df_bad, '1d', tz, prepost=False)
+
+        self.assertTrue(df_repaired.index.equals(df_bad.index))
+        self.assertTrue(_np.isclose(df_repaired['Close'].loc[index[10]], df['Close'].iloc[10]))
+        self.assertEqual(0.0, df_repaired['Close'].loc[index[20]])
+
     def test_repair_100x_random_weekly(self):
         # Setup:
         tkr = "PNL.L"
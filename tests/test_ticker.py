@@ -801,6 +801,87 @@ class TestTickerMiscFinancials(unittest.TestCase):
         self.assertFalse(data.fundamentals_use_chunked,
             "flag must revert when chunked fallback also fails")
 
+    def test_chunked_fallback_partial_failure(self):
+        """Chunks are fetched concurrently; a failed chunk loses only its own
+        keys, which are reported, and the rest arrive in order."""
+        from unittest.mock import patch, MagicMock
+        import threading
+        import curl_cffi.requests.exceptions
+        import json as _json
+        from yfinance import const
+        keys = const.fundamentals_keys["balance-sheet"]
+        failed_keys = keys[60:120]
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+
+        def fake_cache_get(url=None, **kwargs):
+            type_keys = url.split("&type=")[1].split("&")[0].split(",")
+            if len(type_keys) > 60 or type_keys[0] == "annual" + failed_keys[0]:
+                raise curl_cffi.requests.exceptions.Timeout("Operation timed out", 28, None)
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            threading.Event().wait(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            result = [{
+                "meta": {"symbol": ["MSFT"], "type": [kf]},
+                "timestamp": [1719705600],
+                kf: [{"asOfDate": "2024-06-30", "reportedValue": {"raw": 1.0}}],
+            } for kf in type_keys]
+            resp = MagicMock()
+            resp.text = _json.dumps({"timeseries": {"result": result}})
+            return resp
+
+        ticker = yf.Ticker("MSFT", session=self.session)
+        data = ticker._fundamentals.financials._data
+        data.fundamentals_use_chunked = False
+        with patch.object(data, "cache_get", side_effect=fake_cache_get), \
+                self.assertLogs("yfinance", level="ERROR") as logs:
+            df = ticker.get_balance_sheet()
+
+        self.assertListEqual(list(df.index), [k for k in keys if k not in failed_keys])
+        self.assertIn(failed_keys[0], "\n".join(logs.output))
+        self.assertGreater(in_flight["max"], 1, "chunks should be fetched concurrently")
+        self.assertTrue(data.fundamentals_use_chunked)
+
+    def test_prefetch_fundamentals(self):
+        """One combined fetch fills the statement and valuation caches."""
+        from unittest.mock import patch, MagicMock
+        import json as _json
+
+        def fake_cache_get(url=None, **kwargs):
+            type_part = url.split("&type=")[1].split("&")[0]
+            result = []
+            for kf in type_part.split(","):
+                result.append({
+                    "meta": {"symbol": ["MSFT"], "type": [kf]},
+                    "timestamp": [1719705600],
+                    kf: [{"asOfDate": "2024-06-30", "reportedValue": {"raw": 1.0}}],
+                })
+            resp = MagicMock()
+            resp.text = _json.dumps({"timeseries": {"result": result}})
+            return resp
+
+        ticker = yf.Ticker("MSFT", session=self.session)
+        data = ticker._fundamentals.financials._data
+        data.fundamentals_use_chunked = False
+        with patch.object(data, "cache_get", side_effect=fake_cache_get) as mock:
+            ticker.prefetch_fundamentals(freq="quarterly")
+            n_requests = mock.call_count
+            income = ticker.get_income_stmt(freq="quarterly")
+            balance_sheet = ticker.get_balance_sheet(freq="quarterly")
+            cash_flow = ticker.get_cash_flow(freq="quarterly")
+            valuation = ticker.get_valuation_measures(freq="quarterly")
+            self.assertEqual(mock.call_count, n_requests, "getters should be served from cache")
+        self.assertLess(n_requests, 4)
+
+        self.assertIn("TotalRevenue", income.index)
+        self.assertIn("TotalAssets", balance_sheet.index)
+        self.assertIn("FreeCashFlow", cash_flow.index)
+        self.assertEqual(valuation.loc["Market Cap", "Current"], 1.0)
+        self.assertEqual(valuation.loc["Market Cap", "6/30/2024"], 1.0)
+
     def test_balance_sheet(self):
         expected_keys = ["Total Assets", "Net PPE"]
         expected_periods_days = 365
@@ -1504,6 +1585,150 @@ class TestTickerFundsData(unittest.TestCase):
             sector_weightings = ticker.funds_data.sector_weightings
             self.assertIsInstance(sector_weightings, dict)
 
+class TestTickerPrefetch(unittest.TestCase):
+    _MODULES = {
+        "institutionOwnership": {"ownershipList": [
+            {"maxAge": 1, "reportDate": {"raw": 1719705600}, "organization": "Vanguard",
+             "pctHeld": {"raw": 0.09}, "position": {"raw": 100}, "value": {"raw": 1000}, "pctChange": {"raw": 0.01}}]},
+        "recommendationTrend": {"trend": [{"period": "0m", "strongBuy": 1, "buy": 2, "hold": 3, "sell": 0, "strongSell": 0}]},
+        "calendarEvents": {"earnings": {"earningsDate": [1780000000]}},
+    }
+
+    def _fake_get_raw_json(self, url, params=None, **kwargs):
+        self.requested.append(params["modules"].split(","))
+        result = {m: json.loads(json.dumps(self._MODULES[m])) for m in params["modules"].split(",") if m in self._MODULES}
+        return {"quoteSummary": {"result": [result], "error": None}}
+
+    def setUp(self):
+        self.requested = []
+
+    def test_prefetch(self):
+        with patch("yfinance.data.YfData.get_raw_json", side_effect=self._fake_get_raw_json):
+            ticker = yf.Ticker("AAPL")
+            ticker.prefetch()
+            self.assertEqual(len(self.requested), 1)
+
+            holders = ticker.institutional_holders
+            recommendations = ticker.recommendations
+            calendar = ticker.calendar
+            self.assertEqual(len(self.requested), 1, "scrapers should reuse prefetched modules")
+            # Modules not prefetched are fetched on demand
+            ticker._quote._fetch(["calendarEvents", "secFilings"])
+            self.assertEqual(self.requested[1:], [["secFilings"]])
+
+        self.assertEqual(holders["Holder"].iloc[0], "Vanguard")
+        self.assertEqual(recommendations["hold"].iloc[0], 3)
+        self.assertEqual(len(calendar["Earnings Date"]), 1)
+
+    def test_prefetch_invalid_module(self):
+        with self.assertRaises(ValueError):
+            yf.Ticker("AAPL").prefetch(["notAModule"])
+
+    def test_coalesce_window(self):
+        import threading
+        original = YfConfig.network.coalesce_window
+        YfConfig.network.coalesce_window = 0.2
+        try:
+            with patch("yfinance.data.YfData.get_raw_json", side_effect=self._fake_get_raw_json):
+                ticker = yf.Ticker("AAPL")
+                threads = [threading.Thread(target=lambda: ticker.recommendations),
+                           threading.Thread(target=lambda: ticker.calendar)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                self.assertEqual(len(ticker.recommendations), 1)
+        finally:
+            YfConfig.network.coalesce_window = original
+        self.assertEqual(len(self.requested), 1)
+        self.assertCountEqual(self.requested[0], ["recommendationTrend", "calendarEvents"])
+
+
+class TestFastInfoRequests(unittest.TestCase):
+    def _fake_history(self, price_history, period="1mo", interval="1d", **kwargs):
+        self.requested.append((period, interval))
+        now = int(pd.Timestamp.now('UTC').timestamp())
+        price_history._history_metadata = {
+            "currency": "USD", "instrumentType": "EQUITY", "exchangeName": "NMS",
+            "exchangeTimezoneName": "America/New_York", "regularMarketPrice": 9.0,
+            "currentTradingPeriod": {m: {"start": now, "end": now + 3600, "timezone": "EST", "gmtoffset": -18000}
+                                     for m in ["pre", "regular", "post"]}}
+        price_history._history_metadata_formatted = False
+        n = 250 if period == "1y" else 5
+        end = pd.Timestamp.now('America/New_York').normalize() - pd.Timedelta(3, unit="D")
+        idx = pd.date_range(end=end, periods=n, freq="D")
+        close = [float(i) for i in range(250 - n, 250)]
+        return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close,
+                             "Volume": [100] * n}, index=idx)
+
+    def setUp(self):
+        self.requested = []
+
+    def test_session_fields_skip_1y(self):
+        with patch("yfinance.scrapers.history.PriceHistory.history", autospec=True, side_effect=self._fake_history):
+            ticker = yf.Ticker("AAPL")
+            ticker._tz = "America/New_York"
+            fi = ticker.fast_info
+            self.assertEqual(fi.last_price, 249.0)
+            self.assertEqual(fi.regular_market_previous_close, 248.0)
+            self.assertEqual(fi.open, 249.0)
+            self.assertEqual(fi.day_high, 249.0)
+            self.assertEqual(fi.last_volume, 100)
+            self.assertEqual(fi.currency, "USD")
+            self.assertEqual(fi.quote_type, "EQUITY")
+            self.assertEqual(fi.exchange, "NMS")
+            self.assertEqual(self.requested, [("5d", "1d")])
+
+            # Only the yearly fields need the 1y download, then it is reused
+            self.assertEqual(fi.year_high, 249.0)
+            self.assertEqual(fi.fifty_day_average, sum(range(200, 250)) / 50)
+            self.assertEqual(fi.day_low, 249.0)
+            self.assertEqual(self.requested, [("5d", "1d"), ("1y", "1d")])
+
+
+class TestTickerOptionChains(unittest.TestCase):
+    _EXPIRATIONS = [1767225600, 1767830400, 1768435200]  # 2026-01-01, -08, -15
+
+    def _fake_get(self, url, **kwargs):
+        date = int(url.split("date=")[1]) if "date=" in url else None
+        self.requested.append(date)
+        expiration = date or self._EXPIRATIONS[0]
+
+        def contract(kind, strike):
+            return {"contractSymbol": f"X{expiration}{kind}{strike}", "strike": float(strike),
+                    "lastPrice": 1.0, "lastTradeDate": 1767000000}
+        response = MagicMock()
+        response.json.return_value = {"optionChain": {"result": [{
+            "expirationDates": self._EXPIRATIONS, "quote": {"symbol": "SPY"},
+            "options": [{"expirationDate": expiration,
+                         "calls": [contract("C", 100), contract("C", 110)],
+                         "puts": [contract("P", 100)]}]}]}}
+        return response
+
+    def setUp(self):
+        self.requested = []
+
+    def test_option_chains(self):
+        with patch("yfinance.data.YfData.get", side_effect=self._fake_get):
+            df = yf.Ticker("SPY").option_chains(max_workers=2)
+
+        # The expirations listing doubles as the nearest chain
+        self.assertEqual(self.requested[0], None)
+        self.assertCountEqual(self.requested[1:], self._EXPIRATIONS[1:])
+        self.assertEqual(df["expiration"].unique().tolist(), ["2026-01-01", "2026-01-08", "2026-01-15"])
+        self.assertEqual(len(df), 9)
+        self.assertEqual(df["type"].tolist()[:3], ["call", "call", "put"])
+        self.assertEqual(list(df.columns[:4]), ["expiration", "type", "contractSymbol", "lastTradeDate"])
+
+    def test_option_chains_dates(self):
+        with patch("yfinance.data.YfData.get", side_effect=self._fake_get):
+            ticker = yf.Ticker("SPY")
+            df = ticker.option_chains("2026-01-15")
+            self.assertEqual(df["expiration"].unique().tolist(), ["2026-01-15"])
+            with self.assertRaises(ValueError):
+                ticker.option_chains(["2026-01-15", "2030-01-01"])
+
+
 class TestTickerValuationMeasures(unittest.TestCase):
 
     # Valuation measures now come from the fundamentals-timeseries API instead
@@ -1813,6 +2038,9 @@ def suite():
     suite.addTest(TestTickerFundsData('Test Funds Data'))
     suite.addTest(TestTickerValuationMeasures('Test valuation measures'))
     suite.addTest(TestTickerValuationMeasuresPeriods('Test valuation measures periods'))
+    suite.addTest(TestTickerPrefetch('Test prefetch'))
+    suite.addTest(TestFastInfoRequests('Test fast_info requests'))
+    suite.addTest(TestTickerOptionChains('Test option chains'))
     return suite
 
 
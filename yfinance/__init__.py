@@ -25,8 +25,9 @@ from .lookup import Lookup
 from .ticker import Ticker
 from .calendars import Calendars
 from .tickers import Tickers
-from .multi import download
-from .live import WebSocket, AsyncWebSocket
+from .multi import download, download_financials
+from .price_repair import repair
+from .live import WebSocket, AsyncWebSocket, LiveQuoteBook
 from .utils import enable_debug_mode
 from .cache import set_tz_cache_location
 from .domain.sector import Sector
@@ -44,8 +45,8 @@ __author__ = "Ran Aroussi"
 import warnings
 warnings.filterwarnings('default', category=DeprecationWarning, module='^yfinance')
 
-__all__ = ['download', 'Market', 'MarketRegion', 'Search', 'Lookup', 'Ticker', 'Tickers', 'enable_debug_mode', 'set_tz_cache_location',
-           'Sector', 'Industry', 'WebSocket', 'AsyncWebSocket', 'Calendars', 'Auth']
+__all__ = ['download', 'download_financials', 'repair', 'Market', 'MarketRegion', 'Search', 'Lookup', 'Ticker', 'Tickers', 'enable_debug_mode', 'set_tz_cache_location',
+           'Sector', 'Industry', 'WebSocket', 'AsyncWebSocket', 'LiveQuoteBook', 'Calendars', 'Auth']
 # screener stuff:
 __all__ += ['EquityQuery', 'FundQuery', 'ETFQuery', 'screen', 'PREDEFINED_SCREENER_QUERIES']
 
@@ -13,8 +13,10 @@ the preferred backend and the default install dependency.
 """
 import functools
 import os
+import weakref
 
 from . import utils
+from .config import YfConfig
 
 _DISABLE = os.environ.get("YF_DISABLE_CURL_CFFI", "").lower() in ("1", "true", "yes")
 
@@ -42,6 +44,10 @@ _FALLBACK_USER_AGENT = (
 
 _fallback_warned = False
 
+# requests sessions created by new_session() -> connection pool size.
+# Only these are resized, a user's session is left as they configured it.
+_pool_sizes = weakref.WeakKeyDictionary()
+
 
 def _warn_once_on_fallback():
     global _fallback_warned
@@ -56,9 +62,23 @@ def _warn_once_on_fallback():
 
 
 def new_session():
-    """Create a default Session for the active backend."""
+    """Create a default Session for the active backend, tuned by ``yf.config.network``."""
+    cfg = YfConfig.network
     if HAS_CURL_CFFI:
-        return _backend.Session(impersonate="chrome")
+        from curl_cffi import CurlOpt
+        # Sync curl_cffi sessions give each thread its own handle and connection cache
+        curl_options = {
+            CurlOpt.MAXCONNECTS: cfg.pool_maxsize,
+            CurlOpt.DNS_CACHE_TIMEOUT: cfg.dns_cache_timeout,
+        }
+        if cfg.keepalive:
+            curl_options[CurlOpt.TCP_KEEPALIVE] = 1
+        else:
+            curl_options[CurlOpt.FORBID_REUSE] = 1
+        kwargs = {}
+        if cfg.http2 is not None:
+            kwargs['http_version'] = 'v2tls' if cfg.http2 else 'v1'
+        return _backend.Session(impersonate="chrome", curl_options=curl_options, **kwargs)
     _warn_once_on_fallback()
     s = _backend.Session()
     s.headers.update({
@@ -66,9 +86,31 @@ def new_session():
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
     })
+    if not cfg.keepalive:
+        s.headers["Connection"] = "close"
+    _mount_pool(s, cfg.pool_maxsize)
     return s
 
 
+def _mount_pool(session, size):
+    from requests.adapters import HTTPAdapter
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, HTTPAdapter(pool_maxsize=size))
+    _pool_sizes[session] = size
+
+
+def size_pool(session, size):
+    """Keep at least ``size`` connections per host open, e.g. one per download thread.
+
+    Only ``requests`` sessions share one pool between threads, ``curl_cffi``
+    gives each thread its own connection so needs no resizing. Sessions
+    not created by yfinance are left alone.
+    """
+    current = _pool_sizes.get(session)
+    if current is not None and current < size:
+        _mount_pool(session, size)
+
+
 def cookie_jar(session):
     """Return the underlying ``http.cookiejar.CookieJar`` for either backend.
 
@@ -39,7 +39,7 @@ from .live import WebSocket
 from .scrapers.analysis import Analysis
 from .scrapers.fundamentals import Fundamentals
 from .scrapers.holders import Holders
-from .scrapers.quote import Quote, FastInfo
+from .scrapers.quote import Quote, FastInfo, QuoteSummary
 from .scrapers.history import PriceHistory
 from .scrapers.funds import FundsData
 
@@ -113,9 +113,10 @@ class TickerBase:
 
         # self._price_history = PriceHistory(self._data, self.ticker)
         self._price_history = None  # lazy-load
-        self._analysis = Analysis(self._data, self.ticker)
-        self._holders = Holders(self._data, self.ticker)
-        self._quote = Quote(self._data, self.ticker)
+        self._quote_summary = QuoteSummary(self._data, self.ticker)
+        self._analysis = Analysis(self._data, self.ticker, self._quote_summary)
+        self._holders = Holders(self._data, self.ticker, self._quote_summary)
+        self._quote = Quote(self._data, self.ticker, self._quote_summary)
         self._fundamentals = Fundamentals(self._data, self.ticker)
         self._funds_data = None
 
@@ -278,6 +279,34 @@ class TickerBase:
                 return data.to_dict()
             return data
 
+    def prefetch(self, modules=None):
+        """
+        Fetch several quoteSummary modules in one request, to be reused by
+        info, holders, analysis, calendar, recommendations etc.
+
+        :Parameters:
+            modules: list
+                quoteSummary modules, see Quote.valid_modules().
+                Default is modules of info, holders, analysis, calendar,
+                recommendations, upgrades_downgrades and sustainability
+        """
+        if modules is None:
+            modules = Quote._INFO_MODULES + Holders._MODULES + [
+                'calendarEvents', 'recommendationTrend', 'upgradeDowngradeHistory', 'esgScores',
+                'earningsTrend', 'earningsHistory', 'industryTrend', 'sectorTrend', 'indexTrend']
+        else:
+            invalid = [m for m in modules if m not in Quote.valid_modules()]
+            if invalid:
+                raise ValueError(f"Invalid modules {invalid}, see available modules using `Quote.valid_modules()`")
+        try:
+            self._quote_summary.prefetch(list(modules))
+        except YFRateLimitError:
+            raise
+        except Exception as e:
+            if not YfConfig.debug.hide_exceptions:
+                raise
+            utils.get_yf_logger().error(f"{self.ticker}: Failed to prefetch {modules}: {e}")
+
     def get_info(self) -> dict:
         data = self._quote.info
         return data
@@ -393,7 +422,7 @@ class TickerBase:
             return dict_data
         return data
 
-    def get_income_stmt(self, as_dict=False, pretty=False, freq="yearly"):
+    def get_income_stmt(self, as_dict=False, pretty=False, freq="yearly", as_of=None):
         """
         :Parameters:
             as_dict: bool
@@ -405,9 +434,17 @@ class TickerBase:
             freq: str
                 "yearly" or "quarterly" or "trailing"
                 Default is "yearly"
+            as_of: date
+                Return the statement as stored on this date by
+                yf.config.cache.fundamentals, for point-in-time analysis.
+                No request is made.
+                Default is None = latest
         """
 
-        data = self._fundamentals.financials.get_income_time_series(freq=freq)
+        if as_of is not None:
+            data = self._fundamentals.financials.get_stored_time_series("income", freq, as_of)
+        else:
+            data = self._fundamentals.financials.get_income_time_series(freq=freq)
 
         if pretty:
             data = data.copy()
@@ -416,13 +453,31 @@ class TickerBase:
             return data.to_dict()
         return data
 
+    def prefetch_fundamentals(self, freq="yearly"):
+        """
+        Fetch income statement, balance sheet, cash flow and valuation measures
+        together, in as few requests as possible. Later calls to
+        get_income_stmt(), get_balance_sheet(), get_cash_flow() and
+        get_valuation_measures() with the same `freq` are then served from memory.
+
+        :Parameters:
+            freq: str
+                "yearly" or "quarterly" or "trailing"
+                Default is "yearly"
+        """
+        quote = self._quote
+        valuation_types = [] if freq in quote._valuation_measures else quote._valuation_types(freq)
+        result = self._fundamentals.financials._fetch_all(freq, valuation_types)
+        if valuation_types:
+            quote._valuation_measures[freq] = pd.DataFrame() if result is None else quote._parse_valuation_measures(result, freq)
+
     def get_incomestmt(self, as_dict=False, pretty=False, freq="yearly"):
         return self.get_income_stmt(as_dict, pretty, freq)
 
     def get_financials(self, as_dict=False, pretty=False, freq="yearly"):
         return self.get_income_stmt(as_dict, pretty, freq)
 
-    def get_balance_sheet(self, as_dict=False, pretty=False, freq="yearly"):
+    def get_balance_sheet(self, as_dict=False, pretty=False, freq="yearly", as_of=None):
         """
         :Parameters:
             as_dict: bool
@@ -434,10 +489,18 @@ class TickerBase:
             freq: str
                 "yearly" or "quarterly"
                 Default is "yearly"
+            as_of: date
+                Return the statement as stored on this date by
+                yf.config.cache.fundamentals, for point-in-time analysis.
+                No request is made.
+                Default is None = latest
         """
 
 
-        data = self._fundamentals.financials.get_balance_sheet_time_series(freq=freq)
+        if as_of is not None:
+            data = self._fundamentals.financials.get_stored_time_series("balance-sheet", freq, as_of)
+        else:
+            data = self._fundamentals.financials.get_balance_sheet_time_series(freq=freq)
 
         if pretty:
             data = data.copy()
@@ -449,7 +512,7 @@ class TickerBase:
     def get_balancesheet(self, as_dict=False, pretty=False, freq="yearly"):
         return self.get_balance_sheet(as_dict, pretty, freq)
 
-    def get_cash_flow(self, as_dict=False, pretty=False, freq="yearly") -> Union[pd.DataFrame, dict]:
+    def get_cash_flow(self, as_dict=False, pretty=False, freq="yearly", as_of=None) -> Union[pd.DataFrame, dict]:
         """
         :Parameters:
             as_dict: bool
@@ -461,10 +524,18 @@ class TickerBase:
             freq: str
                 "yearly" or "quarterly"
                 Default is "yearly"
+            as_of: date
+                Return the statement as stored on this date by
+                yf.config.cache.fundamentals, for point-in-time analysis.
+                No request is made.
+                Default is None = latest
         """
 
 
-        data = self._fundamentals.financials.get_cash_flow_time_series(freq=freq)
+        if as_of is not None:
+            data = self._fundamentals.financials.get_stored_time_series("cash-flow", freq, as_of)
+        else:
+            data = self._fundamentals.financials.get_cash_flow_time_series(freq=freq)
 
         if pretty:
             data = data.copy()
@@ -816,7 +887,7 @@ class TickerBase:
 
     def get_funds_data(self) -> Optional[FundsData]:
         if not self._funds_data:
-            self._funds_data = FundsData(self._data, self.ticker)
+            self._funds_data = FundsData(self._data, self.ticker, self._quote_summary)
         
         return self._funds_data
 
@@ -1,11 +1,17 @@
 import peewee as _peewee
+from collections import OrderedDict
 from threading import Lock
 import os as _os
 import platformdirs as _ad
 import atexit as _atexit
 import datetime as _dt
+import hashlib as _hashlib
 import pickle as _pkl
+import random as _random
+import time as _time
+import pandas as _pd
 
+from .config import YfConfig
 from .utils import get_yf_logger
 
 _cache_init_lock = Lock()
@@ -13,45 +19,156 @@ _cache_init_lock = Lock()
 
 
 # --------------
-# TimeZone cache
+# Shared
 # --------------
 
-class _TzCacheException(Exception):
+class _CacheLockedError(Exception):
     pass
 
 
-class _TzCacheDummy:
-    """Dummy cache to use if tz cache is disabled"""
+class _CacheStats:
+    """Counters of one cache, to judge its hit rate and SQLite lock contention"""
 
-    def lookup(self, tkr):
-        return None
+    _fields = ('lookups', 'memory_hits', 'db_hits', 'misses', 'writes',
+               'retries', 'lock_failures', 'db_seconds', 'backend_errors')
 
-    def store(self, tkr, tz):
-        pass
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
 
-    @property
-    def tz_db(self):
-        return None
+    def add(self, **counts):
+        with self._lock:
+            for k, v in counts.items():
+                self._counts[k] += v
 
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self._fields, 0)
+            self._counts['db_seconds'] = 0.0
 
-class _TzCacheManager:
-    _tz_cache = None
+    def as_dict(self):
+        with self._lock:
+            return dict(self._counts)
 
-    @classmethod
-    def get_tz_cache(cls):
-        if cls._tz_cache is None:
-            with _cache_init_lock:
-                cls._initialise()
-        return cls._tz_cache
 
-    @classmethod
-    def _initialise(cls, cache_dir=None):
-        cls._tz_cache = _TzCache()
+_cache_stats = {}
+_cache_stats_lock = Lock()  # separate from _cache_init_lock, which is held while caches construct
+
+
+def _get_stats(name):
+    with _cache_stats_lock:
+        if name not in _cache_stats:
+            _cache_stats[name] = _CacheStats()
+        return _cache_stats[name]
+
+
+def _db_call(stats, fn):
+    """
+    Run fn() against SQLite. If another process holds the lock, SQLite
+    waits up to yf.config.cache.busy_timeout, then retry with backoff.
+    Raises _CacheLockedError if still locked.
+    """
+    retries = YfConfig.cache.lock_retries
+    t0 = _time.perf_counter()
+    try:
+        for attempt in range(retries + 1):
+            try:
+                return fn()
+            except _peewee.OperationalError as e:
+                msg = str(e)
+                if 'locked' not in msg and 'busy' not in msg:
+                    raise
+                if attempt == retries:
+                    stats.add(lock_failures=1)
+                    raise _CacheLockedError(msg) from e
+                stats.add(retries=1)
+                _time.sleep(0.05 * 2**attempt * _random.uniform(0.5, 1.5))
+    finally:
+        stats.add(db_seconds=_time.perf_counter() - t0)
 
 
-class _TzDBManager:
+# --------------
+# Remote backend
+# --------------
+
+class MemoryCacheBackend:
+    """
+    In-process cache backend with the same interface as a Redis client.
+    Useful for tests, or as template for another store.
+    """
+
+    def __init__(self):
+        self._data = {}  # key -> (value, expiry time or None)
+        self._lock = Lock()
+
+    def _get(self, key):
+        # Caller holds self._lock
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if expiry is not None and expiry <= _time.time():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, name):
+        with self._lock:
+            return self._get(name)
+
+    def mget(self, keys, *args):
+        keys = list(keys) + list(args) if args else list(keys)
+        with self._lock:
+            return [self._get(k) for k in keys]
+
+    def set(self, name, value, ex=None):
+        if isinstance(value, str):
+            value = value.encode()
+        expiry = None if ex is None else _time.time() + ex
+        with self._lock:
+            self._data[name] = (bytes(value), expiry)
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._data.pop(n, None) is not None for n in names)
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+        return True
+
+
+_cache_backend = None
+_cache_backend_prefix = 'yfinance:'
+
+
+def _backend_call(stats, fn):
+    """
+    Run fn() against the remote cache backend.
+    Raises _CacheLockedError if the backend fails, so caches carry on without it.
+    """
+    t0 = _time.perf_counter()
+    try:
+        return fn()
+    except Exception as e:
+        stats.add(backend_errors=1)
+        get_yf_logger().debug(f"Cache backend failed: {e}")
+        raise _CacheLockedError(str(e)) from e
+    finally:
+        stats.add(db_seconds=_time.perf_counter() - t0)
+
+
+class _DBManager:
+    """
+    One SQLite file in the cache folder.
+    Subclasses set _filename, _exception and _name.
+    """
     _db = None
     _cache_dir = _os.path.join(_ad.user_cache_dir(), "py-yfinance")
+    _filename = None
+    _exception = Exception
+    _name = None
 
     @classmethod
     def get_database(cls):
@@ -78,19 +195,16 @@ class _TzDBManager:
             try:
                 _os.makedirs(cls._cache_dir)
             except OSError as err:
-                raise _TzCacheException(f"Error creating TzCache folder: '{cls._cache_dir}' reason: {err}")
+                raise cls._exception(f"Error creating {cls._name} folder: '{cls._cache_dir}' reason: {err}")
         elif not (_os.access(cls._cache_dir, _os.R_OK) and _os.access(cls._cache_dir, _os.W_OK)):
-            raise _TzCacheException(f"Cannot read and write in TzCache folder: '{cls._cache_dir}'")
+            raise cls._exception(f"Cannot read and write in {cls._name} folder: '{cls._cache_dir}'")
 
         cls._db = _peewee.SqliteDatabase(
-            _os.path.join(cls._cache_dir, 'tkr-tz.db'),
-            pragmas={'journal_mode': 'wal', 'cache_size': -64}
+            _os.path.join(cls._cache_dir, cls._filename),
+            timeout=YfConfig.cache.busy_timeout,
+            pragmas={'journal_mode': 'wal', 'cache_size': -64, 'synchronous': 'normal'}
         )
 
-        old_cache_file_path = _os.path.join(cls._cache_dir, "tkr-tz.csv")
-        if _os.path.isfile(old_cache_file_path):
-            _os.remove(old_cache_file_path)
-
     @classmethod
     def set_location(cls, new_cache_dir):
         if cls._db is not None:
@@ -102,35 +216,38 @@ class _TzDBManager:
     def get_location(cls):
         return cls._cache_dir
 
-# close DB when Python exists
-_atexit.register(_TzDBManager.close_db)
-
 
-tz_db_proxy = _peewee.Proxy()
-class _TZ_KV(_peewee.Model):
-    key = _peewee.CharField(primary_key=True)
-    value = _peewee.CharField(null=True)
-    
-    class Meta:
-        database = tz_db_proxy
-        without_rowid = True
+class _DBCache:
+    """
+    Cache kept in one SQLite file of the cache folder. Creates its tables
+    on first use. If the folder can't be used, the cache is a dummy.
+    Subclasses set _db_manager, _exception, _proxy and _name, and return
+    their models from _tables().
+    """
 
+    _db_manager = None
+    _exception = None
+    _proxy = None
+    _name = None
 
-class _TzCache:
     def __init__(self):
         self.initialised = -1
         self.db = None
         self.dummy = False
+        self.stats = _get_stats(self._name)
+
+    def _tables(self):
+        raise NotImplementedError
 
     def get_db(self):
         if self.db is not None:
             return self.db
 
         try:
-            self.db = _TzDBManager.get_database()
-        except _TzCacheException as err:
-            get_yf_logger().info(f"Failed to create TzCache, reason: {err}. "
-                                 "TzCache will not be used. "
+            self.db = self._db_manager.get_database()
+        except self._exception as err:
+            get_yf_logger().info(f"Failed to create {self._name}, reason: {err}. "
+                                 f"{self._name} will not be used. "
                                  "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'")
             self.dummy = True
             return None
@@ -145,61 +262,303 @@ class _TzCache:
             self.initialised = 0  # failure
             return
 
-        db.connect()
-        tz_db_proxy.initialize(db)
+        tables = self._tables()
+
+        def create():
+            db.connect(reuse_if_open=True)
+            self._proxy.initialize(db)
+            try:
+                db.create_tables(tables)
+            except _peewee.OperationalError as e:
+                if 'WITHOUT' in str(e):
+                    for model in tables:
+                        model._meta.without_rowid = False
+                    db.create_tables(tables)
+                else:
+                    raise
         try:
-            db.create_tables([_TZ_KV])
-        except _peewee.OperationalError as e:
-            if 'WITHOUT' in str(e):
-                _TZ_KV._meta.without_rowid = False
-                db.create_tables([_TZ_KV])
-            else:
-                raise
+            _db_call(self.stats, create)
+        except _CacheLockedError:
+            # Other processes busy, try again next time
+            return
         self.initialised = 1  # success
 
-    def lookup(self, key):
+    def _ready(self):
         if self.dummy:
-            return None
+            return False
 
         if self.initialised == -1:
             self.initialise()
 
-        if self.initialised == 0:  # failure
-            return None
+        return self.initialised == 1
 
-        try:
-            return _TZ_KV.get(_TZ_KV.key == key).value
-        except _TZ_KV.DoesNotExist:
-            return None
 
-    def store(self, key, value):
-        if self.dummy:
-            return
+class _KVCache(_DBCache):
+    """
+    Key-value cache in an SQLite file, for small values read far more
+    often than written, e.g. ticker timezones.
+
+    Recently used values are also held in memory (least-recently-used
+    dropped beyond max_entries), so repeat lookups don't touch SQLite.
+    Writes are upserts. lookup_many/store_many batch many keys into
+    few statements, and with persistent=False only use memory.
+    Subclasses set _db_manager, _exception, _model, _proxy and _name,
+    and convert values to/from table columns.
+
+    Safe for many processes sharing the cache folder: if SQLite stays
+    locked by others, a lookup is a miss and a store only updates memory.
+    If a remote backend is set (see set_cache_backend), it replaces SQLite.
+    """
 
-        if self.initialised == -1:
-            self.initialise()
+    _model = None
+    max_entries = 1024
+    # Skip writing a value identical to the one in memory
+    _skip_unchanged = True
+    _batch_size = 100
+    # Seconds values live in the remote backend, None = forever
+    _remote_ttl = None
 
-        if self.initialised == 0:  # failure
-            return
+    def __init__(self):
+        super().__init__()
+        self._entries = OrderedDict()
+        self._lock = Lock()
 
-        db = self.get_db()
-        if db is None:
+    def _tables(self):
+        return [self._model]
+
+    @property
+    def _key_field(self):
+        return self._model._meta.primary_key
+
+    def _encode(self, value):
+        # Value -> {column: db value}, excluding key
+        raise NotImplementedError
+
+    def _decode(self, row):
+        # Table row -> value held in memory
+        raise NotImplementedError
+
+    def _on_store(self, items):
+        # Called in the store transaction, before the upserts
+        pass
+
+    def _remote_encode(self, value):
+        # Value -> bytes for the remote backend
+        return value.encode()
+
+    def _remote_decode(self, data):
+        # Bytes from the remote backend -> value held in memory
+        return data.decode() if isinstance(data, bytes) else data
+
+    def _remote_key(self, key):
+        return f"{_cache_backend_prefix}{self._name}:{key}"
+
+    def _remember(self, key, value):
+        # Caller holds self._lock
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def lookup(self, key, persistent=True):
+        return self.lookup_many([key], persistent).get(key)
+
+    def lookup_many(self, keys, persistent=True):
+        """Return {key: value} for keys found"""
+        found = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+                else:
+                    missing.append(key)
+        loaded = {}
+        backend = _cache_backend
+        if missing and persistent and backend is not None:
+            try:
+                values = _backend_call(self.stats, lambda: backend.mget([self._remote_key(k) for k in missing]))
+            except _CacheLockedError:
+                values = []
+            for key, data in zip(missing, values):
+                if data is not None:
+                    loaded[key] = self._remote_decode(data)
+            with self._lock:
+                for key, value in loaded.items():
+                    self._remember(key, value)
+        elif missing and persistent and self._ready():
+            key_field = self._key_field
+            for i in range(0, len(missing), self._batch_size):
+                chunk = missing[i:i+self._batch_size]
+                if len(chunk) == 1:
+                    query = self._model.select().where(key_field == chunk[0])
+                else:
+                    query = self._model.select().where(key_field.in_(chunk))
+                try:
+                    rows = _db_call(self.stats, lambda: list(query))
+                except _CacheLockedError:
+                    get_yf_logger().debug(f"{self._name} locked by other processes, treating as miss")
+                    break
+                for row in rows:
+                    loaded[getattr(row, key_field.name)] = self._decode(row)
+            with self._lock:
+                for key, value in loaded.items():
+                    self._remember(key, value)
+        self.stats.add(lookups=len(found) + len(missing), memory_hits=len(found),
+                       db_hits=len(loaded), misses=len(missing) - len(loaded))
+        found.update(loaded)
+        return found
+
+    def store(self, key, value, persistent=True):
+        self.store_many({key: value}, persistent)
+
+    def store_many(self, items, persistent=True):
+        """Upsert {key: value}. A None value deletes the key"""
+        with self._lock:
+            if self._skip_unchanged:
+                changed = {}
+                for key, value in items.items():
+                    old_value = self._entries.get(key)
+                    if old_value is not None and old_value == value:
+                        continue
+                    if old_value is not None and value is not None:
+                        get_yf_logger().debug(f"Value for key {key} changed from {old_value} to {value}.")
+                    changed[key] = value
+                items = changed
+        if not items:
             return
-        try:
-            if value is None:
-                q = _TZ_KV.delete().where(_TZ_KV.key == key)
-                q.execute()
-                return
-            with db.atomic():
-                _TZ_KV.insert(key=key, value=value).execute()
-        except _peewee.IntegrityError:
-            # Integrity error means the key already exists. Try updating the key.
-            old_value = self.lookup(key)
-            if old_value != value:
-                get_yf_logger().debug(f"Value for key {key} changed from {old_value} to {value}.")
-                with db.atomic():
-                    q = _TZ_KV.update(value=value).where(_TZ_KV.key == key)
-                    q.execute()
+
+        backend = _cache_backend
+        if persistent and backend is not None:
+            def write():
+                for key, value in items.items():
+                    if value is None:
+                        backend.delete(self._remote_key(key))
+                    else:
+                        backend.set(self._remote_key(key), self._remote_encode(value), ex=self._remote_ttl)
+            try:
+                _backend_call(self.stats, write)
+                self.stats.add(writes=len(items))
+            except _CacheLockedError:
+                pass
+        elif persistent and self._ready():
+            key_field = self._key_field
+            deletes = [k for k, v in items.items() if v is None]
+            rows = [dict(self._encode(v), **{key_field.name: k}) for k, v in items.items() if v is not None]
+
+            def write():
+                # IMMEDIATE: take write lock upfront, so SQLite waits for it
+                with self.db.atomic('IMMEDIATE'):
+                    for i in range(0, len(deletes), self._batch_size):
+                        self._model.delete().where(key_field.in_(deletes[i:i+self._batch_size])).execute()
+                    self._on_store(items)
+                    if rows:
+                        preserve = [self._model._meta.fields[c] for c in rows[0] if c != key_field.name]
+                        for i in range(0, len(rows), self._batch_size):
+                            self._model.insert_many(rows[i:i+self._batch_size]).on_conflict(
+                                conflict_target=[key_field], preserve=preserve).execute()
+            try:
+                _db_call(self.stats, write)
+                self.stats.add(writes=len(items))
+            except _CacheLockedError:
+                get_yf_logger().debug(f"{self._name} locked by other processes, only storing in memory")
+
+        with self._lock:
+            for key, value in items.items():
+                if value is None:
+                    self._entries.pop(key, None)
+                else:
+                    self._remember(key, self._memory_value(value))
+
+    def _memory_value(self, value):
+        # Value just stored -> value held in memory
+        return value
+
+    def clear(self):
+        """Forget values held in memory"""
+        with self._lock:
+            self._entries.clear()
+
+
+
+# --------------
+# TimeZone cache
+# --------------
+
+class _TzCacheException(Exception):
+    pass
+
+
+class _TzCacheDummy:
+    """Dummy cache to use if tz cache is disabled"""
+
+    def lookup(self, tkr):
+        return None
+
+    def store(self, tkr, tz):
+        pass
+
+    @property
+    def tz_db(self):
+        return None
+
+
+class _TzCacheManager:
+    _tz_cache = None
+
+    @classmethod
+    def get_tz_cache(cls):
+        if cls._tz_cache is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._tz_cache
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        cls._tz_cache = _TzCache()
+
+
+class _TzDBManager(_DBManager):
+    _db = None
+    _filename = 'tkr-tz.db'
+    _exception = _TzCacheException
+    _name = 'TzCache'
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        super()._initialise(cache_dir)
+
+        old_cache_file_path = _os.path.join(cls._cache_dir, "tkr-tz.csv")
+        if _os.path.isfile(old_cache_file_path):
+            _os.remove(old_cache_file_path)
+
+# close DB when Python exists
+_atexit.register(_TzDBManager.close_db)
+
+
+tz_db_proxy = _peewee.Proxy()
+class _TZ_KV(_peewee.Model):
+    key = _peewee.CharField(primary_key=True)
+    value = _peewee.CharField(null=True)
+    
+    class Meta:
+        database = tz_db_proxy
+        without_rowid = True
+
+
+class _TzCache(_KVCache):
+    _db_manager = _TzDBManager
+    _exception = _TzCacheException
+    _model = _TZ_KV
+    _proxy = tz_db_proxy
+    _name = 'TzCache'
+
+    def _encode(self, value):
+        return {'value': value}
+
+    def _decode(self, row):
+        return row.value
 
 
 def get_tz_cache():
@@ -244,54 +603,11 @@ class _CookieCacheManager:
         cls._Cookie_cache = _CookieCache()
 
 
-class _CookieDBManager:
+class _CookieDBManager(_DBManager):
     _db = None
-    _cache_dir = _os.path.join(_ad.user_cache_dir(), "py-yfinance")
-
-    @classmethod
-    def get_database(cls):
-        if cls._db is None:
-            cls._initialise()
-        return cls._db
-
-    @classmethod
-    def close_db(cls):
-        if cls._db is not None:
-            try:
-                cls._db.close()
-            except Exception:
-                # Must discard exceptions because Python trying to quit.
-                pass
-
-
-    @classmethod
-    def _initialise(cls, cache_dir=None):
-        if cache_dir is not None:
-            cls._cache_dir = cache_dir
-
-        if not _os.path.isdir(cls._cache_dir):
-            try:
-                _os.makedirs(cls._cache_dir)
-            except OSError as err:
-                raise _CookieCacheException(f"Error creating CookieCache folder: '{cls._cache_dir}' reason: {err}")
-        elif not (_os.access(cls._cache_dir, _os.R_OK) and _os.access(cls._cache_dir, _os.W_OK)):
-            raise _CookieCacheException(f"Cannot read and write in CookieCache folder: '{cls._cache_dir}'")
-
-        cls._db = _peewee.SqliteDatabase(
-            _os.path.join(cls._cache_dir, 'cookies.db'),
-            pragmas={'journal_mode': 'wal', 'cache_size': -64}
-        )
-
-    @classmethod
-    def set_location(cls, new_cache_dir):
-        if cls._db is not None:
-            cls._db.close()
-            cls._db = None
-        cls._cache_dir = new_cache_dir
-
-    @classmethod
-    def get_location(cls):
-        return cls._cache_dir
+    _filename = 'cookies.db'
+    _exception = _CookieCacheException
+    _name = 'CookieCache'
 
 # close DB when Python exists
 _atexit.register(_CookieDBManager.close_db)
@@ -322,94 +638,39 @@ class _CookieSchema(_peewee.Model):
         without_rowid = True
 
 
-class _CookieCache:
-    def __init__(self):
-        self.initialised = -1
-        self.db = None
-        self.dummy = False
+class _CookieCache(_KVCache):
+    _db_manager = _CookieDBManager
+    _exception = _CookieCacheException
+    _model = _CookieSchema
+    _proxy = Cookie_db_proxy
+    _name = 'CookieCache'
+    max_entries = 16
+    # Re-storing a cookie refreshes its fetch date
+    _skip_unchanged = False
 
-    def get_db(self):
-        if self.db is not None:
-            return self.db
+    def _encode(self, cookie):
+        return {'cookie_bytes': _pkl.dumps(cookie, _pkl.HIGHEST_PROTOCOL),
+                'fetch_date': _dt.datetime.now()}
 
-        try:
-            self.db = _CookieDBManager.get_database()
-        except _CookieCacheException as err:
-            get_yf_logger().info(f"Failed to create CookieCache, reason: {err}. "
-                                 "CookieCache will not be used. "
-                                 "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'")
-            self.dummy = True
-            return None
-        return self.db
+    def _decode(self, row):
+        # Keep pickled, so each lookup gets its own copy
+        return bytes(row.cookie_bytes), row.fetch_date
 
-    def initialise(self):
-        if self.initialised != -1:
-            return
+    def _memory_value(self, cookie):
+        return _pkl.dumps(cookie, _pkl.HIGHEST_PROTOCOL), _dt.datetime.now()
 
-        db = self.get_db()
-        if db is None:
-            self.initialised = 0  # failure
-            return
+    def _remote_encode(self, cookie):
+        return _pkl.dumps(self._memory_value(cookie), _pkl.HIGHEST_PROTOCOL)
 
-        db.connect()
-        Cookie_db_proxy.initialize(db)
-        try:
-            db.create_tables([_CookieSchema])
-        except _peewee.OperationalError as e:
-            if 'WITHOUT' in str(e):
-                _CookieSchema._meta.without_rowid = False
-                db.create_tables([_CookieSchema])
-            else:
-                raise
-        self.initialised = 1  # success
+    def _remote_decode(self, data):
+        return _pkl.loads(data)
 
     def lookup(self, strategy):
-        if self.dummy:
+        entry = super().lookup(strategy)
+        if entry is None:
             return None
-
-        if self.initialised == -1:
-            self.initialise()
-
-        if self.initialised == 0:  # failure
-            return None
-
-        try:
-            data =  _CookieSchema.get(_CookieSchema.strategy == strategy)
-            cookie = _pkl.loads(data.cookie_bytes)
-            return {'cookie':cookie, 'age':_dt.datetime.now()-data.fetch_date}
-        except _CookieSchema.DoesNotExist:
-            return None
-
-    def store(self, strategy, cookie):
-        if self.dummy:
-            return
-
-        if self.initialised == -1:
-            self.initialise()
-
-        if self.initialised == 0:  # failure
-            return
-
-        db = self.get_db()
-        if db is None:
-            return
-        try:
-            q = _CookieSchema.delete().where(_CookieSchema.strategy == strategy)
-            q.execute()
-            if cookie is None:
-                return
-            with db.atomic():
-                cookie_pkl = _pkl.dumps(cookie, _pkl.HIGHEST_PROTOCOL)
-                _CookieSchema.insert(strategy=strategy, cookie_bytes=cookie_pkl).execute()
-        except _peewee.IntegrityError:
-            raise
-            # # Integrity error means the strategy already exists. Try updating the strategy.
-            # old_value = self.lookup(strategy)
-            # if old_value != cookie:
-            #     get_yf_logger().debug(f"cookie for strategy {strategy} changed from {old_value} to {cookie}.")
-            #     with db.atomic():
-            #         q = _CookieSchema.update(cookie=cookie).where(_CookieSchema.strategy == strategy)
-            #         q.execute()
+        cookie_bytes, fetch_date = entry
+        return {'cookie': _pkl.loads(cookie_bytes), 'age': _dt.datetime.now() - fetch_date}
 
 
 def get_cookie_cache():
@@ -454,168 +715,614 @@ class _ISINCacheManager:
         cls._isin_cache = _ISINCache()
 
 
-class _ISINDBManager:
+class _ISINDBManager(_DBManager):
     _db = None
-    _cache_dir = _os.path.join(_ad.user_cache_dir(), "py-yfinance")
+    _filename = 'isin-tkr.db'
+    _exception = _ISINCacheException
+    _name = 'ISINCache'
 
-    @classmethod
-    def get_database(cls):
-        if cls._db is None:
-            cls._initialise()
-        return cls._db
+# close DB when Python exists
+_atexit.register(_ISINDBManager.close_db)
 
-    @classmethod
-    def close_db(cls):
-        if cls._db is not None:
-            try:
-                cls._db.close()
-            except Exception:
-                # Must discard exceptions because Python trying to quit.
-                pass
 
+isin_db_proxy = _peewee.Proxy()
+class _ISIN_KV(_peewee.Model):
+    key = _peewee.CharField(primary_key=True)
+    value = _peewee.CharField(null=True)
+    created_at = _peewee.DateTimeField(default=_dt.datetime.now)
+    
+    class Meta:
+        database = isin_db_proxy
+        without_rowid = True
+
+
+class _ISINCache(_KVCache):
+    _db_manager = _ISINDBManager
+    _exception = _ISINCacheException
+    _model = _ISIN_KV
+    _proxy = isin_db_proxy
+    _name = 'ISINCache'
+
+    def _encode(self, value):
+        return {'value': value, 'created_at': _dt.datetime.now()}
+
+    def _decode(self, row):
+        return row.value
+
+    def _on_store(self, items):
+        values = [v for v in items.values() if v is not None]
+        if not values:
+            return
+        # Remove existing rows with same value that are older than 1 week
+        one_week_ago = _dt.datetime.now() - _dt.timedelta(weeks=1)
+        _ISIN_KV.delete().where(
+            (_ISIN_KV.value.in_(values)) &
+            (_ISIN_KV.created_at < one_week_ago)
+        ).execute()
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if v in values and k not in items]:
+                del self._entries[key]
+
+
+def get_isin_cache():
+    return _ISINCacheManager.get_isin_cache()
+
+
+# --------------
+# Repair price cache
+# --------------
+
+class _RepairPriceCacheException(Exception):
+    pass
+
+
+class _RepairPriceCacheManager:
+    _repair_price_cache = None
+
+    @classmethod
+    def get_repair_price_cache(cls):
+        if cls._repair_price_cache is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._repair_price_cache
 
     @classmethod
     def _initialise(cls, cache_dir=None):
-        if cache_dir is not None:
-            cls._cache_dir = cache_dir
+        cls._repair_price_cache = _RepairPriceCache()
 
-        if not _os.path.isdir(cls._cache_dir):
-            try:
-                _os.makedirs(cls._cache_dir)
-            except OSError as err:
-                raise _ISINCacheException(f"Error creating ISINCache folder: '{cls._cache_dir}' reason: {err}")
-        elif not (_os.access(cls._cache_dir, _os.R_OK) and _os.access(cls._cache_dir, _os.W_OK)):
-            raise _ISINCacheException(f"Cannot read and write in ISINCache folder: '{cls._cache_dir}'")
 
-        cls._db = _peewee.SqliteDatabase(
-            _os.path.join(cls._cache_dir, 'isin-tkr.db'),
-            pragmas={'journal_mode': 'wal', 'cache_size': -64}
-        )
+class _RepairPriceDBManager(_DBManager):
+    _db = None
+    _filename = 'repair-prices.db'
+    _exception = _RepairPriceCacheException
+    _name = 'RepairPriceCache'
+
+# close DB when Python exists
+_atexit.register(_RepairPriceDBManager.close_db)
+
+
+repair_price_db_proxy = _peewee.Proxy()
+class _RepairPriceSchema(_peewee.Model):
+    key = _peewee.CharField(primary_key=True)
+    # Pickled ([(start, end, fetch time)] date ranges that 'prices' covers, latest split/dividend date)
+    coverage_bytes = _peewee.BlobField()
+    prices_bytes = _peewee.BlobField()
+
+    class Meta:
+        database = repair_price_db_proxy
+        without_rowid = True
+
+
+class _RepairPriceCache(_KVCache):
+    """
+    Finer-grain prices fetched by price repair, shared by all tickers.
+
+    Held in memory, and with persistent=True also in the cache folder so
+    later sessions reuse them. Requests inside an already-fetched date
+    range are served by slicing. Yahoo re-adjusts past prices after a
+    split or dividend, so a fetched range expires after
+    yf.config.repair.cache_ttl, and all of a ticker's prices are dropped
+    once a newer split/dividend is seen.
+    """
+
+    _db_manager = _RepairPriceDBManager
+    _exception = _RepairPriceCacheException
+    _model = _RepairPriceSchema
+    _proxy = repair_price_db_proxy
+    _name = 'RepairPriceCache'
+    max_entries = 256
+    # Values hold DataFrames, and a store always merges new prices
+    _skip_unchanged = False
+    # Returned data can start/end a few days inside the requested range,
+    # e.g. weekends and holidays, and still cover it
+    _edge_slack = _dt.timedelta(days=4)
+
+    def __init__(self):
+        super().__init__()
+        self._save_lock = Lock()  # orders merges, without blocking lookups
+
+    @staticmethod
+    def _now():
+        return _dt.datetime.now()
+
+    @staticmethod
+    def _key(ticker, interval, prepost):
+        return f"{ticker}|{interval}|{int(bool(prepost))}"
+
+    @staticmethod
+    def _slice(prices, start, end):
+        if prices.empty:
+            return prices
+        tz = prices.index.tz
+        start_ts = _pd.Timestamp(start).tz_localize(tz)
+        end_ts = _pd.Timestamp(end).tz_localize(tz)
+        return prices[(prices.index >= start_ts) & (prices.index < end_ts)]
+
+    @staticmethod
+    def _last_event(prices):
+        cols = [c for c in ['Dividends', 'Stock Splits'] if c in prices.columns]
+        if not cols:
+            return None
+        f = (prices[cols].fillna(0) != 0).any(axis=1).to_numpy()
+        return prices.index[f][-1].date() if f.any() else None
+
+    def _fresh(self, coverage):
+        ttl = YfConfig.repair.cache_ttl
+        if ttl is None:
+            return coverage
+        oldest = self._now() - _dt.timedelta(seconds=ttl)
+        return [c for c in coverage if c[2] >= oldest]
+
+    def _encode(self, entry):
+        coverage, prices, last_event = entry
+        return {'coverage_bytes': _pkl.dumps((coverage, last_event), _pkl.HIGHEST_PROTOCOL),
+                'prices_bytes': _pkl.dumps(prices, _pkl.HIGHEST_PROTOCOL)}
+
+    def _decode(self, row):
+        coverage, last_event = _pkl.loads(row.coverage_bytes)
+        return coverage, _pkl.loads(row.prices_bytes), last_event
+
+    def _remote_encode(self, entry):
+        return _pkl.dumps(entry, _pkl.HIGHEST_PROTOCOL)
+
+    def _remote_decode(self, data):
+        return _pkl.loads(data)
+
+    def lookup(self, ticker, interval, prepost, start, end, last_event=None, persistent=False):
+        """
+        Return prices for [start, end) if already fetched, else None.
+        last_event = date of the latest split/dividend the caller knows of
+        """
+        entry = self.lookup_many([self._key(ticker, interval, prepost)], persistent)
+        if not entry:
+            return None
+        coverage, prices, known_event = next(iter(entry.values()))
+        if last_event is not None and (known_event is None or last_event > known_event):
+            # Prices fetched before this event are adjusted differently
+            return None
+        if not any(s <= start and end <= e for s, e, _ in self._fresh(coverage)):
+            return None
+        return self._slice(prices, start, end)
+
+    def store(self, ticker, interval, prepost, start, end, prices, last_event=None, persistent=False):
+        """Add prices fetched for [start, end). Only the range they actually span is marked covered"""
+        if prices is None or prices.empty:
+            return
+        key = self._key(ticker, interval, prepost)
+        first, last = prices.index[0].date(), prices.index[-1].date() + _dt.timedelta(days=1)
+        if first - start > self._edge_slack:
+            start = first
+        if end - last > self._edge_slack:
+            end = last
+        events = [d for d in [last_event, self._last_event(prices)] if d is not None]
+        last_event = max(events) if events else None
+        now = self._now()
+
+        # Merge and write one store at a time, so a slower concurrent
+        # store can't overwrite a newer merge.
+        with self._save_lock:
+            entry = self.lookup_many([key], persistent).get(key)
+            if entry is not None:
+                coverage, merged, known_event = entry
+                if last_event is not None and (known_event is None or last_event > known_event):
+                    entry = None
+            if entry is None:
+                coverage, merged, known_event = [], prices, last_event
+            else:
+                coverage = self._fresh(coverage)
+                if not coverage:
+                    merged = prices
+                else:
+                    merged = _pd.concat([merged, prices])
+                    merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+
+            # Merge overlapping date ranges, keeping the older fetch time
+            ranges = sorted(coverage + [(start, end, now)])
+            coverage = [ranges[0]]
+            for s, e, t in ranges[1:]:
+                if s <= coverage[-1][1]:
+                    coverage[-1] = (coverage[-1][0], max(e, coverage[-1][1]), min(t, coverage[-1][2]))
+                else:
+                    coverage.append((s, e, t))
+
+            self.store_many({key: (coverage, merged, known_event)}, persistent)
+
+
+def get_repair_price_cache():
+    return _RepairPriceCacheManager.get_repair_price_cache()
+
+
+# --------------
+# Repair result cache
+# --------------
+
+class _RepairResultCacheException(Exception):
+    pass
+
+
+class _RepairResultCacheManager:
+    _repair_result_cache = None
 
     @classmethod
-    def set_location(cls, new_cache_dir):
-        if cls._db is not None:
-            cls._db.close()
-            cls._db = None
-        cls._cache_dir = new_cache_dir
+    def get_repair_result_cache(cls):
+        if cls._repair_result_cache is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._repair_result_cache
 
     @classmethod
-    def get_location(cls):
-        return cls._cache_dir
+    def _initialise(cls, cache_dir=None):
+        cls._repair_result_cache = _RepairResultCache()
+
+
+class _RepairResultDBManager(_DBManager):
+    _db = None
+    _filename = 'repair-results.db'
+    _exception = _RepairResultCacheException
+    _name = 'RepairResultCache'
 
 # close DB when Python exists
-_atexit.register(_ISINDBManager.close_db)
+_atexit.register(_RepairResultDBManager.close_db)
 
 
-isin_db_proxy = _peewee.Proxy()
-class _ISIN_KV(_peewee.Model):
+repair_result_db_proxy = _peewee.Proxy()
+class _RepairResultSchema(_peewee.Model):
     key = _peewee.CharField(primary_key=True)
-    value = _peewee.CharField(null=True)
-    created_at = _peewee.DateTimeField(default=_dt.datetime.now)
-    
+    # Pickled (columns, row hashes, repaired prices, repaired currency, scan state)
+    result_bytes = _peewee.BlobField()
+
     class Meta:
-        database = isin_db_proxy
+        database = repair_result_db_proxy
         without_rowid = True
 
 
-class _ISINCache:
+class _RepairResultCache(_KVCache):
+    """
+    Latest price-repair result per ticker/interval, with the hash of every
+    raw input row. Lets price repair skip unchanged data, and only
+    re-examine the tail when new bars were appended.
+
+    Held in memory, and with persistent=True also in the cache folder so
+    later sessions reuse them.
+    """
+
+    _db_manager = _RepairResultDBManager
+    _exception = _RepairResultCacheException
+    _model = _RepairResultSchema
+    _proxy = repair_result_db_proxy
+    _name = 'RepairResultCache'
+    max_entries = 64
+    # Values hold DataFrames, and a store always replaces the result
+    _skip_unchanged = False
+
     def __init__(self):
-        self.initialised = -1
-        self.db = None
-        self.dummy = False
+        super().__init__()
+        self._save_lock = Lock()  # orders stores, so disk and memory agree on the latest
 
-    def get_db(self):
-        if self.db is not None:
-            return self.db
+    @staticmethod
+    def _key(ticker, interval, prepost, currency):
+        return f"{ticker}|{interval}|{int(bool(prepost))}|{currency}"
 
-        try:
-            self.db = _ISINDBManager.get_database()
-        except _ISINCacheException as err:
-            get_yf_logger().info(f"Failed to create ISINCache, reason: {err}. "
-                                 "ISINCache will not be used. "
-                                 "Tip: You can direct cache to use a different location with 'set_isin_cache_location(mylocation)'")
-            self.dummy = True
-            return None
-        return self.db
+    def _encode(self, entry):
+        return {'result_bytes': _pkl.dumps(entry, _pkl.HIGHEST_PROTOCOL)}
 
-    def initialise(self):
-        if self.initialised != -1:
-            return
+    def _decode(self, row):
+        return _pkl.loads(row.result_bytes)
 
-        db = self.get_db()
-        if db is None:
-            self.initialised = 0  # failure
-            return
+    def _remote_encode(self, entry):
+        return _pkl.dumps(entry, _pkl.HIGHEST_PROTOCOL)
 
-        db.connect()
-        isin_db_proxy.initialize(db)
-        try:
-            db.create_tables([_ISIN_KV])
-        except _peewee.OperationalError as e:
-            if 'WITHOUT' in str(e):
-                _ISIN_KV._meta.without_rowid = False
-                db.create_tables([_ISIN_KV])
-            else:
-                raise
-        self.initialised = 1  # success
+    def _remote_decode(self, data):
+        return _pkl.loads(data)
 
-    def lookup(self, key):
-        if self.dummy:
-            return None
+    def lookup(self, ticker, interval, prepost, currency, persistent=False):
+        """Return (columns, row_hashes, repaired prices, repaired currency, state) of last repair, else None"""
+        key = self._key(ticker, interval, prepost, currency)
+        return self.lookup_many([key], persistent).get(key)
 
-        if self.initialised == -1:
-            self.initialise()
+    def store(self, ticker, interval, prepost, currency, columns, row_hashes, prices, repaired_currency, state=None, persistent=False):
+        """Replace the last repair result. state = repair's own data for continuing incrementally"""
+        key = self._key(ticker, interval, prepost, currency)
+        with self._save_lock:
+            self.store_many({key: (tuple(columns), row_hashes, prices, repaired_currency, state)}, persistent)
+
+
+def get_repair_result_cache():
+    return _RepairResultCacheManager.get_repair_result_cache()
+
+
+# --------------
+# Fundamentals store
+# --------------
+
+class _FundamentalsStoreException(Exception):
+    pass
+
+
+class _FundamentalsStoreManager:
+    _fundamentals_store = None
+
+    @classmethod
+    def get_fundamentals_store(cls):
+        if cls._fundamentals_store is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._fundamentals_store
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        cls._fundamentals_store = _FundamentalsStore()
+
+
+class _FundamentalsDBManager(_DBManager):
+    _db = None
+    _filename = 'fundamentals.db'
+    _exception = _FundamentalsStoreException
+    _name = 'FundamentalsStore'
+
+# close DB when Python exists
+_atexit.register(_FundamentalsDBManager.close_db)
 
-        if self.initialised == 0:  # failure
-            return None
 
+fundamentals_db_proxy = _peewee.Proxy()
+class _FundamentalsSchema(_peewee.Model):
+    ticker = _peewee.CharField()
+    statement = _peewee.CharField()
+    freq = _peewee.CharField()
+    item = _peewee.CharField()
+    as_of = _peewee.DateField()
+    # When this value was fetched. A restated value gets a new version.
+    version = ISODateTimeField()
+    value = _peewee.FloatField()
+
+    class Meta:
+        database = fundamentals_db_proxy
+        primary_key = _peewee.CompositeKey('ticker', 'statement', 'freq', 'item', 'as_of', 'version')
+
+
+class _FundamentalsDateSchema(_peewee.Model):
+    # "ticker|statement|freq" -> last fetch, "ticker" -> next earnings date
+    key = _peewee.CharField(primary_key=True)
+    date = ISODateTimeField()
+
+    class Meta:
+        database = fundamentals_db_proxy
+        without_rowid = True
+
+
+class _FundamentalsStore(_DBCache):
+    """
+    Financial statements kept in the cache folder, one row per
+    ticker/statement/freq/item/period and version. Statements are only
+    refetched once a new report is due, and every value ever fetched is
+    kept, so a table can be rebuilt as it was on a past date.
+    """
+
+    _db_manager = _FundamentalsDBManager
+    _exception = _FundamentalsStoreException
+    _proxy = fundamentals_db_proxy
+    _name = 'FundamentalsStore'
+
+    # Period length and typical reporting delay after period end
+    _period_days = {'yearly': (365, 90), 'quarterly': (91, 45), 'trailing': (91, 45)}
+    _recheck = _dt.timedelta(days=1)  # if a report is late, refetch at most this often
+
+    def _tables(self):
+        return [_FundamentalsSchema, _FundamentalsDateSchema]
+
+    @staticmethod
+    def _now():
+        return _dt.datetime.now(_dt.timezone.utc).replace(tzinfo=None, microsecond=0)
+
+    def _select(self, ticker, statement, freq, as_of=None):
+        # (item, period, value) of latest version at as_of
+        S = _FundamentalsSchema
+        query = S.select(S.item, S.as_of, S.value).where(
+            (S.ticker == ticker) & (S.statement == statement) & (S.freq == freq))
+        if as_of is not None:
+            query = query.where(S.version <= as_of)
+        rows = _db_call(self.stats, lambda: list(query.order_by(S.version).tuples()))
+        latest = {}
+        for item, period, value in rows:
+            latest[(item, period)] = value
+        return latest
+
+    def _get_date(self, key):
+        row = _db_call(self.stats, lambda: _FundamentalsDateSchema.get_or_none(_FundamentalsDateSchema.key == key))
+        return None if row is None else row.date
+
+    def _set_date(self, key, date):
+        query = _FundamentalsDateSchema.insert(key=key, date=date).on_conflict(
+            conflict_target=[_FundamentalsDateSchema.key], preserve=[_FundamentalsDateSchema.date])
+        _db_call(self.stats, query.execute)
+
+    def lookup(self, ticker, statement, freq, as_of=None):
+        """
+        Return the statement table (items x period-end dates, newest first),
+        as stored at `as_of` (default now), else None
+        """
+        self.stats.add(lookups=1)
+        if not self._ready():
+            self.stats.add(misses=1)
+            return None
+        if as_of is not None:
+            as_of = _pd.Timestamp(as_of)
+            if as_of.tzinfo is not None:
+                as_of = as_of.tz_convert('UTC').tz_localize(None)
+            if as_of == as_of.normalize():
+                as_of += _pd.Timedelta(days=1) - _pd.Timedelta(seconds=1)  # whole day
+            as_of = as_of.to_pydatetime()
         try:
-            return _ISIN_KV.get(_ISIN_KV.key == key).value
-        except _ISIN_KV.DoesNotExist:
+            latest = self._select(ticker, statement, freq, as_of)
+        except _CacheLockedError:
+            latest = {}
+        if not latest:
+            self.stats.add(misses=1)
             return None
-
-    def store(self, key, value):
-        if self.dummy:
+        self.stats.add(db_hits=1)
+        df = _pd.Series(latest).unstack()
+        df.columns = _pd.to_datetime(df.columns)
+        df = df[sorted(df.columns, reverse=True)]
+        df.index.name = None
+        df.columns.name = None
+        return df.astype('float')
+
+    def is_stale(self, ticker, statement, freq, now=None):
+        """True if never fetched, or a new report is due since last fetch"""
+        if not self._ready():
+            return True
+        try:
+            fetched = self._get_date(f"{ticker}|{statement}|{freq}")
+            if fetched is None:
+                return True
+            S = _FundamentalsSchema
+            query = S.select(_peewee.fn.MAX(S.as_of)).where(
+                (S.ticker == ticker) & (S.statement == statement) & (S.freq == freq))
+            latest_period = _db_call(self.stats, query.scalar)
+            earnings_date = self._get_date(ticker)
+        except _CacheLockedError:
+            return True
+        if latest_period is None:
+            return True
+        if isinstance(latest_period, str):
+            latest_period = _dt.date.fromisoformat(latest_period)
+        period, delay = self._period_days[freq]
+        due = _dt.datetime.combine(latest_period, _dt.time()) + _dt.timedelta(days=period + delay)
+        if earnings_date is not None and earnings_date.date() > latest_period:
+            # Statements follow the earnings release
+            due = min(due, earnings_date + _dt.timedelta(days=1))
+        now = self._now() if now is None else now
+        return now >= max(due, fetched + self._recheck)
+
+    def store(self, ticker, statement, freq, df):
+        """Store a fetched statement table, adding a version for new or restated values"""
+        if df is None or df.empty or not self._ready():
+            return
+        now = self._now()
+        try:
+            latest = self._select(ticker, statement, freq)
+        except _CacheLockedError:
             return
+        stacked = df.stack().dropna()
+        rows = []
+        for (item, period), value in stacked.items():
+            period = _pd.Timestamp(period).date()
+            value = float(value)
+            if latest.get((item, period)) != value:
+                rows.append({'ticker': ticker, 'statement': statement, 'freq': freq, 'item': item,
+                             'as_of': period, 'version': now, 'value': value})
+
+        def write():
+            with self.db.atomic():
+                for i in range(0, len(rows), 100):
+                    _FundamentalsSchema.insert_many(rows[i:i + 100]).on_conflict_ignore().execute()
+                self._set_date(f"{ticker}|{statement}|{freq}", now)
+        try:
+            _db_call(self.stats, write)
+            self.stats.add(writes=len(rows))
+        except _CacheLockedError:
+            pass
+
+    def set_earnings_date(self, ticker, date):
+        """Next earnings release, to know when statements will be updated"""
+        if not self._ready():
+            return
+        try:
+            self._set_date(ticker, _dt.datetime.combine(date, _dt.time()))
+        except _CacheLockedError:
+            pass
 
-        if self.initialised == -1:
-            self.initialise()
 
-        if self.initialised == 0:  # failure
-            return
+def get_fundamentals_store():
+    return _FundamentalsStoreManager.get_fundamentals_store()
 
-        db = self.get_db()
-        if db is None:
+
+# --------------
+# Response cache
+# --------------
+
+class _ResponseCacheManager:
+    _response_cache = None
+
+    @classmethod
+    def get_response_cache(cls):
+        if cls._response_cache is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._response_cache
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        cls._response_cache = _ResponseCache()
+
+
+class _ResponseCache:
+    """
+    Responses of a date range in the past, shared through the remote backend
+    for a short while: a new split or dividend re-adjusts past prices.
+    Without a backend, lookups miss.
+    """
+
+    def __init__(self):
+        self.stats = _get_stats('ResponseCache')
+
+    @staticmethod
+    def _key(url, params):
+        params = sorted((params or {}).items())
+        digest = _hashlib.sha1(repr((url, params)).encode()).hexdigest()
+        return f"{_cache_backend_prefix}ResponseCache:{digest}"
+
+    def lookup(self, url, params=None):
+        """Return (response url, content) if shared, else None"""
+        backend = _cache_backend
+        if backend is None:
+            return None
+        key = self._key(url, params)
+        try:
+            data = _backend_call(self.stats, lambda: backend.get(key))
+        except _CacheLockedError:
+            data = None
+        self.stats.add(lookups=1, db_hits=int(data is not None), misses=int(data is None))
+        if data is None:
+            return None
+        response_url, _, content = bytes(data).partition(b'\n')
+        return response_url.decode(), content
+
+    def store(self, url, params, response_url, content):
+        backend = _cache_backend
+        if backend is None:
             return
+        key = self._key(url, params)
+        data = response_url.encode() + b'\n' + bytes(content)
         try:
-            if value is None:
-                q = _ISIN_KV.delete().where(_ISIN_KV.key == key)
-                q.execute()
-                return
-
-            # Remove existing rows with same value that are older than 1 week
-            one_week_ago = _dt.datetime.now() - _dt.timedelta(weeks=1)
-            old_rows_query = _ISIN_KV.delete().where(
-                (_ISIN_KV.value == value) & 
-                (_ISIN_KV.created_at < one_week_ago)
-            )
-            old_rows_query.execute()
-
-            with db.atomic():
-                _ISIN_KV.insert(key=key, value=value).execute()
-
-        except _peewee.IntegrityError:
-            # Integrity error means the key already exists. Try updating the key.
-            old_value = self.lookup(key)
-            if old_value != value:
-                get_yf_logger().debug(f"Value for key {key} changed from {old_value} to {value}.")
-                with db.atomic():
-                    q = _ISIN_KV.update(value=value, created_at=_dt.datetime.now()).where(_ISIN_KV.key == key)
-                    q.execute()
+            _backend_call(self.stats, lambda: backend.set(key, data, ex=YfConfig.cache.response_ttl))
+            self.stats.add(writes=1)
+        except _CacheLockedError:
+            pass
 
 
-def get_isin_cache():
-    return _ISINCacheManager.get_isin_cache()
+def get_response_cache():
+    return _ResponseCacheManager.get_response_cache()
 
 
 # --------------
@@ -633,7 +1340,44 @@ def set_cache_location(cache_dir: str):
     _TzDBManager.set_location(cache_dir)
     _CookieDBManager.set_location(cache_dir)
     _ISINDBManager.set_location(cache_dir)
+    _RepairPriceDBManager.set_location(cache_dir)
+    _RepairResultDBManager.set_location(cache_dir)
+    _FundamentalsDBManager.set_location(cache_dir)
 
 def set_tz_cache_location(cache_dir: str):
     set_cache_location(cache_dir)
 
+
+def set_cache_backend(backend, prefix: str = 'yfinance:'):
+    """
+    Share caches between processes and machines through a key-value store,
+    e.g. Redis. Timezone, ISIN and cookie caches then use it instead of the
+    SQLite files in the cache folder, and responses for past date ranges
+    are shared too. Only use a store you trust: cookies are pickled.
+    :param backend: Object with the Redis client methods get, mget, set(name, value, ex)
+        and delete, e.g. redis.Redis(...) or MemoryCacheBackend(). None reverts to SQLite.
+    :param prefix: Prepended to every key, to share one store between applications
+    :return: None
+    """
+    global _cache_backend, _cache_backend_prefix
+    with _cache_init_lock:
+        _cache_backend = backend
+        _cache_backend_prefix = prefix
+
+
+def get_cache_stats(reset=False) -> dict:
+    """
+    Counters of each cache in this process since start (or last reset):
+    lookups, memory_hits, db_hits, misses, writes, and SQLite lock contention
+    (retries, lock_failures, db_seconds spent in SQLite incl. waiting).
+    :param reset: Zero the counters after reading
+    :return: dict of cache name -> dict of counters
+    """
+    with _cache_stats_lock:
+        stats = dict(_cache_stats)
+    result = {name: s.as_dict() for name, s in stats.items()}
+    if reset:
+        for s in stats.values():
+            s.reset()
+    return result
+
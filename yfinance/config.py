@@ -30,12 +30,27 @@ class ConfigMgr:
         n = self.__getattr__('network')
         n.proxy = None
         n.retries = 0
+        n.prewarm = False   # fetch cookie & crumb in background when yfinance session created
+        n.pool_maxsize = 10   # connections kept open per host (per thread with curl_cffi)
+        n.keepalive = True   # reuse connections between requests
+        n.http2 = None   # True/False to force HTTP/2 on/off (curl_cffi only), None = backend default
+        n.dns_cache_timeout = 300   # seconds to cache DNS lookups (curl_cffi only)
+        n.coalesce_window = 0   # seconds a quoteSummary request waits for other modules of same ticker to join it
         d = self.__getattr__('debug')
         d.hide_exceptions = True
         d.logging = False
         loc = self.__getattr__('locale')
         loc.lang = "en-US"   # BCP-47 language tag for Yahoo v7/v10 endpoints
         loc.region = "US"    # ISO 3166-1 alpha-2 country code
+        r = self.__getattr__('repair')
+        r.cache = 'memory'   # reuse finer-grain repair fetches: 'memory', 'disk' or None
+        r.cache_ttl = 7*24*3600   # seconds cached finer-grain prices are reused, None = until a new split/dividend
+        r.result_cache = 'memory'   # reuse repair results of unchanged/appended data: 'memory', 'disk' or None
+        c = self.__getattr__('cache')
+        c.busy_timeout = 5   # seconds SQLite waits for another process to release a cache file
+        c.lock_retries = 3   # then retry with backoff, before treating as cache miss
+        c.response_ttl = 15*60   # seconds past-dated responses live in a remote cache backend
+        c.fundamentals = False   # keep financial statements in the cache folder, refetch when a new report is due
 
     def __getattr__(self, key):
         if not self._initialised:
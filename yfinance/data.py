@@ -1,4 +1,5 @@
 import functools
+import json as _json
 from functools import lru_cache
 import socket
 import time as _time
@@ -29,6 +30,9 @@ def _is_transient_error(exception):
 
 cache_maxsize = 64
 
+# Persisted crumb is reused with its cookie for this long
+_CRUMB_MAX_AGE = datetime.timedelta(days=1)
+
 
 def _normalize_proxy(proxy):
     if isinstance(proxy, str):
@@ -57,6 +61,23 @@ def lru_cache_freezeargs(func):
     return wrapped
 
 
+class _SharedResponse:
+    """Successful response restored from the remote cache backend"""
+
+    status_code = 200
+
+    def __init__(self, url, content):
+        self.url = url
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self, **kwargs):
+        return _json.loads(self.content, **kwargs)
+
+
 class SingletonMeta(type):
     """
     Metaclass that creates a Singleton instance.
@@ -86,6 +107,9 @@ class YfData(metaclass=SingletonMeta):
     def __init__(self, session=None):
         self._crumb = None
         self._cookie = None
+        # (crumb, strategy) once acquired, read without the lock.
+        # Reset to None wherever the crumb is invalidated.
+        self._valid_crumb = None
         # Whether the user has supplied login cookies (see set_login_cookies).
         # When logged in, the cookie-strategy toggle must not wipe the jar, or
         # it would silently log the user out. Auth corrects this flag to reflect
@@ -108,6 +132,9 @@ class YfData(metaclass=SingletonMeta):
         self._session = None
         self._set_session(session or new_session())
 
+        if YfConfig.network.prewarm:
+            self._prewarm()
+
     def set_login_cookies(self, cookie_t, cookie_y):
         with self._cookie_lock:
             self._session.cookies.update({
@@ -124,6 +151,7 @@ class YfData(metaclass=SingletonMeta):
             # re-mint on the next request keeps the crumb matched to these
             # cookies, so the login takes effect cleanly mid-process.
             self._crumb = None
+            self._valid_crumb = None
 
     def _set_logged_in(self, value):
         """Thread-safe update of the login flag (also read under this lock in
@@ -146,11 +174,16 @@ class YfData(metaclass=SingletonMeta):
             raise YFDataException(f"Unsupported session type {type(session)}; expected curl_cffi or requests Session. Solution: stop setting session, let yfinance handle.")
 
         with self._cookie_lock:
+            if session is not self._session:
+                # Cookie & crumb belong to the old session's jar
+                self._cookie = None
+                self._crumb = None
+                self._valid_crumb = None
             self._session = session
             if YfConfig.network.proxy is not None:
                 self._session.proxies = _normalize_proxy(YfConfig.network.proxy)
 
-    def _set_cookie_strategy(self, strategy, have_lock=False):
+    def _set_cookie_strategy(self, strategy, have_lock=False, crumb_rejected=False):
         if strategy == self._cookie_strategy:
             return
         if not have_lock:
@@ -171,6 +204,10 @@ class YfData(metaclass=SingletonMeta):
                 self._cookie_strategy = 'csrf'
             self._cookie = None
             self._crumb = None
+            self._valid_crumb = None
+            if crumb_rejected:
+                # Yahoo refused the crumb, so don't reuse the persisted one
+                cache.get_cookie_cache().store('crumb', None)
         except Exception:
             self._cookie_lock.release()
             raise
@@ -222,6 +259,46 @@ class YfData(metaclass=SingletonMeta):
         self._cookie = cookie
         return True
 
+    def _a3_cookie_value(self):
+        for c in cookie_jar(self._session):
+            if c.name == 'A3':
+                return c.value
+        return None
+
+    @utils.log_indent_decorator
+    def _save_crumb(self):
+        # Persist crumb with the cookie it was minted for
+        a3 = self._a3_cookie_value()
+        if self._crumb is None or a3 is None:
+            return False
+        cache.get_cookie_cache().store('crumb', {'crumb': self._crumb, 'A3': a3})
+        return True
+
+    @utils.log_indent_decorator
+    def _load_crumb(self):
+        entry = cache.get_cookie_cache().lookup('crumb')
+        if entry is None:
+            return False
+        if entry['age'] > _CRUMB_MAX_AGE:
+            utils.get_yf_logger().debug('cached crumb expired')
+            return False
+        a3 = self._a3_cookie_value()
+        if a3 is None or entry['cookie'].get('A3') != a3:
+            utils.get_yf_logger().debug('cached crumb is for a different cookie')
+            return False
+        self._crumb = entry['cookie']['crumb']
+        return True
+
+    def _prewarm(self):
+        # Fetch cookie & crumb in background, so first requests
+        # find them ready instead of all waiting on one thread.
+        def run():
+            try:
+                self._get_cookie_and_crumb()
+            except Exception as e:
+                utils.get_yf_logger().debug(f'cookie & crumb pre-warm failed: {e}')
+        threading.Thread(target=run, name='yfinance-prewarm', daemon=True).start()
+
     @utils.log_indent_decorator
     def _get_cookie_basic(self, timeout=30):
         if self._cookie is not None:
@@ -254,6 +331,9 @@ class YfData(metaclass=SingletonMeta):
 
         if not self._get_cookie_basic():
             return None
+        if self._load_crumb():
+            utils.get_yf_logger().debug('reusing persistent crumb')
+            return self._crumb
         # - 'allow_redirects' copied from @psychoz971 solution - does it help USA?
         get_args = {
             'url': "https://query1.finance.yahoo.com/v1/test/getcrumb",
@@ -271,6 +351,7 @@ class YfData(metaclass=SingletonMeta):
             return None
 
         utils.get_yf_logger().debug(f"crumb = '{self._crumb}'")
+        self._save_crumb()
         return self._crumb
 
     @utils.log_indent_decorator
@@ -349,6 +430,9 @@ class YfData(metaclass=SingletonMeta):
         if not self._get_cookie_csrf(timeout):
             # This cookie stored in session
             return None
+        if self._load_crumb():
+            utils.get_yf_logger().debug('reusing persistent crumb')
+            return self._crumb
 
         get_args = {
             'url': 'https://query2.finance.yahoo.com/v1/test/getcrumb',
@@ -365,10 +449,16 @@ class YfData(metaclass=SingletonMeta):
             return None
 
         utils.get_yf_logger().debug(f"crumb = '{self._crumb}'")
+        self._save_crumb()
         return self._crumb
 
     @utils.log_indent_decorator
     def _get_cookie_and_crumb(self, timeout=30):
+        # Lock-free once acquired, so concurrent requests don't serialize here
+        valid_crumb = self._valid_crumb
+        if valid_crumb is not None:
+            return valid_crumb
+
         crumb, strategy = None, None
 
         utils.get_yf_logger().debug(f"cookie_mode = '{self._cookie_strategy}'")
@@ -388,6 +478,8 @@ class YfData(metaclass=SingletonMeta):
                     self._set_cookie_strategy('csrf', have_lock=True)
                     crumb = self._get_crumb_csrf()
             strategy = self._cookie_strategy
+            if crumb is not None:
+                self._valid_crumb = (crumb, strategy)
         return crumb, strategy
 
     @utils.log_indent_decorator
@@ -457,10 +549,11 @@ class YfData(metaclass=SingletonMeta):
         utils.get_yf_logger().debug(f'response code={response.status_code}')
         if response.status_code >= 400:
             # Retry with other cookie strategy
+            crumb_rejected = response.status_code in (401, 403)
             if strategy == 'basic':
-                self._set_cookie_strategy('csrf')
+                self._set_cookie_strategy('csrf', crumb_rejected=crumb_rejected)
             else:
-                self._set_cookie_strategy('basic')
+                self._set_cookie_strategy('basic', crumb_rejected=crumb_rejected)
             crumb, strategy = self._get_cookie_and_crumb(timeout)
             request_args['params']['crumb'] = crumb
             response = request_method(**request_args)
@@ -474,8 +567,18 @@ class YfData(metaclass=SingletonMeta):
 
     @lru_cache_freezeargs
     @lru_cache(maxsize=cache_maxsize)
-    def cache_get(self, url, params=None, timeout=30):
-        return self.get(url, params, timeout)
+    def cache_get(self, url, params=None, timeout=30, shared=False):
+        # shared=True: response won't change (e.g. date range in past),
+        # so also share it via the remote cache backend, if one is set.
+        if shared:
+            entry = cache.get_response_cache().lookup(url, params)
+            if entry is not None:
+                utils.get_yf_logger().debug(f'reusing shared response for url={url}')
+                return _SharedResponse(*entry)
+        response = self.get(url, params, timeout)
+        if shared and response.status_code == 200:
+            cache.get_response_cache().store(url, params, str(response.url), response.content)
+        return response
 
     def get_raw_json(self, url, params=None, timeout=30):
         utils.get_yf_logger().debug(f'get_raw_json(): {url}')
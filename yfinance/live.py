@@ -1,8 +1,14 @@
 import asyncio
 import base64
 import json
+import struct
+import threading
+import time
 from typing import List, Optional, Callable, Union
 
+import numpy as np
+import pandas as pd
+
 from websockets.sync.client import connect as sync_connect
 from websockets.asyncio.client import connect as async_connect
 
@@ -12,14 +18,78 @@ from yfinance.pricing_pb2 import PricingData
 from google.protobuf.json_format import MessageToDict
 
 
+_RECORD_HEADER = struct.Struct('<dI')  # receive time (epoch seconds), frame length
+
+
+class LiveRecorder:
+    """
+    Append-only recording of raw base64 pricing frames.
+
+    Each record is the receive timestamp and the frame length, followed by
+    the frame bytes. Read back with ``read_recording``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'ab')
+        self._lock = threading.Lock()
+
+    def write(self, frame: str, timestamp: Optional[float] = None):
+        data = frame.encode('ascii')
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self._file.closed:
+                self._file = open(self.path, 'ab')
+            self._file.write(_RECORD_HEADER.pack(timestamp, len(data)))
+            self._file.write(data)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_recording(path: str):
+    """
+    Iterate over a recording made by ``LiveRecorder``.
+
+    Yields:
+        Tuple[float, str]: receive timestamp and raw base64 frame. A record
+        truncated by an interrupted write ends the iteration.
+    """
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            timestamp, length = _RECORD_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                return
+            yield timestamp, data.decode('ascii')
+
+
+def _replay_delays(path: str, speed: Optional[float]):
+    # Yield (seconds to wait, frame), preserving the recorded spacing divided by speed
+    previous = None
+    for timestamp, frame in read_recording(path):
+        delay = 0.0
+        if speed and previous is not None:
+            delay = max(timestamp - previous, 0.0) / speed
+        previous = timestamp
+        yield delay, frame
+
+
 class BaseWebSocket:
-    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True):
+    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True, record_to: Optional[str] = None):
         self.url = url
         self.verbose = verbose
         self.logger = utils.get_yf_logger()
         self._ws = None
         self._subscriptions = set()
         self._subscription_interval = 15  # seconds
+        self._recorder = LiveRecorder(record_to) if record_to else None
 
     def _decode_message(self, base64_message: str) -> dict:
         try:
@@ -44,15 +114,16 @@ class AsyncWebSocket(BaseWebSocket):
     Asynchronous WebSocket client for streaming real time pricing data.
     """
 
-    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True):
+    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True, record_to: Optional[str] = None):
         """
         Initialize the AsyncWebSocket client.
 
         Args:
             url (str): The WebSocket server URL. Defaults to Yahoo Finance's WebSocket URL.
             verbose (bool): Flag to enable or disable print statements. Defaults to True.
+            record_to (Optional[str]): Path of a file to append every received raw frame to, for ``replay``.
         """
-        super().__init__(url, verbose)
+        super().__init__(url, verbose, record_to)
         self._message_handler = None  # Callable to handle messages
         self._heartbeat_task = None  # Task to send heartbeat subscribe
 
@@ -160,22 +231,9 @@ class AsyncWebSocket(BaseWebSocket):
                 async for message in self._ws:
                     message_json = json.loads(message)
                     encoded_data = message_json.get("message", "")
-                    decoded_message = self._decode_message(encoded_data)
-
-                    if self._message_handler:
-                        try:
-                            if asyncio.iscoroutinefunction(self._message_handler):
-                                await self._message_handler(decoded_message)
-                            else:
-                                self._message_handler(decoded_message)
-                        except Exception as handler_exception:
-                            if not YfConfig.debug.hide_exceptions:
-                                raise
-                            self.logger.error("Error in message handler: %s", handler_exception, exc_info=True)
-                            if self.verbose:
-                                print("Error in message handler:", handler_exception)
-                    else:
-                        print(decoded_message)
+                    if self._recorder is not None:
+                        self._recorder.write(encoded_data)
+                    await self._handle_message(encoded_data)
 
             except (KeyboardInterrupt, asyncio.CancelledError):
                 self.logger.info("WebSocket listening interrupted. Closing connection...")
@@ -198,11 +256,48 @@ class AsyncWebSocket(BaseWebSocket):
                 await asyncio.sleep(3)  # backoff
                 await self._connect()
 
+    async def _handle_message(self, encoded_data: str):
+        decoded_message = self._decode_message(encoded_data)
+
+        if self._message_handler is not None:
+            try:
+                if asyncio.iscoroutinefunction(self._message_handler):
+                    await self._message_handler(decoded_message)
+                else:
+                    self._message_handler(decoded_message)
+            except Exception as handler_exception:
+                if not YfConfig.debug.hide_exceptions:
+                    raise
+                self.logger.error("Error in message handler: %s", handler_exception, exc_info=True)
+                if self.verbose:
+                    print("Error in message handler:", handler_exception)
+        else:
+            print(decoded_message)
+
+    async def replay(self, path: str, message_handler=None, speed: Optional[float] = 1.0):
+        """
+        Replay a recording through the same handler path as ``listen``, without a network.
+
+        Args:
+            path (str): Recording made with ``record_to``.
+            message_handler (Optional[Callable[[dict], None]]): Optional function to handle replayed messages.
+            speed (Optional[float]): Playback speed relative to the recorded spacing.
+                None or 0 replays as fast as possible.
+        """
+        self._message_handler = message_handler
+        for delay, frame in _replay_delays(path, speed):
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._handle_message(frame)
+
     async def close(self):
         """Close the WebSocket connection."""
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
 
+        if self._recorder is not None:
+            self._recorder.close()
+
         if self._ws is not None:  # and not self._ws.closed:
             await self._ws.close()
             self.logger.info("WebSocket connection closed.")
@@ -222,15 +317,16 @@ class WebSocket(BaseWebSocket):
     Synchronous WebSocket client for streaming real time pricing data.
     """
 
-    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True):
+    def __init__(self, url: str = "wss://streamer.finance.yahoo.com/?version=2", verbose=True, record_to: Optional[str] = None):
         """
         Initialize the WebSocket client.
 
         Args:
             url (str): The WebSocket server URL. Defaults to Yahoo Finance's WebSocket URL.
             verbose (bool): Flag to enable or disable print statements. Defaults to True.
+            record_to (Optional[str]): Path of a file to append every received raw frame to, for ``replay``.
         """
-        super().__init__(url, verbose)
+        super().__init__(url, verbose, record_to)
 
     def _connect(self):
         try:
@@ -306,19 +402,9 @@ class WebSocket(BaseWebSocket):
                 message = self._ws.recv()
                 message_json = json.loads(message)
                 encoded_data = message_json.get("message", "")
-                decoded_message = self._decode_message(encoded_data)
-
-                if message_handler:
-                    try:
-                        message_handler(decoded_message)
-                    except Exception as handler_exception:
-                        if not YfConfig.debug.hide_exceptions:
-                            raise
-                        self.logger.error("Error in message handler: %s", handler_exception, exc_info=True)
-                        if self.verbose:
-                            print("Error in message handler:", handler_exception)
-                else:
-                    print(decoded_message)
+                if self._recorder is not None:
+                    self._recorder.write(encoded_data)
+                self._handle_message(encoded_data, message_handler)
 
             except KeyboardInterrupt:
                 if self.verbose:
@@ -334,8 +420,41 @@ class WebSocket(BaseWebSocket):
                     print("Error while listening to messages: %s", e)
                 break
 
+    def _handle_message(self, encoded_data: str, message_handler: Optional[Callable[[dict], None]]):
+        decoded_message = self._decode_message(encoded_data)
+
+        if message_handler is not None:
+            try:
+                message_handler(decoded_message)
+            except Exception as handler_exception:
+                if not YfConfig.debug.hide_exceptions:
+                    raise
+                self.logger.error("Error in message handler: %s", handler_exception, exc_info=True)
+                if self.verbose:
+                    print("Error in message handler:", handler_exception)
+        else:
+            print(decoded_message)
+
+    def replay(self, path: str, message_handler: Optional[Callable[[dict], None]] = None, speed: Optional[float] = 1.0):
+        """
+        Replay a recording through the same handler path as ``listen``, without a network.
+
+        Args:
+            path (str): Recording made with ``record_to``.
+            message_handler (Optional[Callable[[dict], None]]): Optional function to handle replayed messages.
+            speed (Optional[float]): Playback speed relative to the recorded spacing.
+                None or 0 replays as fast as possible.
+        """
+        for delay, frame in _replay_delays(path, speed):
+            if delay > 0:
+                time.sleep(delay)
+            self._handle_message(frame, message_handler)
+
     def close(self):
         """Close the WebSocket connection."""
+        if self._recorder is not None:
+            self._recorder.close()
+
         if self._ws is not None:
             self._ws.close()
             self.logger.info("WebSocket connection closed.")
@@ -348,3 +467,122 @@ class WebSocket(BaseWebSocket):
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.close()
+
+
+class LiveQuoteBook:
+    """
+    Symbol-indexed table of the latest streamed quote values.
+
+    Values are held in one columnar float64 array and updated in place for
+    every tick, so reading a quote never touches the network. Pass the book
+    (or its ``update`` method) as the ``message_handler`` of a
+    ``WebSocket``/``AsyncWebSocket``.
+    """
+
+    fields = ('price', 'bid', 'ask', 'day_volume', 'change', 'change_percent', 'time')
+
+    def __init__(self, symbols: Optional[List[str]] = None, capacity: int = 64):
+        """
+        Initialize the quote book.
+
+        Args:
+            symbols (Optional[List[str]]): Symbols to reserve rows for up front.
+            capacity (int): Initial number of rows allocated. Grows as needed.
+        """
+        self._field_pos = {f: i for i, f in enumerate(self.fields)}
+        self._rows = {}
+        self._symbols = []
+        self._values = np.full((max(int(capacity), 1), len(self.fields)), np.nan)
+        self._lock = threading.Lock()
+        if symbols:
+            with self._lock:
+                for symbol in symbols:
+                    self._row(symbol)
+
+    def _row(self, symbol: str) -> int:
+        # Caller must hold self._lock
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row == self._values.shape[0]:
+                grown = np.full((row * 2, len(self.fields)), np.nan)
+                grown[:row] = self._values
+                self._values = grown
+            self._rows[symbol] = row
+            self._symbols.append(symbol)
+        return row
+
+    def update(self, message: dict):
+        """
+        Apply one decoded pricing message to the book.
+
+        Fields absent from the message keep their previous value.
+
+        Args:
+            message (dict): Message as produced by ``_decode_message``.
+        """
+        symbol = message.get('id')
+        if not symbol:
+            return
+        with self._lock:
+            row = self._row(symbol)
+            values = self._values[row]
+            for field, pos in self._field_pos.items():
+                v = message.get(field)
+                if v is not None:
+                    values[pos] = float(v)
+
+    __call__ = update
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def __bool__(self):
+        # An empty book is still a valid message handler
+        return True
+
+    def __contains__(self, symbol):
+        return symbol in self._rows
+
+    def __getitem__(self, symbol: str) -> dict:
+        with self._lock:
+            values = self._values[self._rows[symbol]].tolist()
+        return dict(zip(self.fields, values))
+
+    def get(self, symbol: str, field: str, default=None):
+        """Return the latest value of ``field`` for ``symbol``, or ``default`` if unknown."""
+        row = self._rows.get(symbol)
+        if row is None:
+            return default
+        v = self._values[row, self._field_pos[field]]
+        return default if np.isnan(v) else v
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def to_numpy(self, copy: bool = False) -> np.ndarray:
+        """
+        Return the table as a 2-D array, one row per symbol in ``symbols`` order.
+
+        Without ``copy`` the result is a view that keeps tracking updates, until
+        a new symbol forces the table to grow.
+        """
+        with self._lock:
+            values = self._values[:len(self._symbols)]
+            return values.copy() if copy else values
+
+    def snapshot(self, copy: bool = True) -> pd.DataFrame:
+        """
+        Return the table as a DataFrame indexed by symbol.
+
+        Args:
+            copy (bool): If False, the DataFrame shares memory with the book
+                instead of copying it. ``time`` is epoch milliseconds.
+        """
+        with self._lock:
+            values = self._values[:len(self._symbols)]
+            if copy:
+                values = values.copy()
+            symbols = list(self._symbols)
+        return pd.DataFrame(values, index=pd.Index(symbols, name='Symbol'), columns=list(self.fields), copy=False)
@@ -25,14 +25,15 @@ import logging
 import threading
 import time as _time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
 import multitasking as _multitasking
 import pandas as _pd
 import numpy as _np
-from ._http import new_session
+from ._http import new_session, size_pool
 
-from . import Ticker, utils
+from . import Ticker, cache, utils
 from .data import YfData
 from .config import YfConfig
 from .const import period_default
@@ -159,10 +160,17 @@ def _download_impl(ctx, tickers, start=None, end=None, actions=False, threads=Tr
     if progress:
         ctx.progress_bar = utils.ProgressBar(len(tickers), 'completed')
 
+    # Load cached timezones in one query, instead of each thread querying SQLite.
+    # No more than memory holds, else the prefetch evicts its own entries.
+    tz_cache = cache.get_tz_cache()
+    tz_cache.lookup_many(tickers[:tz_cache.max_entries])
+
     if threads:
         if threads is True:
             threads = min([len(tickers), _multitasking.cpu_count() * 2])
         _multitasking.set_max_threads(threads)
+        # Else threads wait for, or churn, pooled connections
+        size_pool(session, threads)
         for i, ticker in enumerate(tickers):
             _download_one_threaded(ctx, ticker, period=period, interval=interval,
                                    start=start, end=end, prepost=prepost,
@@ -304,3 +312,97 @@ def _download_one(ctx, ticker, start=None, end=None,
     YfConfig.network.hide_exceptions = backup
 
     return data
+
+
+_PRETTY_ACRONYMS = {'income': ["EBIT", "EBITDA", "EPS", "NI"], 'balance-sheet': ["PPE"], 'cash-flow': ["PPE"]}
+
+
+@utils.log_indent_decorator
+def download_financials(tickers, statements=('income', 'balance-sheet', 'cash-flow'),
+                        freqs=('yearly', 'quarterly'), threads=True, pretty=False,
+                        session=None) -> _pd.DataFrame:
+    """
+    Download financial statements of many tickers, as one long table.
+    Each ticker's statements are fetched together, in as few requests
+    as URL length allows, and tickers are fetched concurrently.
+    :Parameters:
+        tickers : str, list
+            List of tickers to download
+        statements : str, list
+            Any of 'income', 'balance-sheet', 'cash-flow'. Default is all
+        freqs : str, list
+            Any of 'yearly', 'quarterly', 'trailing'. Default is 'yearly' and 'quarterly'.
+            'trailing' is skipped for 'balance-sheet', because Yahoo doesn't have it.
+        threads: bool / int
+            How many tickers to fetch concurrently. Default is True
+        pretty: bool
+            Format item names like Ticker.income_stmt does. Default is False
+        session: None or Session
+            Optional. Pass your own session object to be used for all requests
+    :Returns:
+        DataFrame with columns ticker, statement, freq, item, period_end, value.
+        One row per reported value.
+    """
+    logger = utils.get_yf_logger()
+    session = session or new_session()
+
+    YfData(session=session)
+
+    if isinstance(statements, str):
+        statements = [statements]
+    if isinstance(freqs, str):
+        freqs = [freqs]
+    tickers = tickers if isinstance(
+        tickers, (list, set, tuple)) else tickers.replace(',', ' ').split()
+    tickers = list(dict.fromkeys(t.upper() for t in tickers))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # multi-threaded log messages would interleave; serialize.
+        threads = False
+    if threads is True:
+        threads = min([len(tickers), _multitasking.cpu_count() * 2])
+    threads = max(int(threads or 1), 1)
+    size_pool(session, threads)
+
+    def fetch(ticker):
+        return Ticker(ticker, session=session)._fundamentals.financials._fetch_time_series_many(statements, freqs)
+
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [(t, executor.submit(fetch, t)) for t in tickers]
+        for ticker, future in futures:
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                if not YfConfig.debug.hide_exceptions:
+                    raise
+                errors[ticker] = repr(e)
+
+    if errors:
+        logger.error('\n%.f Failed download%s:' % (
+            len(errors), 's' if len(errors) > 1 else ''))
+        grouped = {}
+        for ticker, err in errors.items():
+            grouped.setdefault(err, []).append(ticker)
+        for err, syms in grouped.items():
+            logger.error(f'{syms}: ' + err)
+
+    columns = ['ticker', 'statement', 'freq', 'item', 'period_end', 'value']
+    frames = []
+    for ticker in tickers:
+        for (statement, freq), df in results.get(ticker, {}).items():
+            if df.empty:
+                continue
+            if pretty:
+                df = df.copy()
+                df.index = utils.camel2title(df.index, sep=' ', acronyms=_PRETTY_ACRONYMS[statement])
+            values = df.rename_axis(index='item', columns='period_end').stack()
+            df = values[values.notna()].rename('value').reset_index()
+            df.insert(0, 'ticker', ticker)
+            df.insert(1, 'statement', statement)
+            df.insert(2, 'freq', freq)
+            frames.append(df)
+    if not frames:
+        return _pd.DataFrame(columns=columns)
+    return _pd.concat(frames, ignore_index=True)[columns]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# yfinance - market data downloader
+# https://github.com/ranaroussi/yfinance
+#
+# Copyright 2017-2019 Ran Aroussi
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import numpy as np
+import pandas as pd
+
+from .const import _PRICE_COLNAMES_
+from .data import YfData
+from .scrapers.history import PriceHistory
+
+_REPAIR_INTERVALS = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d"]
+
+
+def _localize_index(df, interval, tz):
+    if df.index.tz is None:
+        if interval[-1] in ('m', 'h'):
+            df.index = df.index.tz_localize(tz)
+        else:
+            df.index = df.index.tz_localize(tz, ambiguous=True, nonexistent='shift_forward')
+    else:
+        df.index = df.index.tz_convert(tz)
+    return df
+
+
+def repair(df, symbol, interval, currency, tz, fetcher=None, prepost=False, session=None) -> pd.DataFrame:
+    """
+    Run yfinance's price repair on price data you already have,
+    e.g. raw Yahoo bars stored locally. Same repairs as ``history(repair=True)``.
+
+    :Parameters:
+        df : DataFrame
+            | Unadjusted prices as returned by ``history(auto_adjust=False, actions=True)``:
+            | Open, High, Low, Close, Adj Close, Volume, Dividends, Stock Splits, [Capital Gains].
+            | Missing event columns are treated as no events.
+        symbol : str
+            Ticker symbol, e.g. 'GLEN.L'
+        interval : str
+            | Interval of df: 1m,2m,5m,15m,30m,60m,90m,1h,1d
+            | For multiday intervals, repair daily data then resample.
+        currency : str
+            Quotation currency of prices, e.g. 'GBp'
+        tz : str
+            Exchange timezone, e.g. 'Europe/London'. A tz-naive index is assumed to be in it.
+        fetcher : None or callable
+            | Optional. Supplies finer-grain prices to reconstruct bad bars:
+            | ``fetcher(symbol, start, end, interval, prepost) -> DataFrame``
+            | with the same columns as df, ``end`` exclusive. Return None or empty if unavailable.
+            | Default: fetch from Yahoo
+        prepost : bool
+            Does df include Pre and Post market data? Default is False
+        session : None or Session
+            Optional. Session for the default Yahoo fetcher
+    :Returns:
+        DataFrame with column 'Repaired?' added. Not adjusted, apply your own auto-adjust.
+    """
+    if interval not in _REPAIR_INTERVALS:
+        raise ValueError(f"repair() does not support interval '{interval}', repair daily data then resample")
+    if df is None or df.empty:
+        return df
+    missing = [c for c in _PRICE_COLNAMES_ + ['Volume'] if c not in df.columns]
+    if missing:
+        raise ValueError(f"repair() requires unadjusted prices, missing columns: {missing}")
+
+    df = df.copy()
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index)
+    df = _localize_index(df, interval, tz)
+    df = df[~df.index.duplicated(keep='first')]
+    for c in ['Dividends', 'Stock Splits']:
+        if c not in df.columns:
+            df[c] = 0.0
+        else:
+            df[c] = df[c].fillna(0)
+    if 'Capital Gains' in df.columns:
+        df['Capital Gains'] = df['Capital Gains'].fillna(0)
+
+    hist = PriceHistory(YfData(session=session), symbol, tz)
+    # Repairs only need these from Yahoo's metadata. Without a live price,
+    # sub-unit currencies (e.g. GBp) are assumed quoted in sub-units.
+    hist._history_metadata = {'currency': currency,
+                              'exchangeTimezoneName': tz,
+                              'regularMarketPrice': np.nan}
+    if fetcher is not None:
+        def _fetch(ticker, start, end, sub_interval, fetch_prepost):
+            df_fine = fetcher(symbol, start, end, sub_interval, fetch_prepost)
+            if df_fine is None or df_fine.empty:
+                return None
+            df_fine = _localize_index(df_fine.copy(), sub_interval, tz)
+            for c in ['Dividends', 'Stock Splits']:
+                if c not in df_fine.columns:
+                    df_fine[c] = 0.0
+            if 'Repaired?' not in df_fine.columns:
+                df_fine['Repaired?'] = False
+            return df_fine.sort_index()
+        hist._repair_fetcher = _fetch
+
+    df = hist._repair_prices(df, interval, tz, prepost, currency)
+    df.index.name = 'Datetime' if interval[-1] in ('m', 'h') else 'Date'
+    return df
@@ -6,13 +6,14 @@ from yfinance.config import YfConfig
 from yfinance.const import quote_summary_valid_modules
 from yfinance.data import YfData
 from yfinance.exceptions import YFException
-from yfinance.scrapers.quote import _QUOTE_SUMMARY_URL_
+from yfinance.scrapers.quote import QuoteSummary
 
 class Analysis:
 
-    def __init__(self, data: YfData, symbol: str):
+    def __init__(self, data: YfData, symbol: str, quote_summary: QuoteSummary = None):
         self._data = data
         self._symbol = symbol
+        self._quote_summary = QuoteSummary(data, symbol) if quote_summary is None else quote_summary
 
         # In quoteSummary the 'earningsTrend' module contains most of the data below.
         # The format of data is not optimal so each function will process it's part of the data.
@@ -181,12 +182,11 @@ class Analysis:
         if not isinstance(modules, list):
             raise YFException("Should provide a list of modules, see available modules using `valid_modules`")
 
-        modules = ','.join([m for m in modules if m in quote_summary_valid_modules])
+        modules = [m for m in modules if m in quote_summary_valid_modules]
         if len(modules) == 0:
             raise YFException("No valid modules provided, see available modules using `valid_modules`")
-        params_dict = {"modules": modules, "corsDomain": "finance.yahoo.com", "formatted": "false", "symbol": self._symbol}
         try:
-            result = self._data.get_raw_json(_QUOTE_SUMMARY_URL_ + f"/{self._symbol}", params=params_dict)
+            result = self._quote_summary.get(modules)
         except HTTPError as e:
             if not YfConfig.debug.hide_exceptions:
                 raise
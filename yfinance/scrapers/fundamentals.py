@@ -1,10 +1,12 @@
 import datetime
 import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 
-from yfinance import utils, const
+from yfinance import cache, utils, const
 from yfinance.config import YfConfig
 from yfinance.data import YfData
 from yfinance.exceptions import YFException, YFNotImplementedError
@@ -83,10 +85,15 @@ class Financials:
             raise ValueError("Illegal argument: frequency 'trailing'" +
                              " only available for cash-flow or income data.")
 
+        statement = self._stored(name, timescale)
+        if statement is not None:
+            return statement
+
         try:
             statement = self._create_financials_table(name, timescale)
 
             if statement is not None:
+                self._store(name, timescale, statement)
                 return statement
         except YFException as e:
             if not YfConfig.debug.hide_exceptions:
@@ -94,6 +101,104 @@ class Financials:
             utils.get_yf_logger().error(f"{self._symbol}: Failed to create {name} financials table for reason: {e}")
         return pd.DataFrame()
 
+    def _fetch_time_series_many(self, names, timescales) -> dict:
+        """
+        Fetch every combination of statement names and timescales together.
+        Combinations Yahoo doesn't have (trailing balance-sheet) are skipped.
+        :return: {(name, timescale): DataFrame}
+        """
+        allowed_names = ["income", "balance-sheet", "cash-flow"]
+        allowed_timescales = ["yearly", "quarterly", "trailing"]
+        for name in names:
+            if name not in allowed_names:
+                raise ValueError(f"Illegal argument: name must be one of: {allowed_names}")
+        for timescale in timescales:
+            if timescale not in allowed_timescales:
+                raise ValueError(f"Illegal argument: timescale must be one of: {allowed_timescales}")
+
+        return self._get_financials_time_series_many(self._statements(names, timescales))
+
+    @staticmethod
+    def _statements(names, timescales) -> dict:
+        statements = {}
+        for name in names:
+            # Yahoo stores the 'income' table internally under 'financials' key
+            keys = const.fundamentals_keys["financials" if name == "income" else name]
+            for timescale in timescales:
+                if timescale == "trailing" and name not in ('income', 'cash-flow'):
+                    continue
+                statements[(name, timescale)] = keys
+        return statements
+
+    @utils.log_indent_decorator
+    def _fetch_all(self, timescale, extra_types: list = ()):
+        """
+        Fetch every statement at `timescale` plus `extra_types` together,
+        filling the per-statement caches.
+        :return: raw results of `extra_types`, or None if the fetch failed
+        """
+        allowed_timescales = ["yearly", "quarterly", "trailing"]
+        if timescale not in allowed_timescales:
+            raise ValueError(f"Illegal argument: timescale must be one of: {allowed_timescales}")
+
+        caches = {"income": self._income_time_series,
+                  "balance-sheet": self._balance_sheet_time_series,
+                  "cash-flow": self._cash_flow_time_series}
+        statements = self._statements(list(caches), [timescale])
+        try:
+            tables, extra = self._get_financials_time_series_with(statements, extra_types)
+        except Exception as e:
+            if not YfConfig.debug.hide_exceptions:
+                raise
+            utils.get_yf_logger().error(f"{self._symbol}: Failed to fetch {timescale} financials for reason: {e}")
+            tables, extra = {}, None
+        for (name, _), table in tables.items():
+            caches[name][timescale] = table
+        for key in statements:
+            caches[key[0]].setdefault(timescale, pd.DataFrame())
+        return extra
+
+    def get_stored_time_series(self, name, freq="yearly", as_of=None) -> pd.DataFrame:
+        """
+        Statement from the fundamentals store as it was on date `as_of`,
+        without any request. Empty if nothing was stored by then.
+        """
+        allowed_names = ["income", "balance-sheet", "cash-flow"]
+        if name not in allowed_names:
+            raise ValueError(f"Illegal argument: name must be one of: {allowed_names}")
+        df = cache.get_fundamentals_store().lookup(self._symbol, name, freq, as_of)
+        if df is None:
+            return pd.DataFrame()
+        return self._order_table(df, name, freq)
+
+    def _stored(self, name, timescale):
+        # Statement from the fundamentals store, unless a new report is due since fetched
+        if not YfConfig.cache.fundamentals:
+            return None
+        store = cache.get_fundamentals_store()
+        if store.is_stale(self._symbol, name, timescale):
+            return None
+        df = store.lookup(self._symbol, name, timescale)
+        if df is None:
+            return None
+        return self._order_table(df, name, timescale)
+
+    def _store(self, name, timescale, df):
+        if YfConfig.cache.fundamentals and not df.empty:
+            cache.get_fundamentals_store().store(self._symbol, name, timescale, df)
+
+    @staticmethod
+    def _order_table(df, name, timescale):
+        # Reorder table to match order on Yahoo website
+        keys = const.fundamentals_keys["financials" if name == "income" else name]
+        df = df.reindex([k for k in keys if k in df.index])
+        df = df[sorted(df.columns, reverse=True)]
+
+        # Trailing 12 months return only the first column.
+        if (timescale == "trailing") and len(df.columns) > 0:
+            df = df.iloc[:, [0]]
+        return df
+
     def _create_financials_table(self, name, timescale):
         if name == "income":
             # Yahoo stores the 'income' table internally under 'financials' key
@@ -112,18 +217,95 @@ class Financials:
     # prefix, which keeps it below the practical limits of typical NAT / proxy
     # paths (notably WSL2, which silently drops the long single-shot URL).
     _CHUNK_KEYS = 60
+    _CHUNK_MAX_WORKERS = 4  # concurrent chunk requests
+    # Types of several statements can share one URL, as long as it's no
+    # longer than the longest single-statement URL
+    _MAX_TYPES_LEN = max(len(",".join(["quarterly" + k for k in keys])) for keys in const.fundamentals_keys.values())
 
-    def _get_financials_time_series(self, timescale, keys: list) -> pd.DataFrame:
-        timescale_translation = {"yearly": "annual", "quarterly": "quarterly", "trailing": "trailing"}
-        timescale = timescale_translation[timescale]
+    _TIMESCALE_TRANSLATION = {"yearly": "annual", "quarterly": "quarterly", "trailing": "trailing"}
 
+    def _get_financials_time_series(self, timescale, keys: list) -> pd.DataFrame:
+        timescale = self._TIMESCALE_TRANSLATION[timescale]
+        data_raw = self._fetch_types([timescale + k for k in keys])
+        return self._parse_financials_time_series(data_raw, timescale, keys)
+
+    def _get_financials_time_series_many(self, statements: dict) -> dict:
+        """
+        Fetch several statements together, in as few requests as URL length allows.
+        :param statements: {(name, timescale): keys}
+        :return: {(name, timescale): DataFrame}
+        """
+        tables, _ = self._get_financials_time_series_with(statements)
+        return tables
+
+    def _get_financials_time_series_with(self, statements: dict, extra_types: list = ()) -> tuple:
+        """
+        Like _get_financials_time_series_many, but also fetch `extra_types`
+        (e.g. valuation measures) in the same requests.
+        :return: ({(name, timescale): DataFrame}, [raw results of extra_types])
+        """
+        order = list(statements)
+        tables = {}
+        for name, timescale in statements:
+            statement = self._stored(name, timescale)
+            if statement is not None:
+                tables[(name, timescale)] = statement
+        statements = {key: keys for key, keys in statements.items() if key not in tables}
+        if not statements and not extra_types:
+            return tables, []
+
+        types = {}  # type -> [(name, timescale)], ordered
+        for (name, timescale), keys in statements.items():
+            prefix = self._TIMESCALE_TRANSLATION[timescale]
+            for k in keys:
+                types.setdefault(prefix + k, []).append((name, timescale))
+        for t in extra_types:
+            types.setdefault(t, [])
+
+        data_raw = []
+        for pack in self._pack_types(list(types)):
+            data_raw.extend(self._fetch_types(pack))
+
+        grouped = {key: [] for key in statements}
+        extra_types = set(extra_types)
+        extra = []
+        for x in data_raw:
+            type_name = (x.get("meta", {}).get("type") or [None])[0]
+            for key in types.get(type_name, []):
+                grouped[key].append(x)
+            if type_name in extra_types:
+                extra.append(x)
+
+        for (name, timescale), keys in statements.items():
+            raw = grouped[(name, timescale)]
+            if not raw:
+                tables[(name, timescale)] = pd.DataFrame()
+                continue
+            tables[(name, timescale)] = self._parse_financials_time_series(
+                raw, self._TIMESCALE_TRANSLATION[timescale], keys)
+            self._store(name, timescale, tables[(name, timescale)])
+        return {key: tables[key] for key in order}, extra
+
+    def _pack_types(self, types: list) -> list:
+        # Split types into lists that each fit one URL
+        packs = [[]]
+        length = 0
+        for t in types:
+            if packs[-1] and length + 1 + len(t) > self._MAX_TYPES_LEN:
+                packs.append([])
+                length = 0
+            length += len(t) + (1 if packs[-1] else 0)
+            packs[-1].append(t)
+        return packs
+
+    def _fetch_types(self, types: list) -> list:
         # Yahoo returns maximum 4 years or 5 quarters, regardless of start_dt:
         start_dt = datetime.datetime(2016, 12, 31)
         end = pd.Timestamp.now('UTC').ceil("D")
         period_qs = f"&period1={int(start_dt.timestamp())}&period2={int(end.timestamp())}"
 
         ts_url_base = f"https://query2.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/{self._symbol}?symbol={self._symbol}"
-        full_url = ts_url_base + "&type=" + ",".join([timescale + k for k in keys]) + period_qs
+        full_url = ts_url_base + "&type=" + ",".join(types) + period_qs
 
         # Fast path: single long URL. Falls back to chunked requests if it
         # fails (silent drop on WSL2 NAT / restrictive proxies). Sticky so a
@@ -131,66 +313,101 @@ class Financials:
         # fallback also fails, URL length isn't the problem — revert the flag
         # and re-raise so the next call retries the fast path.
         if self._data.fundamentals_use_chunked:
-            data_raw = self._fetch_fundamentals_chunked(ts_url_base, timescale, keys, period_qs)
+            data_raw, failed, error = self._fetch_fundamentals_chunked(ts_url_base, types, period_qs)
         else:
             try:
-                data_raw = self._fetch_fundamentals_payload(full_url)
+                return self._fetch_fundamentals_payload(full_url)
             except Exception as e:
                 utils.get_yf_logger().debug(
                     f"{self._symbol}: single-URL fundamentals fetch failed ({type(e).__name__}); "
                     f"falling back to chunked requests for this and subsequent fetches"
                 )
-                self._data.fundamentals_use_chunked = True
-                try:
-                    data_raw = self._fetch_fundamentals_chunked(ts_url_base, timescale, keys, period_qs)
-                except Exception:
-                    self._data.fundamentals_use_chunked = False
-                    raise
-
-        for d in data_raw:
-            d.pop("meta", None)
-
-        # Now reshape data into a table:
-        # Step 1: get columns and index:
+            self._data.fundamentals_use_chunked = True
+            try:
+                data_raw, failed, error = self._fetch_fundamentals_chunked(ts_url_base, types, period_qs)
+            except Exception:
+                self._data.fundamentals_use_chunked = False
+                raise
+
+        # Some chunks failed: keep the rest rather than lose the whole statement
+        if failed:
+            msg = f"{self._symbol}: Failed to fetch {len(failed)} of {len(types)} fundamentals types ({error}): {', '.join(failed)}"
+            if not YfConfig.debug.hide_exceptions:
+                raise YFException(msg)
+            utils.get_yf_logger().error(msg)
+        return data_raw
+
+    def _parse_financials_time_series(self, data_raw: list, timescale: str, keys: list) -> pd.DataFrame:
+        # Reshape data into a table in one pass: collect (item, asOfDate, value)
+        # triplets, then scatter them into a float array
         timestamps = set()
         data_unpacked = {}
         for x in data_raw:
-            for k in x.keys():
+            for k, v in x.items():
                 if k == "timestamp":
-                    timestamps.update(x[k])
-                else:
-                    data_unpacked[k] = x[k]
-        timestamps = sorted(list(timestamps))
-        dates = pd.to_datetime(timestamps, unit="s")
-        df = pd.DataFrame(columns=dates, index=list(data_unpacked.keys()))
-        for k, v in data_unpacked.items():
-            if df is None:
-                df = pd.DataFrame(columns=dates, index=[k])
-            df.loc[k] = {pd.Timestamp(x["asOfDate"]): x["reportedValue"]["raw"] for x in v}
-
+                    timestamps.update(v)
+                elif k != "meta":
+                    data_unpacked[k] = v
+        dates = pd.to_datetime(sorted(timestamps), unit="s")
+        items = list(data_unpacked.keys())
+
+        rows, as_of, values = [], [], []
+        for i, points in enumerate(data_unpacked.values()):
+            for x in points:
+                if x:
+                    rows.append(i)
+                    as_of.append(x["asOfDate"])
+                    values.append(x["reportedValue"]["raw"])
+        table = np.full((len(items), len(dates)), np.nan)
+        if rows:
+            cols = dates.get_indexer(pd.to_datetime(as_of))
+            found = cols >= 0
+            table[np.asarray(rows)[found], cols[found]] = np.asarray(values, dtype=float)[found]
+
+        df = pd.DataFrame(table, index=items, columns=dates)
         df.index = df.index.str.replace("^" + timescale, "", regex=True)
 
-        # Ensure float type, not object
-        for d in df.columns:
-            df[d] = df[d].astype('float')
-
         # Reorder table to match order on Yahoo website
         df = df.reindex([k for k in keys if k in df.index])
         df = df[sorted(df.columns, reverse=True)]
 
         # Trailing 12 months return only the first column.
-        if (timescale == "trailing"):
+        if (timescale == "trailing") and len(df.columns) > 0:
             df = df.iloc[:, [0]]
 
         return df
 
-    def _fetch_fundamentals_chunked(self, ts_url_base: str, timescale: str, keys: list, period_qs: str) -> list:
+    def _fetch_fundamentals_chunked(self, ts_url_base: str, types: list, period_qs: str) -> tuple:
+        """Fetch types in chunks of _CHUNK_KEYS, concurrently. Raises only if
+        every chunk fails.
+        :return: (merged result list in request order, types that failed, first error)"""
+        chunks = [types[i:i + self._CHUNK_KEYS] for i in range(0, len(types), self._CHUNK_KEYS)]
+        urls = [ts_url_base + "&type=" + ",".join(chunk) + period_qs for chunk in chunks]
+
+        def _fetch(url):
+            try:
+                return self._fetch_fundamentals_payload(url), None
+            except Exception as e:
+                return None, e
+
+        if len(urls) == 1:
+            results = [_fetch(urls[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(urls), self._CHUNK_MAX_WORKERS)) as executor:
+                results = list(executor.map(_fetch, urls))
+
+        errors = [e for _, e in results if e is not None]
+        if len(errors) == len(results):
+            raise errors[0]
+
         data_raw: list = []
-        for i in range(0, len(keys), self._CHUNK_KEYS):
-            chunk = keys[i:i + self._CHUNK_KEYS]
-            chunk_url = ts_url_base + "&type=" + ",".join([timescale + k for k in chunk]) + period_qs
-            data_raw.extend(self._fetch_fundamentals_payload(chunk_url))
-        return data_raw
+        failed = []
+        for chunk, (result, e) in zip(chunks, results):
+            if e is None:
+                data_raw.extend(result)
+            else:
+                failed.extend(chunk)
+        return data_raw, failed, errors[0] if errors else None
 
     def _fetch_fundamentals_payload(self, url: str) -> list:
         """Fetch a fundamentals-timeseries URL and return the parsed `result`
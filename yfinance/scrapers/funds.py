@@ -3,11 +3,9 @@ from typing import Dict, Optional
 
 from yfinance import utils
 from yfinance.config import YfConfig
-from yfinance.const import _BASE_URL_
 from yfinance.data import YfData
 from yfinance.exceptions import YFDataException
-
-_QUOTE_SUMMARY_URL_ = f"{_BASE_URL_}/v10/finance/quoteSummary/"
+from yfinance.scrapers.quote import QuoteSummary
 
 class FundsData:
     """
@@ -17,14 +15,18 @@ class FundsData:
     Notes: 
     - fundPerformance module is not implemented as better data is queryable using history
     """
-    def __init__(self, data: YfData, symbol: str):
+    _MODULES = ["quoteType", "summaryProfile", "topHoldings", "fundProfile"]
+
+    def __init__(self, data: YfData, symbol: str, quote_summary: QuoteSummary = None):
         """
         Args:
             data (YfData): The YfData object for fetching data.
             symbol (str): The symbol of the fund.
+            quote_summary (QuoteSummary): Modules shared with other scrapers of the Ticker.
         """
         self._data = data
         self._symbol = symbol
+        self._quote_summary = QuoteSummary(data, symbol) if quote_summary is None else quote_summary
         
         # quoteType
         self._quote_type = None
@@ -170,10 +172,7 @@ class FundsData:
         Returns:
             dict: The raw JSON data.
         """
-        modules = ','.join(["quoteType", "summaryProfile", "topHoldings", "fundProfile"])
-        params_dict = {"modules": modules, "corsDomain": "finance.yahoo.com", "symbol": self._symbol, "formatted": "false"}
-        result = self._data.get_raw_json(_QUOTE_SUMMARY_URL_+self._symbol, params=params_dict)
-        return result
+        return self._quote_summary.get(self._MODULES)
 
     def _fetch_and_parse(self) -> None:
         """
@@ -1,21 +1,93 @@
 from yfinance._http import new_session
 from math import isclose
-import bisect
+from concurrent.futures import ThreadPoolExecutor
 import datetime as _datetime
 import dateutil as _dateutil
 import logging
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
+import threading
 import time as _time
 import warnings
 
-from yfinance import utils
+from yfinance import cache, utils
 from yfinance.config import YfConfig
 from yfinance.const import _BASE_URL_, _PRICE_COLNAMES_, period_default, _SENTINEL_
 from yfinance.exceptions import YFDataException, YFInvalidPeriodError, YFPricesMissingError, YFRateLimitError, YFTzMissingError
 
 _CURRENCY_CONVERSIONS = {'GBp': 0.01, 'ZAc': 0.01, 'ILA': 0.01}  # GBp = pence, ZAc = South African cents, ILA = Israeli agorot
+_RECONSTRUCT_MAX_WORKERS = 4  # concurrent finer-grain fetches when reconstructing prices
+_REPAIR_INCREMENTAL_LOOKBACK = 250  # bars before appended data re-examined by incremental repair
+_SUDDEN_CHANGE_VOLUME_MARGIN = 10  # bars beyond the appended data where volume denoising may differ
+
+
+class _RepairWindowInvalid(Exception):
+    # Incremental repair window can't be judged in isolation, repair full history instead
+    pass
+
+
+_quiet_logging = threading.local()  # active = drop this thread's log records below CRITICAL
+
+
+class _QuietLogFilter(logging.Filter):
+    # Per-thread alternative to logger.setLevel(), which would also
+    # silence (or restore too early for) other threads logging concurrently.
+    def filter(self, record):
+        return record.levelno >= logging.CRITICAL or not getattr(_quiet_logging, 'active', False)
+
+
+logging.getLogger('yfinance').addFilter(_QuietLogFilter())
+
+
+def _dbscan_1d(x, eps, min_samples):
+    """
+    DBSCAN cluster labels for 1-D data, same semantics as
+    sklearn.cluster.DBSCAN(eps, min_samples).fit_predict(x.reshape(-1, 1))
+    but using sort + gap scan instead of a neighbour search.
+    Returns -1 for noise.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    n = len(x)
+    labels = np.full(n, -1)
+    if n == 0:
+        return labels
+    order = np.argsort(x, kind='stable')
+    xs = x[order]
+
+    # Core points have min_samples neighbours within eps (including themselves)
+    n_neighbours = np.searchsorted(xs, xs + eps, side='right') - np.searchsorted(xs, xs - eps, side='left')
+    core = n_neighbours >= min_samples
+    if not core.any():
+        return labels
+
+    # Neighbouring core points closer than eps are density-connected
+    core_pos = np.flatnonzero(core)
+    component = np.concatenate([[0], np.cumsum(np.diff(xs[core_pos]) > eps)])
+
+    # Number clusters in order of their first core point in the input, like sklearn
+    first_idx = np.full(component[-1] + 1, n)
+    np.minimum.at(first_idx, component, order[core_pos])
+    component_label = np.empty_like(first_idx)
+    component_label[np.argsort(first_idx, kind='stable')] = np.arange(len(first_idx))
+
+    labels_sorted = np.full(n, -1)
+    labels_sorted[core_pos] = component_label[component]
+
+    # Border points join the reachable cluster that was discovered first
+    # (only the nearest core on each side can be within eps)
+    pos = np.arange(n)
+    left = np.maximum.accumulate(np.where(core, pos, -1))
+    right = np.minimum.accumulate(np.where(core, pos, n)[::-1])[::-1]
+    left_c, right_c = np.clip(left, 0, n - 1), np.clip(right, 0, n - 1)
+    left_ok = (left >= 0) & (xs - xs[left_c] <= eps)
+    right_ok = (right < n) & (xs[right_c] - xs <= eps)
+    first = np.minimum(np.where(left_ok, labels_sorted[left_c], n), np.where(right_ok, labels_sorted[right_c], n))
+    border = (~core) & (left_ok | right_ok)
+    labels_sorted[border] = first[border]
+
+    labels[order] = labels_sorted
+    return labels
 
 class PriceHistory:
     def __init__(self, data, ticker, tz, session=None):
@@ -34,6 +106,14 @@ class PriceHistory:
 
         # Limit recursion depth when repairing prices
         self._reconstruct_start_interval = None
+        # Optional callable(ticker, start, end, interval, prepost) supplying
+        # sub-interval prices for reconstruction instead of Yahoo (see yf.repair)
+        self._repair_fetcher = None
+        # Set if a finer-grain fetch failed, so the repair result isn't cached
+        self._repair_fetch_failed = False
+        # Set on reconstruction fetchers, their one-off results would only
+        # evict useful entries from the repair result cache
+        self._repair_result_cache_skip = False
 
         self._last_error = None
 
@@ -212,18 +292,22 @@ class PriceHistory:
         url = f"{_BASE_URL_}/v8/finance/chart/{self.ticker}"
         data = None
         get_fn = self._data.get
+        get_kwargs = {}
         dt_now = pd.Timestamp.now('UTC')
         if end is not None:
             end_dt = pd.Timestamp(end, unit='s').tz_localize("UTC")
             data_delay = _datetime.timedelta(minutes=30)
             if end_dt + data_delay <= dt_now:
-                # Date range in past so safe to fetch through cache:
+                # Date range in past so safe to fetch through cache,
+                # and to share briefly with other processes (response_ttl):
                 get_fn = self._data.cache_get
+                get_kwargs['shared'] = True
         try:
             data = get_fn(
                 url=url,
                 params=params,
-                timeout=timeout
+                timeout=timeout,
+                **get_kwargs
             )
             if "Will be right back" in data.text or data is None:
                 raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
@@ -472,58 +556,7 @@ class PriceHistory:
 
         if repair:
             # Do this before auto/back adjust
-            logger.debug(f'{self.ticker}: checking OHLC for repairs ...')
-
-            df = df.sort_index()
-
-            original_currency = currency  # keeps track of original currency before any repairs that may change it
-
-            # Must fix bad 'Adj Close' & dividends before 100x/split errors.
-            # First make currency consistent. On some exchanges, dividends often in different currency
-            # to prices, e.g. £ vs pence.
-            df, currency, prices_scaled = self._standardise_currency(df, currency)
-            self._history_metadata['currency'] = currency
-
-            f_na = df['Volume'].isna()
-            if f_na.any():
-                # Because converting to Int, need to handle NaNs
-                df.loc[f_na, 'Volume'] = 0
-
-            df = self._fix_bad_div_adjust(df, interval, prepost, currency)
-
-            # Need the latest/last row to be repaired before 100x/split repair:
-            if not df.empty:
-                df_last = self._fix_zeroes(df.iloc[-1:], interval, tz_exchange, prepost)
-                if 'Repaired?' not in df.columns:
-                    df['Repaired?'] = False
-                if 'Repaired?' not in df_last.columns:
-                    df_last['Repaired?'] = False
-                df = pd.concat([df.drop(df.index[-1]), df_last])
-
-            if '=' not in self.ticker:
-                # Don't apply these to FX, because need volume
-                df = self._fix_unit_mixups(df, interval, tz_exchange, prepost)
-                df = self._fix_bad_stock_splits(df, interval, tz_exchange)
-            # Must repair 100x and split errors before price reconstruction
-            df = self._fix_zeroes(df, interval, tz_exchange, prepost)
-
-            # New:
-            df = self._repair_capital_gains(df)
-
-            # Revert currency conversion done by _standardise_currency(),
-            # so the returned data matches the ticker's actual quotation currency.
-            if prices_scaled:
-                m = _CURRENCY_CONVERSIONS[original_currency]
-                for c in _PRICE_COLNAMES_:
-                    df[c] /= m
-                # After running _fix_bad_div_adjust(), the dividends should always be in
-                # same unit as prices
-                df['Dividends'] /= m
-                self._history_metadata['currency'] = original_currency
-                if 'currencyRepaired' in self._history_metadata:
-                    del self._history_metadata['currencyRepaired']
-
-            df = df.sort_index()
+            df = self._repair_prices(df, interval, tz_exchange, prepost, currency)
 
         # Auto/back adjust
         try:
@@ -577,6 +610,163 @@ class PriceHistory:
             self._reconstruct_start_interval = None
         return df
 
+    def _repair_prices(self, df, interval, tz_exchange, prepost, currency):
+        # Repair raw (unadjusted) price data, reusing the last result for
+        # this ticker if the raw data is unchanged or only has new bars appended.
+        # Updates self._history_metadata['currency'] if a currency repair sticks.
+        cache_mode = YfConfig.repair.result_cache
+        if cache_mode not in ('memory', 'disk') or self._repair_fetcher is not None or self._repair_result_cache_skip or df.empty:
+            return self._repair_prices_full(df, interval, tz_exchange, prepost, currency)
+        persistent = cache_mode == 'disk'
+
+        df = df.sort_index()
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        # Currency handling also depends on live metadata and today's date,
+        # so results are only reused under the same sub-unit decision.
+        in_subunits = self._prices_in_subunits(df, currency)
+        cache_currency = currency if in_subunits is None else f"{currency}|{int(in_subunits)}"
+        results = cache.get_repair_result_cache()
+        entry = results.lookup(self.ticker, interval, prepost, cache_currency, persistent)
+        if entry is not None:
+            cached_columns, cached_hashes, cached_df, cached_currency, _ = entry
+            if cached_columns == tuple(df.columns) and np.array_equal(cached_hashes, row_hashes):
+                utils.get_yf_logger().debug(f'{self.ticker}: reusing repair of unchanged OHLC')
+                self._history_metadata['currency'] = cached_currency
+                if cached_currency != currency:
+                    self._history_metadata['currencyRepaired'] = True
+                return cached_df.copy()
+
+        self._repair_fetch_failed = False
+        repaired = None
+        if entry is not None:
+            repaired = self._repair_prices_incremental(df, row_hashes, entry, interval, tz_exchange, prepost, currency)
+        if repaired is None:
+            sudden_change_state = {}
+            repaired = self._repair_prices_full(df, interval, tz_exchange, prepost, currency, state=sudden_change_state)
+        else:
+            repaired, sudden_change_state = repaired
+        if not self._repair_fetch_failed:
+            results.store(self.ticker, interval, prepost, cache_currency, df.columns, row_hashes,
+                          repaired.copy(), self._history_metadata['currency'], sudden_change_state, persistent)
+        return repaired
+
+    def _repair_prices_incremental(self, df, row_hashes, entry, interval, tz_exchange, prepost, currency):
+        # Previous raw data + appended bars: only repair a window around the new bars,
+        # and keep the previous result for the rest. The last previous bar may have
+        # changed (was live). Unit-switch detection continues from the previous
+        # scan's state, so judges the window against full-history statistics.
+        # Returns (repaired, scan state), or None if the window can't be trusted.
+        cached_columns, cached_hashes, cached_df, cached_currency, cached_state = entry
+        n_cached = len(cached_hashes)
+        if cached_columns != tuple(df.columns) or n_cached < 2 or len(row_hashes) < n_cached:
+            return None
+        if not np.array_equal(cached_hashes[:n_cached-1], row_hashes[:n_cached-1]):
+            return None
+        new_start = n_cached-1
+        window_start = new_start - _REPAIR_INCREMENTAL_LOOKBACK
+        if window_start <= 0:
+            return None
+        # New dividends/splits can change repairs of any older bar
+        event_cols = [c for c in ['Dividends', 'Stock Splits', 'Capital Gains'] if c in df.columns]
+        if (df[event_cols].iloc[new_start:].fillna(0) != 0).any().any():
+            return None
+
+        if cached_state is None:
+            return None
+        window_start_dt = df.index[window_start]
+        for state in cached_state.values():
+            if state['signals'] is not None and (state['signals'] >= window_start_dt).any():
+                # A previous switch point inside window, its repair spans the boundary
+                return None
+
+        window_state = {}
+        try:
+            window = self._repair_prices_full(df.iloc[window_start:], interval, tz_exchange, prepost, currency,
+                                              prior=cached_state, state=window_state)
+        except _RepairWindowInvalid:
+            return None
+        if self._history_metadata['currency'] != cached_currency:
+            return None
+        # Window must agree with previous result on the bars before the new ones,
+        # else repairs depended on data outside the window.
+        split_dt = df.index[new_start]
+        overlap = window[window.index < split_dt]
+        cached_overlap = cached_df[(cached_df.index >= df.index[window_start]) & (cached_df.index < split_dt)]
+        if not overlap.index.equals(cached_overlap.index) or not overlap.columns.equals(cached_overlap.columns):
+            return None
+        for c in overlap.columns:
+            a = overlap[c].to_numpy()
+            b = cached_overlap[c].to_numpy()
+            if a.dtype.kind == 'f' and b.dtype.kind == 'f':
+                if not np.allclose(a, b, rtol=1e-9, atol=0, equal_nan=True):
+                    return None
+            elif not np.array_equal(a, b):
+                return None
+
+        utils.get_yf_logger().debug(f'{self.ticker}: repaired {len(df)-new_start} new OHLC bars incrementally')
+        return pd.concat([cached_df[cached_df.index < split_dt], window[window.index >= split_dt]]), window_state
+
+    def _repair_prices_full(self, df, interval, tz_exchange, prepost, currency, prior=None, state=None):
+        # Run the full repair pipeline on raw (unadjusted) price data.
+        # Updates self._history_metadata['currency'] if a currency repair sticks.
+        # Unit-switch scan state {change: dict}: prior = previous scan's, when df is
+        # only a window of recent bars; state = filled with this scan's, if not None.
+        # Raises _RepairWindowInvalid if the window can't be judged in isolation.
+        logger = utils.get_yf_logger()
+        logger.debug(f'{self.ticker}: checking OHLC for repairs ...')
+
+        df = df.sort_index()
+
+        original_currency = currency  # keeps track of original currency before any repairs that may change it
+
+        # Must fix bad 'Adj Close' & dividends before 100x/split errors.
+        # First make currency consistent. On some exchanges, dividends often in different currency
+        # to prices, e.g. £ vs pence.
+        df, currency, prices_scaled = self._standardise_currency(df, currency)
+        self._history_metadata['currency'] = currency
+
+        f_na = df['Volume'].isna()
+        if f_na.any():
+            # Because converting to Int, need to handle NaNs
+            df.loc[f_na, 'Volume'] = 0
+
+        df = self._fix_bad_div_adjust(df, interval, prepost, currency)
+
+        # Need the latest/last row to be repaired before 100x/split repair:
+        if not df.empty:
+            df_last = self._fix_zeroes(df.iloc[-1:], interval, tz_exchange, prepost)
+            if 'Repaired?' not in df.columns:
+                df['Repaired?'] = False
+            if 'Repaired?' not in df_last.columns:
+                df_last['Repaired?'] = False
+            df = pd.concat([df.drop(df.index[-1]), df_last])
+
+        if '=' not in self.ticker:
+            # Don't apply these to FX, because need volume
+            df = self._fix_unit_mixups(df, interval, tz_exchange, prepost, prior, state)
+            df = self._fix_bad_stock_splits(df, interval, tz_exchange)
+        # Must repair 100x and split errors before price reconstruction
+        df = self._fix_zeroes(df, interval, tz_exchange, prepost)
+
+        # New:
+        df = self._repair_capital_gains(df)
+
+        # Revert currency conversion done by _standardise_currency(),
+        # so the returned data matches the ticker's actual quotation currency.
+        if prices_scaled:
+            m = _CURRENCY_CONVERSIONS[original_currency]
+            for c in _PRICE_COLNAMES_:
+                df[c] /= m
+            # After running _fix_bad_div_adjust(), the dividends should always be in
+            # same unit as prices
+            df['Dividends'] /= m
+            self._history_metadata['currency'] = original_currency
+            if 'currencyRepaired' in self._history_metadata:
+                del self._history_metadata['currencyRepaired']
+
+        df = df.sort_index()
+        return df
+
     def _get_history_cache(self, period="max", interval="1d", repair=False) -> pd.DataFrame:
         cache_key = (interval, period, repair)
         if cache_key not in self._history_cache.keys():
@@ -623,6 +813,16 @@ class PriceHistory:
 
         return self._history_metadata
 
+    def _get_last_history_metadata(self) -> dict:
+        # Metadata of the last history() request as-is, without the intraday
+        # fetch get_history_metadata() makes to fill in tradingPeriods.
+        if self._history_metadata is None:
+            return {}
+        if self._history_metadata_formatted is False:
+            self._history_metadata = utils.format_history_metadata(self._history_metadata)
+            self._history_metadata_formatted = True
+        return self._history_metadata
+
     def get_dividends(self, period="max", repair=False) -> pd.Series:
         return self._get_history_cache(interval='1d', period=period, repair=repair)['dividends']
 
@@ -723,9 +923,6 @@ class PriceHistory:
             # Can't go smaller than 1m so can't reconstruct
             return df
 
-        # Need sklean DBSCAN to help calibrate the new block
-        from sklearn.cluster import DBSCAN
-
         if interval[1:] in ['d', 'wk', 'mo']:
             # Interday data always includes pre & post
             prepost = True
@@ -846,12 +1043,11 @@ class PriceHistory:
             dts_groups[i] += good_dts.to_list()
             dts_groups[i].sort()
 
-        n_fixed = 0
-        for i in range(len(dts_groups)-1, -1, -1):
+        # Work out the finer-grain window to fetch for each group
+        td_1d = _datetime.timedelta(days=1)
+        fetch_windows = {}
+        for i in range(len(dts_groups)):
             g = dts_groups[i]
-            df_block = df[df.index.isin(g)]
-            logger.debug("df_block:\n" + str(df_block))
-
             start_dt = g[0]
             start_d = start_dt.date()
             reject = False
@@ -865,7 +1061,6 @@ class PriceHistory:
                 logger.info(msg, extra=log_extras)
                 continue
 
-            td_1d = _datetime.timedelta(days=1)
             if interval in "1wk":
                 fetch_start = start_d - td_range  # need previous week too
                 fetch_end = g[-1].date() + td_range
@@ -884,16 +1079,26 @@ class PriceHistory:
                 fetch_end = fetch_end.date() + td_1d
             if min_dt is not None:
                 fetch_start = max(min_dt.date(), fetch_start)
-            logger.debug(f"Fetching {sub_interval} prepost={prepost} {fetch_start}->{fetch_end}", extra=log_extras)
-            # Temp disable errors printing
-            logger = utils.get_yf_logger()
-            if hasattr(logger, 'level'):
-                # YF's custom indented logger doesn't expose level
-                log_level = logger.level
-                logger.setLevel(logging.CRITICAL)
-            df_fine = self.history(start=fetch_start, end=fetch_end, interval=sub_interval, auto_adjust=False, actions=True, prepost=prepost, repair=True)
-            if hasattr(logger, 'level'):
-                logger.setLevel(log_level)
+            fetch_windows[i] = (fetch_start, fetch_end)
+
+        # Fetch all windows up-front, concurrently, then calibrate each group.
+        # Cached finer-grain prices must postdate the latest split/dividend.
+        event_cols = [c for c in ['Dividends', 'Stock Splits'] if c in df.columns]
+        f_event = (df[event_cols].fillna(0) != 0).any(axis=1).to_numpy() if event_cols else np.zeros(len(df), dtype=bool)
+        last_event = df.index[f_event][-1].date() if f_event.any() else None
+        fine_data = self._fetch_reconstruct_windows(fetch_windows, sub_interval, prepost, last_event)
+
+        n_fixed = 0
+        for i in range(len(dts_groups)-1, -1, -1):
+            if i not in fetch_windows:
+                continue
+            g = dts_groups[i]
+            df_block = df[df.index.isin(g)]
+            logger.debug("df_block:\n" + str(df_block))
+
+            start_dt = g[0]
+            start_d = start_dt.date()
+            df_fine = fine_data.get(i)
             if df_fine is None or df_fine.empty:
                 msg = f"Cannot reconstruct block starting {start_dt if intraday else start_d}, too old, Yahoo will reject request for finer-grain data"
                 logger.info(msg, extra=log_extras)
@@ -980,16 +1185,16 @@ class PriceHistory:
 
             # Prune outlier ratio values with Z-score
             if len(ratios) > 1:
-                # Use sklearn to cluster the ratios, and keep biggest cluster.
+                # Cluster the ratios (DBSCAN), and keep biggest cluster.
                 # This protects against df_new containing sudden-jumps from unfixed
                 # unit-switch or stock-split-error.
                 x = ratios.copy()
                 relative_tolerance=0.10
                 min_samples=3
-                logx = np.log(x).reshape(-1, 1)
+                logx = np.log(x)
                 # Symmetric relative tolerance in log space
                 eps = max(np.log1p(relative_tolerance), -np.log1p(-relative_tolerance))
-                labels = DBSCAN(eps=eps, min_samples=min_samples).fit_predict(logx)
+                labels = _dbscan_1d(logx, eps=eps, min_samples=min_samples)
                 cluster_labels = [label for label in np.unique(labels) if label != -1]
                 # If DBSCAN found no clusters, leave the data unchanged
                 if cluster_labels:
@@ -1110,18 +1315,94 @@ class PriceHistory:
 
         return df_v2
 
-    def _standardise_currency(self, df, currency):
-        prices_scaled = False
+    def _fetch_fine_prices(self, start, end, interval, prepost, last_event=None):
+        if self._repair_fetcher is not None:
+            # User-supplied data source, they handle their own caching
+            return self._repair_fetcher(self.ticker, start, end, interval, prepost)
+
+        # Only cache date ranges already closed, recent data can still change
+        cache_mode = YfConfig.repair.cache
+        use_cache = cache_mode in ('memory', 'disk') and end < _datetime.date.today()
+        persistent = cache_mode == 'disk'
+        if use_cache:
+            df = cache.get_repair_price_cache().lookup(self.ticker, interval, prepost, start, end, last_event, persistent)
+            if df is not None:
+                return df
+
+        # Separate instance so concurrent fetches don't share metadata/event state,
+        # but keep the reconstruction depth limit.
+        fetcher = PriceHistory(self._data, self.ticker, self.tz, self.session)
+        fetcher._reconstruct_start_interval = self._reconstruct_start_interval
+        fetcher._repair_result_cache_skip = True
+        df = fetcher.history(start=start, end=end, interval=interval, auto_adjust=False, actions=True, prepost=prepost, repair=True)
+
+        if fetcher._last_error is not None:
+            self._repair_fetch_failed = True
+        elif use_cache and df is not None:
+            cache.get_repair_price_cache().store(self.ticker, interval, prepost, start, end, df, last_event, persistent)
+        return df
+
+    def _fetch_reconstruct_windows(self, fetch_windows, sub_interval, prepost, last_event=None):
+        # Merge overlapping fetch windows, fetch them concurrently,
+        # and return {group key: fetched DataFrame}.
+        logger = utils.get_yf_logger()
+        log_extras = {'yf_cat': 'price-reconstruct', 'yf_interval': sub_interval, 'yf_symbol': self.ticker}
+        if not fetch_windows:
+            return {}
+
+        # Don't merge into a window longer than Yahoo accepts per request
+        max_span = max(end - start for start, end in fetch_windows.values())
+        if sub_interval == "1m":
+            max_span = max(max_span, _datetime.timedelta(days=7))
+        elif sub_interval in ["2m", "5m", "15m", "30m"]:
+            max_span = max(max_span, _datetime.timedelta(days=59))
+        elif sub_interval == "1h":
+            max_span = max(max_span, _datetime.timedelta(days=729))
+        else:
+            max_span = None
+        merged = []  # [start, end, [group keys]]
+        for key, (start, end) in sorted(fetch_windows.items(), key=lambda kv: kv[1]):
+            if merged and start <= merged[-1][1] and (max_span is None or max(end, merged[-1][1]) - merged[-1][0] <= max_span):
+                merged[-1][1] = max(end, merged[-1][1])
+                merged[-1][2].append(key)
+            else:
+                merged.append([start, end, [key]])
+        logger.debug(f"Fetching {len(merged)} {sub_interval} windows for {len(fetch_windows)} repair groups", extra=log_extras)
+
+        def fetch(start, end):
+            # Temp disable errors printing, unless debugging
+            quiet = getattr(_quiet_logging, 'active', False)
+            _quiet_logging.active = quiet or not YfConfig.debug.logging
+            try:
+                return self._fetch_fine_prices(start, end, sub_interval, prepost, last_event)
+            finally:
+                _quiet_logging.active = quiet
+
+        if len(merged) == 1:
+            results = [fetch(merged[0][0], merged[0][1])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(merged), _RECONSTRUCT_MAX_WORKERS)) as executor:
+                futures = [executor.submit(fetch, start, end) for start, end, _ in merged]
+                results = [f.result() for f in futures]
+
+        fine_data = {}
+        for (start, end, keys), df_fine in zip(merged, results):
+            for key in keys:
+                fine_data[key] = df_fine
+        return fine_data
+
+    def _prices_in_subunits(self, df, currency):
+        # Whether prices of a sub-unit currency (e.g. GBp) really are in the sub-unit.
+        # None if not a sub-unit currency, or no row has volume.
         if currency not in _CURRENCY_CONVERSIONS:
-            return df, currency, prices_scaled
+            return None
         m = _CURRENCY_CONVERSIONS[currency]
-        currency2 = {'GBp': 'GBP', 'ZAc': 'ZAR', 'ILA': 'ILS'}[currency]
-        
+
         # Use latest row with actual volume, because volume=0 rows can be 0.01x the other rows.
         # _fix_unit_switch() will ensure all rows are on same scale.
         f_volume = df['Volume']>0
         if not f_volume.any():
-            return df, currency, prices_scaled
+            return None
         last_row = df.iloc[np.where(f_volume)[0][-1]]
         prices_in_subunits = True  # usually is true
         if last_row.name > (pd.Timestamp.now('UTC') - _datetime.timedelta(days=30)):
@@ -1135,6 +1416,18 @@ class PriceHistory:
                 if not YfConfig.debug.hide_exceptions:
                     raise
                 pass
+        return prices_in_subunits
+
+    def _standardise_currency(self, df, currency):
+        prices_scaled = False
+        if currency not in _CURRENCY_CONVERSIONS:
+            return df, currency, prices_scaled
+        m = _CURRENCY_CONVERSIONS[currency]
+        currency2 = {'GBp': 'GBP', 'ZAc': 'ZAR', 'ILA': 'ILS'}[currency]
+
+        prices_in_subunits = self._prices_in_subunits(df, currency)
+        if prices_in_subunits is None:
+            return df, currency, prices_scaled
         if prices_in_subunits:
             for c in _PRICE_COLNAMES_:
                 df[c] *= m
@@ -1199,10 +1492,10 @@ class PriceHistory:
         return dividends
 
     @utils.log_indent_decorator
-    def _fix_unit_mixups(self, df, interval, tz_exchange, prepost):
+    def _fix_unit_mixups(self, df, interval, tz_exchange, prepost, prior=None, state=None):
         if df.empty:
             return df
-        df2 = self._fix_unit_switch(df, interval, tz_exchange)
+        df2 = self._fix_unit_switch(df, interval, tz_exchange, prior, state)
         df3 = self._fix_unit_random_mixups(df2, interval, tz_exchange, prepost)
         return df3
 
@@ -1233,33 +1526,32 @@ class PriceHistory:
                 df["Repaired?"] = False
             return df
 
-        df2 = df.copy()
-
-        if df2.index.tz is None:
-            df2.index = df2.index.tz_localize(tz_exchange)
-        elif df2.index.tz != tz_exchange:
-            df2.index = df2.index.tz_convert(tz_exchange)
+        if not df.index.is_monotonic_increasing:
+            # Repair rows sorted by date, so df & df2 stay aligned through
+            # reconstruction, then return them in caller's order.
+            order = df.index.argsort(kind='stable')
+            df2 = self._fix_unit_random_mixups(df.iloc[order], interval, tz_exchange, prepost)
+            return df2.iloc[np.argsort(order, kind='stable')]
 
         # Only import scipy if users actually want function. To avoid
         # adding it to dependencies.
         from scipy import ndimage as _ndimage
 
         data_cols = ["High", "Open", "Low", "Close", "Adj Close"]  # Order important, separate High from Low
-        data_cols = [c for c in data_cols if c in df2.columns]
-        f_zeroes = (df2[data_cols] == 0).any(axis=1).to_numpy()
+        data_cols = [c for c in data_cols if c in df.columns]
+        f_zeroes = (df[data_cols] == 0).any(axis=1).to_numpy()
         if f_zeroes.any():
-            df2_zeroes = df2[f_zeroes]
-            df2 = df2[~f_zeroes]
+            df2_zeroes = df[f_zeroes].copy()
             df_orig = df[~f_zeroes]  # all row slicing must be applied to both df and df2
         else:
             df2_zeroes = None
             df_orig = df
-        if df2.shape[0] <= 1:
+        if df_orig.shape[0] <= 1:
             logger.info("Insufficient good data for detecting 100x price errors", extra=log_extras)
             if "Repaired?" not in df.columns:
                 df["Repaired?"] = False
             return df
-        df2_data = df2[data_cols].to_numpy()
+        df2_data = df_orig[data_cols].to_numpy(dtype=float)
         median = _ndimage.median_filter(df2_data, size=(3, 3), mode="wrap")
         ratio = df2_data / median
         ratio_rounded = (ratio / 20).round() * 20  # round ratio to nearest 20
@@ -1276,65 +1568,35 @@ class PriceHistory:
 
         # Mark values to send for repair
         tag = -1.0
-        for i in range(len(data_cols)):
-            fi = f_either[:, i]
-            c = data_cols[i]
-            df2.loc[fi, c] = tag
+        df2 = df_orig.copy()
+        if df2.index.tz is None:
+            df2.index = df2.index.tz_localize(tz_exchange)
+        elif df2.index.tz != tz_exchange:
+            df2.index = df2.index.tz_convert(tz_exchange)
+        df2[data_cols] = np.where(f_either, tag, df2_data)
 
-        n_before = (df2_data == tag).sum()
+        n_before = np.count_nonzero(f_either)
         df2 = self._reconstruct_intervals_batch(df2, interval, prepost, tag)
-        df2_tagged = df2[data_cols].to_numpy() == tag
-        n_after = (df2[data_cols].to_numpy() == tag).sum()
+        values = df2[data_cols].to_numpy(dtype=float, copy=True)
+        n_after = np.count_nonzero(values == tag)
 
         if n_after > 0:
             # This second pass will *crudely* "fix" any remaining errors in High/Low
             # simply by ensuring they don't contradict e.g. Low = 100x High.
-            f = (df2[data_cols].to_numpy() == tag) & f
-            for i in range(f.shape[0]):
-                fi = f[i, :]
-                if not fi.any():
-                    continue
-                idx = df2.index[i]
-
-                for c in ['Open', 'Close']:
-                    j = data_cols.index(c)
-                    if fi[j]:
-                        df2.loc[idx, c] = df.loc[idx, c] * 0.01
-
-                c = "High"
-                j = data_cols.index(c)
-                if fi[j]:
-                    df2.loc[idx, c] = df2.loc[idx, ["Open", "Close"]].max()
-
-                c = "Low"
-                j = data_cols.index(c)
-                if fi[j]:
-                    df2.loc[idx, c] = df2.loc[idx, ["Open", "Close"]].min()
-
-            f_rcp = (df2[data_cols].to_numpy() == tag) & f_rcp
-            for i in range(f_rcp.shape[0]):
-                fi = f_rcp[i, :]
+            # First the 100x values, then the 0.01x values.
+            i_open, i_close = data_cols.index('Open'), data_cols.index('Close')
+            i_high, i_low = data_cols.index('High'), data_cols.index('Low')
+            for f_dir, m in [(f, 0.01), (f_rcp, 100.0)]:
+                fi = (values == tag) & f_dir
                 if not fi.any():
                     continue
-                idx = df2.index[i]
-
-                for c in ['Open', 'Close']:
-                    j = data_cols.index(c)
-                    if fi[j]:
-                        df2.loc[idx, c] = df.loc[idx, c] * 100.0
-
-                c = "High"
-                j = data_cols.index(c)
-                if fi[j]:
-                    df2.loc[idx, c] = df2.loc[idx, ["Open", "Close"]].max()
-
-                c = "Low"
-                j = data_cols.index(c)
-                if fi[j]:
-                    df2.loc[idx, c] = df2.loc[idx, ["Open", "Close"]].min()
-
-            df2_tagged = df2[data_cols].to_numpy() == tag
-            n_after_crude = df2_tagged.sum()
+                for j in [i_open, i_close]:
+                    values[fi[:, j], j] = df2_data[fi[:, j], j] * m
+                f_high = fi[:, i_high]
+                values[f_high, i_high] = np.fmax(values[f_high, i_open], values[f_high, i_close])
+                f_low = fi[:, i_low]
+                values[f_low, i_low] = np.fmin(values[f_low, i_open], values[f_low, i_close])
+            n_after_crude = np.count_nonzero(values == tag)
         else:
             n_after_crude = n_after
 
@@ -1347,22 +1609,21 @@ class PriceHistory:
             logger.info(report_msg, extra=log_extras)
 
         # Restore original values where repair failed
-        f_either = df2[data_cols].to_numpy() == tag
-        for j in range(len(data_cols)):
-            fj = f_either[:, j]
-            if fj.any():
-                c = data_cols[j]
-                df2.loc[fj, c] = df_orig.loc[fj, c]
+        f_failed = values == tag
+        if f_failed.any():
+            values[f_failed] = df2_data[f_failed]
+        df2[data_cols] = values
         if df2_zeroes is not None:
             if "Repaired?" not in df2_zeroes.columns:
                 df2_zeroes["Repaired?"] = False
+            df2_zeroes.index = df2_zeroes.index.tz_convert(df2.index.tz) if df2_zeroes.index.tz is not None else df2_zeroes.index.tz_localize(df2.index.tz)
             df2 = pd.concat([df2, df2_zeroes]).sort_index()
             df2.index = pd.to_datetime(df2.index)
 
         return df2
 
     @utils.log_indent_decorator
-    def _fix_unit_switch(self, df, interval, tz_exchange):
+    def _fix_unit_switch(self, df, interval, tz_exchange, prior=None, state=None):
         # Sometimes Yahoo returns few prices in cents/pence instead of $/£
         # I.e. 100x bigger
         # 2 ways this manifests:
@@ -1380,10 +1641,17 @@ class PriceHistory:
         if 'Repaired?' not in df:
             df['Repaired?'] = False
         f_repair_before = df['Repaired?'].to_numpy()
-        df = self._fix_prices_sudden_change(df, interval, tz_exchange, n, unit_switch=True, correct_dividend=True)
+        df = self._fix_prices_sudden_change(df, interval, tz_exchange, n, unit_switch=True, correct_dividend=True,
+                                            prior=prior, state=state)
         f_repair_after = df['Repaired?'].to_numpy()
         f_repair_unit = f_repair_after & (~f_repair_before)
-        if f_repair_unit.any():
+        repaired = f_repair_unit.any()
+        if prior is not None and n in prior:
+            # Incremental repair: older data outside window was repaired
+            repaired = repaired or prior[n]['repaired']
+        if state is not None and n in state:
+            state[n]['repaired'] = repaired
+        if repaired:
             # Currency switch was repaired
             if currency in ['GBp', 'GBP']:
                 # UK £/pence
@@ -1752,116 +2020,115 @@ class PriceHistory:
         df2.loc[f_adjClose_na, 'Adj Close'] = df2['Adj'][f_adjClose_na] * df2['Close'][f_adjClose_na]
         df2 = df2.drop('Adj', axis=1)
 
+        # Per-dividend analysis works on numpy arrays indexed by position,
+        # because df2 is sorted with unique index. Row-by-row pandas access
+        # dominated runtime for tickers with hundreds of dividends.
+        close = df2['Close'].to_numpy(dtype=float, copy=True)
+        adj_close = df2['Adj Close'].to_numpy(dtype=float, copy=True)
+        low = df2['Low'].to_numpy(dtype=float)
+        high = df2['High'].to_numpy(dtype=float)
+        volume = df2['Volume'].to_numpy()
+        dividends = df2['Dividends'].to_numpy(dtype=float, copy=True)
+        splits = df2['Stock Splits'].to_numpy(dtype=float)
+        f_repaired = np.zeros(len(df2), dtype=bool)
+
         # Very rarely, the Close (not Adj Close) is already adjusted!
-        # Clue is it's often lower than Low. 
+        # Clue is it's often lower than Low.
         # E.g. ticker MPCC.OL - Oslo exchange data contradicts Yahoo.
         # But sometimes the original data is bad, e.g. LSE sometimes close < low
         # Can attempt to fix:
         fixed_dates = []
-        for i in range(len(div_indices)-1, -1, -1):
-            div_idx = div_indices[i]
+        for div_idx in div_indices[::-1]:
             if div_idx == 0:
                 continue
-            prices_before = df2.iloc[div_idx-1]
-            diff = prices_before['Low'] - prices_before['Close']
-            div = df2['Dividends'].iloc[div_idx]
+            diff = low[div_idx-1] - close[div_idx-1]
+            div = dividends[div_idx]
             if diff > 0 and (diff/div-1)<0.01:
-                # Close<Low and the difference not bigger than the dividend, 
+                # Close<Low and the difference not bigger than the dividend,
                 # because if diff > dividend then something else caused problem.
-                dt_before = df2.index[div_idx-1]
-                new_close = prices_before['Close'] + div
-                if new_close >= prices_before['Low'] and new_close <= prices_before['High']:
-                    df2.loc[dt_before, 'Close'] = new_close
-                    adj_after = df2['Adj Close'].iloc[div_idx] / df2['Close'].iloc[div_idx]
-                    adj = adj_after * (1.0 - div/df2['Close'].iloc[div_idx-1])
-                    df2.loc[dt_before, 'Adj Close'] = df2['Close'].iloc[div_idx-1] * adj
-                    df2.loc[dt_before, 'Repaired?'] = True
+                new_close = close[div_idx-1] + div
+                if new_close >= low[div_idx-1] and new_close <= high[div_idx-1]:
+                    close[div_idx-1] = new_close
+                    adj_after = adj_close[div_idx] / close[div_idx]
+                    adj = adj_after * (1.0 - div/close[div_idx-1])
+                    adj_close[div_idx-1] = close[div_idx-1] * adj
+                    f_repaired[div_idx-1] = True
                     df_modified = True
                     fixed_dates.append(df2.index[div_idx].date())
         if len(fixed_dates) > 0:
             msg = f"Repaired double-adjustment on div days {[str(d) for d in fixed_dates]}"
             logger.info(msg, extra=log_extras)
 
-        # Check dividends if too big/small for the price action
-        for i in range(len(div_indices)-1, -1, -1):
-            div_idx = div_indices[i]
+        # Check dividends if too big/small for the price action.
+        # First compute price action around every dividend at once.
+        n = len(df2)
+        idx = div_indices[div_indices > 0]
+        divs = dividends[idx]
+        prev_close = close[idx-1]
+        low_d = low[idx]
+        # Price has jumped/dropped ~100x on ex-div day, need to fix immediately.
+        # isclose(a, b, rel_tol=0.025), vectorised
+        f_100x = np.abs(low_d - prev_close*100) <= 0.025*np.maximum(np.abs(low_d), np.abs(prev_close*100))
+        f_001x = ~f_100x & (np.abs(low_d - prev_close*0.01) <= 0.025*np.maximum(np.abs(low_d), np.abs(prev_close*0.01)))
+        drop = prev_close - low_d
+        drop[f_100x] = prev_close[f_100x]*100 - low_d[f_100x]
+        drop[f_001x] = prev_close[f_001x]*0.01 - low_d[f_001x]
+        div_pcts = divs / prev_close
+        div_pcts[f_100x] = divs[f_100x] / (prev_close[f_100x]*100)
+        div_pcts[f_001x] = divs[f_001x] / (prev_close[f_001x]*0.01)
+        # Hmm, can I always look ahead 1 day? Catch: increases FP rate of div-too-small for tiny divs.
+        f_next = idx < n-1
+        drop_next = np.full(len(idx), np.nan)
+        drop_next[f_next] = close[idx[f_next]] - low[idx[f_next]+1]
+        drop_2Dmax = drop.copy()
+        drop_2Dmax[f_next] = np.maximum(drop[f_next], drop_next[f_next])
+        f_drops_zero = (drop == 0.0) & (~f_next | (drop_next == 0.0))
+        # Typical volatility = mean abs change over 8-day window around dividend
+        vol_end = np.where((n-idx) < 4, np.minimum(n, idx+4), 0)
+        vol_start = np.where((n-idx) < 4, np.maximum(0, vol_end-8), np.maximum(0, idx-4))
+        vol_end = np.where((n-idx) < 4, vol_end, np.minimum(n, vol_start+8))
+        typical_volatilities = np.full(len(idx), np.nan)
+        abs_changes = np.abs(close[:-1] - low[1:])
+        f_full = (vol_end - vol_start) == 8
+        if f_full.any():
+            windows = sliding_window_view(abs_changes, 7)
+            typical_volatilities[f_full] = np.mean(windows[vol_start[f_full]], axis=1)
+        for j in np.where(~f_full & ((vol_end - vol_start) >= 4))[0]:
+            typical_volatilities[j] = np.mean(abs_changes[vol_start[j]:vol_end[j]-1])
+        pct_zero_vol = np.sum(volume==0.0)/n
+
+        # Check if dividend is 100x market movement.
+        div_too_small_improvement_threshold = 1
+        div_too_big_improvement_threshold = 2
+        div_status_rows = []
+        for j in range(len(idx)-1, -1, -1):
+            div_idx = idx[j]
             dt = df2.index[div_idx]
-            div = df2['Dividends'].iloc[div_idx]
-
-            if div_idx == 0:
-                continue
-
-            div_pct = div / df2['Close'].iloc[div_idx-1]
-
-            # Check if dividend is 100x market movement.
-            div_too_small_improvement_threshold = 1
-            # div_too_big_improvement_threshold = 1
-            div_too_big_improvement_threshold = 2
-
-            if isclose(df2['Low'].iloc[div_idx], df2['Close'].iloc[div_idx-1]*100, rel_tol = 0.025):
-                # Price has jumped ~100x on ex-div day, need to fix immediately.
-                drop = df2['Close'].iloc[div_idx-1]*100 - df2['Low'].iloc[div_idx]
-                div_pct = div / (df2['Close'].iloc[div_idx-1]*100)
-                true_adjust = 1.0 - div / (df2['Close'].iloc[div_idx-1]*100)
-                present_adj = df2['Adj Close'].iloc[div_idx-1] / df2['Close'].iloc[div_idx-1]
-                if not isclose(present_adj, true_adjust, rel_tol = 0.025):
-                    df2.loc[:dt-_datetime.timedelta(seconds=1), 'Adj Close'] = true_adjust * df2['Close'].loc[:dt-_datetime.timedelta(seconds=1)]
-                    df2.loc[:dt-_datetime.timedelta(seconds=1), 'Repaired?'] = True
-            elif isclose(df2['Low'].iloc[div_idx], df2['Close'].iloc[div_idx-1]*0.01, rel_tol = 0.025):
-                # Price has dropped ~100x on ex-div day, need to fix immediately.
-                drop = df2['Close'].iloc[div_idx-1]*0.01 - df2['Low'].iloc[div_idx]
-                div_pct = div / (df2['Close'].iloc[div_idx-1]*0.01)
-                true_adjust = 1.0 - div / (df2['Close'].iloc[div_idx-1]*100)
-                present_adj = df2['Adj Close'].iloc[div_idx-1] / df2['Close'].iloc[div_idx-1]
+            div = divs[j]
+            div_pct = div_pcts[j]
+            _drop = drop[j]
+            _drop_2Dmax = drop_2Dmax[j]
+            typical_volatility = typical_volatilities[j]
+
+            if f_100x[j] or f_001x[j]:
+                true_adjust = 1.0 - div / (close[div_idx-1]*100)
+                present_adj = adj_close[div_idx-1] / close[div_idx-1]
                 if not isclose(present_adj, true_adjust, rel_tol = 0.025):
-                    df2.loc[:dt-_datetime.timedelta(seconds=1), 'Adj Close'] = true_adjust * df2['Close'].loc[:dt-_datetime.timedelta(seconds=1)]
-                    df2.loc[:dt-_datetime.timedelta(seconds=1), 'Repaired?'] = True
-            else:
-                drop = df2['Close'].iloc[div_idx-1] - df2['Low'].iloc[div_idx]
-            if div_idx < len(df2)-1:
-                # # In low-volume scenarios, the price drop is day after not today.
-                # if df2['Close'].iloc[div_idx-1] == df2['Close'].iloc[div_idx] or \
-                #    df2['Low'].iloc[div_idx] == df2['High'].iloc[div_idx]:
-                #     drop = np.max(df2['Close'].iloc[div_idx-1:div_idx+1].to_numpy() - df2['Low'].iloc[div_idx:div_idx+2].to_numpy())
-                # elif df2['Volume'].iloc[div_idx]==0:
-                #     if drop == 0.0:
-                #         drop = np.max(df2['Close'].iloc[div_idx-1:div_idx+1].to_numpy() - df2['Low'].iloc[div_idx:div_idx+2].to_numpy())
-                #
-                # Hmm, can I always look ahead 1 day? Catch: increases FP rate of div-too-small for tiny divs.
-                # drops = df2['Close'].iloc[div_idx-1:div_idx+1].to_numpy() - df2['Low'].iloc[div_idx:div_idx+2].to_numpy()
-                drops = np.array([drop, df2['Close'].iloc[div_idx] - df2['Low'].iloc[div_idx+1]])
-                drop_2Dmax = np.max(drops)
-            else:
-                drops = np.array([drop])
-                drop_2Dmax = drop
-
-            if (len(df2)-div_idx) < 4:
-                end = min(len(df2), div_idx+4)
-                start = max(0, end-8)
-            else:
-                start = max(0, div_idx-4)
-                end = min(len(df2), start+8)
-            if end-start < 4:
-                # Not enough data to estimate volatility
-                typical_volatility = np.nan
-            else:
-                diffs = df2['Close'].iloc[start:end-1].to_numpy() - df2['Low'].iloc[start+1:end].to_numpy()
-                typical_volatility = np.mean(np.abs(diffs))
+                    adj_close[:div_idx] = true_adjust * close[:div_idx]
+                    f_repaired[:div_idx] = True
 
             possibilities = []
-            if (drops==0.0).all() and df2['Volume'].iloc[div_idx]==0:
+            if f_drops_zero[j] and volume[div_idx]==0:
                 # Can't analyse price action so use crude heuristics
-                pct_zero_vol = np.sum(df2['Volume']==0.0)/len(df2)
                 if div_pct*100 < 0.1:
                     # Could be a 0.01x error
                     possibilities.append({'state':'div-too-small', 'diff':0.0})
-                # elif div_pct > 1.0:
                 # Update: lower threshold for illiquid stocks, because why paying mega dividends?
                 elif (pct_zero_vol > 0.75 and div_pct > 0.25) or (div_pct > 1.0):
                     # Could be a 100x error
                     possibilities.append({'state':'div-too-big', 'diff':0.0})
             else:
-                split = df2['Stock Splits'].loc[dt]
+                split = splits[div_idx]
                 if split == 0.0:
                     div_postSplit = None
                 else:
@@ -1870,27 +2137,27 @@ class PriceHistory:
 
                     if div_postSplit > div:
                         # Use volatility-adjusted drop
-                        _drop = drop - typical_volatility
+                        _split_drop = _drop - typical_volatility
                     else:
-                        _drop = drop_2Dmax
-                    if _drop > 0:
-                        diff = abs(div-_drop)
-                        diff_postSplit = abs(div_postSplit-_drop)
+                        _split_drop = _drop_2Dmax
+                    if _split_drop > 0:
+                        diff = abs(div-_split_drop)
+                        diff_postSplit = abs(div_postSplit-_split_drop)
                         if (diff_postSplit * div_too_big_improvement_threshold) <= diff:
                             possibilities.append({'state':'div-pre-split', 'diff':diff_postSplit})
 
                 # Check for div-too-big
                 if div_pct > too_big_check_threshold:
-                    if drop_2Dmax <= 0.0:
+                    if _drop_2Dmax <= 0.0:
                         possibilities.append({'state':'div-too-big', 'diff':0.0})
                     else:
-                        diff = abs(div-drop_2Dmax)
-                        diff_fx = abs((div/currency_divide)-drop_2Dmax)
+                        diff = abs(div-_drop_2Dmax)
+                        diff_fx = abs((div/currency_divide)-_drop_2Dmax)
                         if div_postSplit is None:
                             if (diff_fx * div_too_big_improvement_threshold) <= diff:
                                 possibilities.append({'state':'div-too-big', 'diff':diff_fx})
                         else:
-                            diff_fxPostSplit = abs((div_postSplit/currency_divide)-drop_2Dmax)
+                            diff_fxPostSplit = abs((div_postSplit/currency_divide)-_drop_2Dmax)
                             if diff_fx < diff_fxPostSplit:
                                 if (diff_fx * div_too_big_improvement_threshold) <= diff:
                                     possibilities.append({'state':'div-too-big', 'diff':diff_fx})
@@ -1900,13 +2167,12 @@ class PriceHistory:
 
                 # Check for div-too-small - can be tricked by normal price volatility
                 if not np.isnan(typical_volatility):
-                    # drop_wo_vol = drop_2Dmax - typical_volatility
                     # Update: only use same-day change for too-small, to reduce false-positives
-                    drop_wo_vol = drop - typical_volatility
+                    drop_wo_vol = _drop - typical_volatility
                     if drop_wo_vol > 0 and intraday and prepost:
                         # First, check if pre/post silly games
-                        if (df2['Open'].iloc[div_idx]-df2['Close'].iloc[div_idx]) < 0.2*drop_wo_vol:
-                            # Price recovered by end of trading session, 
+                        if (df2['Open'].iloc[div_idx]-close[div_idx]) < 0.2*drop_wo_vol:
+                            # Price recovered by end of trading session,
                             # so class this as false positive
                             drop_wo_vol = 0
                     if drop_wo_vol > 0:
@@ -1925,9 +2191,9 @@ class PriceHistory:
                                     possibilities.append({'state':'div-too-small-and-pre-split', 'diff':diff_fxPostSplit})
 
             div_status = {'date': dt, 'idx':div_idx, 'div': div, '%': div_pct}
-            div_status['drop'] = drop
-            div_status['drop_2Dmax'] = drop_2Dmax
-            div_status['volume'] = df2['Volume'].iloc[div_idx]
+            div_status['drop'] = _drop
+            div_status['drop_2Dmax'] = _drop_2Dmax
+            div_status['volume'] = volume[div_idx]
             div_status['vol'] = typical_volatility
 
             div_status['div_too_big'] = False
@@ -1940,158 +2206,102 @@ class PriceHistory:
                 possibilities = sorted(possibilities, key=lambda k: k['diff'])
                 p = possibilities[0]
                 div_status[p['state'].replace('-', '_')] = True
+            div_status_rows.append(div_status)
 
-            row = pd.DataFrame([div_status]).set_index('date')
-            if div_status_df is None:
-                div_status_df = row
-            else:
-                div_status_df = pd.concat([div_status_df, row])
+        df2['Close'] = close
+        df2['Adj Close'] = adj_close
+        if f_repaired.any():
+            df2.loc[f_repaired, 'Repaired?'] = True
 
-        if div_status_df is None and not df_modified:
+        if len(div_status_rows) == 0 and not df_modified:
             return df
+        div_status_df = pd.DataFrame(div_status_rows).set_index('date')
         checks = [c for c in div_status_df.columns if c.startswith('div_')]
         div_status_df = div_status_df.sort_index()
 
         def cluster_dividends(df, column='div', threshold=7):
             n = len(df)
             sorted_df = df.sort_values(column)
-            clusters = []
-            current_dts = [sorted_df.index[0]]
-            currents_vals = [sorted_df[column].iloc[0]]
+            vals = sorted_df[column].to_numpy()
+            cluster_labels = np.zeros(n, dtype=int)
+            cluster_start = 0
             for i in range(1, n):
-                dt = sorted_df.index[i]
-                div = sorted_df[column].iloc[i]
-                if (div / np.mean(currents_vals)) < threshold:
-                    # Add
-                    current_dts.append(dt)
-                    currents_vals.append(div)
-                else:
+                if (vals[i] / np.mean(vals[cluster_start:i])) >= threshold:
                     # New cluster
-                    clusters.append(current_dts)
-                    current_dts = [dt]
-                    currents_vals = [div]
-            clusters.append(current_dts)
-
-            cluster_labels = np.array([-1]*n)
-            ctr = 0
-            for i, cluster in enumerate(clusters):
-                nc = len(cluster)
-                cluster_labels[ctr:ctr+nc] = i
-                ctr += nc
+                    cluster_start = i
+                    cluster_labels[i:] += 1
             return cluster_labels
 
         # Check if the present div-adjustment is too big/small, or missing
         # - too-big determined from Adj Close movement vs Close
         # - too-small compares Adj Close vs dividends
-        for i in range(len(div_status_df)):
-            div_idx = div_status_df['idx'].iloc[i]
-            dt = div_status_df.index[i]
-            div = div_status_df['div'].iloc[i]
-
-            if div_idx == 0:
-                continue
+        status_idx = div_status_df['idx'].to_numpy()
+        div_pcts = div_status_df['div'].to_numpy() / close[status_idx-1]
 
-            div_pct = div / df2['Close'].iloc[div_idx-1]
+        # First, check if Yahoo failed to apply dividend to Adj Close
+        pre_adj = adj_close[status_idx-1] / close[status_idx-1]
+        post_adj = adj_close[status_idx] / close[status_idx]
+        div_missing_from_adjclose = post_adj == pre_adj
 
-            # First, check if Yahoo failed to apply dividend to Adj Close
-            pre_adj = df2['Adj Close'].iloc[div_idx-1] / df2['Close'].iloc[div_idx-1]
-            post_adj = df2['Adj Close'].iloc[div_idx] / df2['Close'].iloc[div_idx]
-            div_missing_from_adjclose = post_adj == pre_adj
+        # Check if adjustment too small
+        present_adj = pre_adj / post_adj
+        implied_div_yield = 1.0 - present_adj
+        div_adj_is_too_small = implied_div_yield < (0.1*div_pcts)
 
-            # Check if adjustment too small
-            present_adj = pre_adj / post_adj
-            implied_div_yield = 1.0 - present_adj
-            div_adj_is_too_small = implied_div_yield < (0.1*div_pct)
+        # ... and use same method for adjustment too big:
+        div_adj_exceeds_div = implied_div_yield > (10*div_pcts)
 
-            # ... and use same method for adjustment too big:
-            div_adj_exceeds_div = implied_div_yield > (10*div_pct)
+        # Can prune the space:
+        div_adj_is_too_small[div_missing_from_adjclose] = False  # redundant information
 
-            # Can prune the space:
-            if div_missing_from_adjclose:
-                div_adj_is_too_small = False  # redundant information
-
-            div_status = {'present adj': present_adj}
-            div_status['adj_missing'] = div_missing_from_adjclose
-            div_status['adj_exceeds_div'] = div_adj_exceeds_div
-            div_status['div_exceeds_adj'] = div_adj_is_too_small
-
-            for k,v in div_status.items():
-                if k not in div_status_df:
-                    if isinstance(v, (bool, np.bool_)):
-                        div_status_df[k] = False
-                    elif isinstance(v, int):
-                        div_status_df[k] = 0
-                    elif isinstance(v, float):
-                        div_status_df[k] = 0.0
-                    # elif k == 'div_true_date':
-                    #     div_status_df[k] = pd.Series(dtype='datetime64[ns, UTC]')
-                    else:
-                        raise ValueError(k,v,type(v))
-                div_status_df.loc[dt, k] = v
+        div_status_df['present adj'] = present_adj
+        div_status_df['adj_missing'] = div_missing_from_adjclose
+        div_status_df['adj_exceeds_div'] = div_adj_exceeds_div
+        div_status_df['div_exceeds_adj'] = div_adj_is_too_small
         checks += ['adj_missing', 'adj_exceeds_div', 'div_exceeds_adj']
 
-        div_status_df['phantom'] = False
+        f_phantom = np.zeros(len(div_status_df), dtype=bool)
         phantom_proximity_threshold = _datetime.timedelta(days=17)
-        f = div_status_df[['div_too_big', 'div_exceeds_adj']].any(axis=1)
+        status_divs = div_status_df['div'].to_numpy()
+        status_drops = div_status_df['drop'].to_numpy()
+        # Proximity of each dividend to its predecessor
+        f_close_to_prev = np.asarray(div_status_df.index[1:] - div_status_df.index[:-1] <= phantom_proximity_threshold)
+        f = div_status_df[['div_too_big', 'div_exceeds_adj']].any(axis=1).to_numpy()
         if f.any() and len(div_status_df) > 1:
             # One/some of these may be phantom dividends. Clue is if another correct dividend is very close
-            indices = np.where(f)[0]
-            dts_to_check = div_status_df.index[f]
-            for i in indices:
-                div = div_status_df.iloc[i]
-                div_dt = div.name
-                phantom_dt = None
-                if i > 0:
-                    other_div = div_status_df.iloc[i-1]
-                else:
-                    other_div = div_status_df.iloc[i+1]
-                ratio1 = (div['div']/currency_divide) / other_div['div']
-                ratio2 = div['div'] / other_div['div']
+            for i in np.where(f)[0]:
+                phantom_i = None
+                other_i = i-1 if i > 0 else i+1
+                ratio1 = (status_divs[i]/currency_divide) / status_divs[other_i]
+                ratio2 = status_divs[i] / status_divs[other_i]
                 divergence = min(abs(ratio1-1.0), abs(ratio2-1.0))
-                if abs(div_dt-other_div.name) <= phantom_proximity_threshold and not other_div['phantom'] and divergence < 0.01:
-                    if other_div.name in dts_to_check:
+                if f_close_to_prev[min(i, other_i)] and not f_phantom[other_i] and divergence < 0.01:
+                    if f[other_i]:
                         # Both this and previous are anomalous, so mark smallest drop as phantom
-                        drop = div['drop']
-                        drop_next = other_div['drop']
-                        if drop > 1.5*drop_next:
-                            phantom_dt = other_div.name
+                        if status_drops[i] > 1.5*status_drops[other_i]:
+                            phantom_i = other_i
                         else:
-                            phantom_dt = div_dt
+                            phantom_i = i
                     else:
-                        phantom_dt = div_dt
-
-                if phantom_dt:
-                    div_status_df.loc[phantom_dt, 'phantom'] = True
-                    for c in checks:
-                        if c in div_status_df.columns:
-                            div_status_df.loc[phantom_dt, c] = False
+                        phantom_i = i
+                if phantom_i is not None:
+                    f_phantom[phantom_i] = True
 
         # There might be other phantom dividends - in close proximity and almost-equal to another div.
         # But harder to decide which is the phantom and which is real.
         # Assume phantom has much smaller price drop, otherwise assume is newer.
         # ratio_threshold = 0.01
         ratio_threshold =  0.08  # increased for KAP.IL 2022-July
-        div_status_df = div_status_df.sort_index()
         for i in range(1, len(div_status_df)):
-            div = div_status_df.iloc[i]
-            div_dt = div.name
-            this_is_phantom = False
-            last_is_phantom = False
-            drop = div['drop']
-            last_div = div_status_df.iloc[i-1]
-            ratio = div['div'] / last_div['div']
-            if abs(div_dt-last_div.name) <= phantom_proximity_threshold and not last_div['phantom'] and not div['phantom'] and abs(ratio-1.0) < ratio_threshold:
-                last_drop = div_status_df['drop'].iloc[i-1]
-                if drop > 1.5*last_drop:
-                    last_is_phantom = True
+            ratio = status_divs[i] / status_divs[i-1]
+            if f_close_to_prev[i-1] and not f_phantom[i-1] and not f_phantom[i] and abs(ratio-1.0) < ratio_threshold:
+                if status_drops[i] > 1.5*status_drops[i-1]:
+                    f_phantom[i-1] = True
                 else:
-                    this_is_phantom = True
-            if last_is_phantom or this_is_phantom:
-                phantom_div_dt = div_dt if this_is_phantom else div_status_df.index[i-1]
-                div_status_df.loc[phantom_div_dt, 'phantom'] = True
-                for c in checks:
-                    if c in div_status_df.columns:
-                        div_status_df.loc[phantom_div_dt, c] = False
+                    f_phantom[i] = True
+        div_status_df['phantom'] = f_phantom
+        if f_phantom.any():
+            div_status_df.loc[f_phantom, checks] = False
         checks.append('phantom')
 
         # Remove phantoms early
@@ -2122,17 +2332,20 @@ class PriceHistory:
             # Maybe failed to detect a too-small div. If div is ~0.01x of previous and next, then
             # treat as a 0.01x error
             if len(div_status_df) > 1:
+                status_pcts = div_status_df['%'].to_numpy()
+                f_too_small = np.zeros(len(div_status_df), dtype=bool)
                 for i in range(0, len(div_status_df)):
                     r_pre, r_post = None, None
                     if i > 0:
-                        r_pre = div_status_df['%'].iloc[i-1] / div_status_df['%'].iloc[i]
+                        r_pre = status_pcts[i-1] / status_pcts[i]
                     if i < (len(div_status_df)-1):
-                        r_post = div_status_df['%'].iloc[i+1] / div_status_df['%'].iloc[i]
+                        r_post = status_pcts[i+1] / status_pcts[i]
                     r_pre = r_pre or r_post
                     r_post = r_post or r_pre
                     if abs(r_pre-currency_divide)<20 and abs(r_post-currency_divide)<20:
-                        div_dt = div_status_df.index[i]
-                        div_status_df.loc[div_dt, 'div_too_small'] = True
+                        f_too_small[i] = True
+                if f_too_small.any():
+                    div_status_df.loc[f_too_small, 'div_too_small'] = True
 
         if not div_status_df[checks].any().any():
             # Perfect
@@ -2171,135 +2384,126 @@ class PriceHistory:
                 return df
 
         # Check if the present div-adjustment contradicts price action
+        adj_close = df2['Adj Close'].to_numpy(dtype=float)
+        status_idx = div_status_df['idx'].to_numpy()
+        status_divs = div_status_df['div'].to_numpy()
+        status_pre_split = div_status_df['div_pre_split'].to_numpy()
+        status_div_exceeds_adj = div_status_df['div_exceeds_adj'].to_numpy()
+        status_vols = div_status_df['vol'].to_numpy()
+        status_drops = div_status_df['drop'].to_numpy()
+        status_drops_2Dmax = div_status_df['drop_2Dmax'].to_numpy()
+        f_adj_exceeds_prices = np.zeros(len(div_status_df), dtype=bool)
+        f_div_date_wrong = np.zeros(len(div_status_df), dtype=bool)
+        f_pre_split = np.zeros(len(div_status_df), dtype=bool)
+        div_true_dates = {}
         for i in range(len(div_status_df)):
-            div_idx = div_status_df['idx'].iloc[i]
+            div_idx = status_idx[i]
             dt = div_status_df.index[i]
-            div = div_status_df['div'].iloc[i]
+            div = status_divs[i]
             if div_idx == 0:
                 continue
-            div_pct = div / df2['Close'].iloc[div_idx-1]
+            div_pct = div / close[div_idx-1]
 
             # Adj Close should drop by LESS than Close on ex-div, at least for big dividends.
             # Update: Yahoo might be reporting dividend slightly early, meaning
             # Mr Market's price drop happens tomorrow e.g. UNTC in december 2023.
             # Or worse, Yahoo is 1 month early e.g. GWI.L ex-div was mid-April not mid-March
             lookahead_date = dt+_datetime.timedelta(days=35)
-            lookahead_idx = bisect.bisect_left(df2.index, lookahead_date)
+            lookahead_idx = df2.index.searchsorted(lookahead_date, side='left')
             lookahead_idx = min(lookahead_idx, len(df2)-1)
             # In rare cases, the price dropped 1 day before dividend (DVD.OL @ 2024-05-15)
             lookback_idx = max(0, div_idx-14)
-            # Check for bad stock splits in the lookahead period - 
+            # Check for bad stock splits in the lookahead period -
             # if present, reduce lookahead to before.
-            future_changes = df2['Close'].iloc[div_idx:lookahead_idx+1].pct_change()
-            f_big_change = (future_changes > 2).to_numpy() | (future_changes < -0.9).to_numpy()
+            future_close = close[div_idx:lookahead_idx+1]
+            future_changes = future_close[1:] / future_close[:-1] - 1
+            f_big_change = (future_changes > 2) | (future_changes < -0.9)
             if f_big_change.any():
-                lookahead_idx = div_idx + np.where(f_big_change)[0][0]-1
-                lookahead_date = df2.index[lookahead_idx]
-            
+                lookahead_idx = div_idx + np.where(f_big_change)[0][0]
+
             div_adj_exceeds_prices = False
             div_date_wrong = False
-            div_true_date = pd.NaT
             if lookahead_idx > lookback_idx:
-                x = df2.iloc[lookback_idx:lookahead_idx+1].copy()
-                x['Adj'] = x['Adj Close'] / x['Close']
-                x['Adj Low'] = x['Adj'] * x['Low']
-                deltas = x['Low'].iloc[1:].to_numpy() - x['Close'].iloc[:-1].to_numpy()
-                deltas = np.append([0.0], deltas)
-                x['delta'] = deltas
-                adjDeltas = x['Adj Low'].iloc[1:].to_numpy() - x['Adj Close'].iloc[:-1].to_numpy()
-                adjDeltas = np.append([0.0], adjDeltas)
-                x['adjDelta'] = adjDeltas
-                deltas = x[['delta', 'adjDelta']]
+                x_close = close[lookback_idx:lookahead_idx+1]
+                x_adj_close = adj_close[lookback_idx:lookahead_idx+1]
+                x_low = low[lookback_idx:lookahead_idx+1]
+                x_adj = x_adj_close / x_close
+                x_adj_low = x_adj * x_low
+                deltas = np.append([0.0], x_low[1:] - x_close[:-1])
+                adjDeltas = np.append([0.0], x_adj_low[1:] - x_adj_close[:-1])
                 if div_pct > 0.05 and div_pct < 1.0:
-                    adjDiv = div * x['Adj'].iloc[0]
-                    f = deltas['adjDelta'] > (adjDiv*0.6)
+                    adjDiv = div * x_adj[0]
+                    f = adjDeltas > (adjDiv*0.6)
                     if f.any():
-                        indices = np.where(f)[0]
-                        for idx in indices:
-                            adjDelta_drop = deltas['adjDelta'].iloc[idx]
-                            if adjDelta_drop > 1.001*deltas['delta'].iloc[idx]:
+                        for k in np.where(f)[0]:
+                            adjDelta_drop = adjDeltas[k]
+                            if adjDelta_drop > 1.001*deltas[k]:
                                 # Adjusted price has risen by more than unadjusted, should not happen.
                                 # See if Adjusted price later falls by a similar amount. This would mean
                                 # dividend has been applied too early.
-                                ratios = (-1*deltas['adjDelta'])/adjDelta_drop
+                                ratios = (-1*adjDeltas)/adjDelta_drop
                                 f_near1_or_above = ratios>=0.8
                                 # Update: only check for wrong date if no coincident split.
                                 # Because if a split, more likely the div is missing split
-                                split = df2['Stock Splits'].loc[dt]
-                                pre_split = div_status_df['div_pre_split'].loc[dt]
+                                split = splits[div_idx]
+                                pre_split = status_pre_split[i]
                                 if (split==0.0 or (not pre_split)) and f_near1_or_above.any():
                                     near_indices = np.where(f_near1_or_above)[0]
                                     if len(near_indices) > 1:
                                         penalties = np.zeros(len(near_indices))
-                                        for i in range(len(near_indices)):
-                                            idx = near_indices[i]
-                                            dti = ratios.index[idx]
+                                        for ni in range(len(near_indices)):
+                                            dti = df2.index[lookback_idx + near_indices[ni]]
                                             if dti < dt:
-                                                penalties[i] += (dt-dti).days
+                                                penalties[ni] += (dt-dti).days
                                             else:
-                                                penalties[i] += 0.1*(dti-dt).days
-                                        i = np.argmin(penalties)
-                                        reversal_idx = near_indices[i]
+                                                penalties[ni] += 0.1*(dti-dt).days
+                                        reversal_idx = near_indices[np.argmin(penalties)]
                                     else:
                                         reversal_idx = near_indices[0]
                                     div_date_wrong = True
-                                    div_true_date = ratios.index[reversal_idx]
+                                    div_true_dates[dt] = df2.index[lookback_idx + reversal_idx]
                                     break
                                 elif adjDelta_drop > 0.39*adjDiv:
-                                    # Still true that applied adjustment exceeds price action, 
+                                    # Still true that applied adjustment exceeds price action,
                                     # just not clear what solution is (if any).
-                                    if (x['Adj']<1.0).any():
+                                    if (x_adj<1.0).any():
                                         div_adj_exceeds_prices = True
                                     break
 
             # Can prune the space:
-            div_adj_is_too_small = div_status_df.loc[dt, 'div_exceeds_adj']
-            if div_adj_exceeds_prices and div_adj_is_too_small:
+            if div_adj_exceeds_prices and status_div_exceeds_adj[i]:
                 # Contradiction. Assume former tricked by low-liquidity price action
                 div_adj_exceeds_prices = False
 
-            div_status = {}
-            div_status['adj_exceeds_prices'] = div_adj_exceeds_prices
-            div_status['div_date_wrong'] = div_date_wrong
-            div_status['div_true_date'] = div_true_date
+            f_adj_exceeds_prices[i] = div_adj_exceeds_prices
+            f_div_date_wrong[i] = div_date_wrong
 
             if div_adj_exceeds_prices:
-                split = df2['Stock Splits'].loc[dt]
+                split = splits[div_idx]
                 if split != 0.0:
                     # Check again if div missing split. Use looser tolerance
                     # as we know the adjustment seems wrong.
                     div_postSplit = div / split
                     if div_postSplit > div:
                         # Use volatility-adjusted drop
-                        typical_volatility = div_status_df['vol'].loc[dt]
-                        drop = div_status_df['drop'].loc[dt]
-                        _drop = drop - typical_volatility
+                        _drop = status_drops[i] - status_vols[i]
                     else:
-                        drop_2Dmax = div_status_df['drop_2Dmax'].loc[dt]
-                        _drop = drop_2Dmax
+                        _drop = status_drops_2Dmax[i]
                     if _drop > 0:
                         diff = abs(div-_drop)
                         diff_postSplit = abs(div_postSplit-_drop)
                         if diff_postSplit <= (diff*1.1):
-                            # possibilities.append({'state':'div-pre-split', 'diff':diff_postSplit})
-                            div_status_df.loc[dt, 'div_pre_split'] = True
-
-            for k,v in div_status.items():
-                if k not in div_status_df:
-                    if isinstance(v, (bool, np.bool_)):
-                        div_status_df[k] = False
-                    elif isinstance(v, int):
-                        div_status_df[k] = 0
-                    elif isinstance(v, float):
-                        div_status_df[k] = 0.0
-                    elif k == 'div_true_date':
-                        div_status_df[k] = pd.Series(dtype='datetime64[ns, UTC]')
-                    else:
-                        raise ValueError(k,v,type(v))
-                div_status_df.loc[dt, k] = v
-            if 'div_too_big' in div_status_df.columns and 'div_date_wrong' in div_status_df.columns:
-                # Where div_date_wrong = True, discard div_too_big. Helps with false-positive handling later.
-                div_status_df.loc[div_status_df['div_date_wrong'].to_numpy(), 'div_too_big'] = False
+                            f_pre_split[i] = True
+
+        div_status_df['adj_exceeds_prices'] = f_adj_exceeds_prices
+        div_status_df['div_date_wrong'] = f_div_date_wrong
+        div_status_df['div_true_date'] = pd.Series(dtype='datetime64[ns, UTC]')
+        for dt, div_true_date in div_true_dates.items():
+            div_status_df.loc[dt, 'div_true_date'] = div_true_date
+        if f_pre_split.any():
+            div_status_df.loc[f_pre_split, 'div_pre_split'] = True
+        # Where div_date_wrong = True, discard div_too_big. Helps with false-positive handling later.
+        div_status_df.loc[f_div_date_wrong, 'div_too_big'] = False
 
         checks += ['adj_exceeds_prices', 'div_date_wrong']
 
@@ -2323,12 +2527,6 @@ class PriceHistory:
             fc = div_status_df['cluster'] == cid
             cluster = div_status_df[fc].sort_index()
             n = len(cluster)
-            div_pcts = cluster[['%']].copy()
-            if len(div_pcts) > 1:
-                time_diffs = div_pcts['%'].index.to_series().diff().dt.total_seconds() / (365.25 * 24 * 60 * 60)
-                time_diffs.loc[time_diffs.index[0]] = time_diffs.iloc[1]
-                div_pcts['period'] = time_diffs
-                div_pcts['avg yr yield'] = div_pcts['%'] / div_pcts['period']
 
             for c in checks:
                 if not cluster[c].to_numpy().any():
@@ -2349,7 +2547,7 @@ class PriceHistory:
                         continue
 
                     if 'adj_exceeds_prices' in cluster.columns and (cluster[c] == (cluster[c] & cluster['adj_exceeds_prices'])).all():
-                        # Treat div_too_big=False as false positives IFF adj_exceeds_prices=true AND 
+                        # Treat div_too_big=False as false positives IFF adj_exceeds_prices=true AND
                         # true ratio above (lowered) threshold.
                         true_threshold = 0.5
                         f_adj_exceeds_prices = cluster['adj_exceeds_prices'].to_numpy()
@@ -2408,41 +2606,18 @@ class PriceHistory:
                         div_status_df.loc[fc, c] = False
                         continue
 
-                if c == 'adj_missing':
-                    continue
-                if c == 'div_exceeds_adj':
-                    continue
-
-                if c == 'adj_exceeds_prices':
-                    continue
-
-                if c == 'phantom':
-                    continue
-
-                if c == 'div_date_wrong':
-                    # Fine, these should be rare
-                    continue
-                if c in ['div_pre_split', 'div_too_big_and_pre_split']:
-                    # Fine, these should be rare
-                    continue
+                # Other checks are fine as they are, these should be rare
 
         if 'div_too_big' in checks and 'div_exceeds_adj' in checks:
             c = "adj_too_small"
-            div_status_df[c] = False
-            for i in range(len(div_status_df)):
-                dt = div_status_df.index[i]
-                row = div_status_df.iloc[i]
-                if row['div_too_big'] and row['div_exceeds_adj']:
-                    # Check if div_too_big AND adj-too-small-for-prices
-                    div_yield = row['div']
-                    pct = row['%']
-                    close = div_yield/pct
-                    adj_present = row['present adj']
-                    implied_div_yield = (1-adj_present)*close
-                    ratio = div_yield/implied_div_yield
-                    also_correct_adj = abs(ratio-(currency_divide*currency_divide)) < currency_divide
-                    if also_correct_adj:
-                        div_status_df.loc[dt, c] = True
+            # Check if div_too_big AND adj-too-small-for-prices
+            div_yield = div_status_df['div'].to_numpy()
+            close_before = div_yield / div_status_df['%'].to_numpy()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                implied_div_yield = (1-div_status_df['present adj'].to_numpy())*close_before
+                ratio = div_yield/implied_div_yield
+            also_correct_adj = np.abs(ratio-(currency_divide*currency_divide)) < currency_divide
+            div_status_df[c] = div_status_df['div_too_big'].to_numpy() & div_status_df['div_exceeds_adj'].to_numpy() & also_correct_adj
             if not div_status_df[c].any():
                 div_status_df = div_status_df.drop(c, axis=1)
             else:
@@ -2494,30 +2669,49 @@ class PriceHistory:
                 df2 = pd.concat([df2, df2_nan]).sort_index()
             return df2
 
+        # Apply the repairs. Adjustments multiply all prices before the dividend,
+        # so precompute where each dividend's prefix ends in df2 and df2_nan.
+        adj_close = df2['Adj Close'].to_numpy(dtype=float, copy=True)
+        dividends = df2['Dividends'].to_numpy(dtype=float, copy=True)
+        f_repaired = np.zeros(len(df2), dtype=bool)
+        nan_adj_close = df2_nan['Adj Close'].to_numpy(dtype=float, copy=True)
+        f_nan_repaired = np.zeros(len(df2_nan), dtype=bool)
+        enddts = div_status_df.index - _datetime.timedelta(seconds=1)
+        end_positions = df2.index.searchsorted(enddts, side='right')
+        nan_end_positions = df2_nan.index.searchsorted(enddts, side='right')
+        status_idx = div_status_df['idx'].to_numpy()
+        status_cluster = div_status_df['cluster'].to_numpy()
+        n_failed = div_status_df[checks].to_numpy().sum(axis=1)
+        status_flags = {c: div_status_df[c].to_numpy() if c in div_status_df.columns else np.zeros(len(div_status_df), dtype=bool)
+                        for c in ['adj_missing', 'div_exceeds_adj', 'adj_exceeds_div', 'adj_exceeds_prices', 'div_too_small',
+                                  'div_too_big', 'div_pre_split', 'div_date_wrong', 'adj_too_small', 'FX was repaired']}
+
+        def _apply_adj_correction(i, adj_correction, mark_repaired=True):
+            adj_close[:end_positions[i]] *= adj_correction
+            nan_adj_close[:nan_end_positions[i]] *= adj_correction
+            if mark_repaired:
+                f_repaired[:end_positions[i]] = True
+                f_nan_repaired[:nan_end_positions[i]] = True
+
         # These arrays track changes for constructing compact log messages
         div_repairs = {}
         for cid in list(div_status_df['cluster'].unique()):
-            cluster = div_status_df[div_status_df['cluster']==cid]
-            cluster = cluster.sort_index(ascending=False)
-            cluster['Fixed?'] = False
-            # Reverse order because may delete false-positives
-            for i in range(len(cluster)-1, -1, -1):
-                row = cluster.iloc[i]
+            # Oldest first
+            for i in np.where(status_cluster == cid)[0]:
+                row = div_status_df.iloc[i]
                 dt = row.name
-                enddt = dt-_datetime.timedelta(seconds=1)
-
-                adj_missing = 'adj_missing' in row and row['adj_missing']
-                div_exceeds_adj = 'div_exceeds_adj' in row and row['div_exceeds_adj']
-                adj_exceeds_div = 'adj_exceeds_div' in row and row['adj_exceeds_div']
-                adj_exceeds_prices = 'adj_exceeds_prices' in row and row['adj_exceeds_prices']
-                div_too_small = 'div_too_small' in row and row['div_too_small']
-                div_too_big = 'div_too_big' in row and row['div_too_big']
-                div_pre_split = 'div_pre_split' in row and row['div_pre_split']
-                # div_too_small_and_pre_split = 'div_too_small_and_pre_split' in row and row['div_too_small_and_pre_split']  # not happened yet
-                # div_too_big_and_pre_split = 'div_too_big_and_pre_split' in row and row['div_too_big_and_pre_split']  # not happened yet
-                div_date_wrong = 'div_date_wrong' in row and row['div_date_wrong']
-                adj_too_small = 'adj_too_small' in row and row['adj_too_small']
-                n_failed_checks = np.sum([row[c] for c in checks if c in row])
+                div_pos = status_idx[i]
+
+                adj_missing = status_flags['adj_missing'][i]
+                div_exceeds_adj = status_flags['div_exceeds_adj'][i]
+                adj_exceeds_div = status_flags['adj_exceeds_div'][i]
+                adj_exceeds_prices = status_flags['adj_exceeds_prices'][i]
+                div_too_small = status_flags['div_too_small'][i]
+                div_too_big = status_flags['div_too_big'][i]
+                div_pre_split = status_flags['div_pre_split'][i]
+                div_date_wrong = status_flags['div_date_wrong'][i]
+                adj_too_small = status_flags['adj_too_small'][i]
+                n_failed_checks = n_failed[i]
 
                 if div_too_big and adj_exceeds_prices and n_failed_checks == 2:
                     # adj_exceeds_prices is redundant information, fixing div-too-big
@@ -2529,19 +2723,16 @@ class PriceHistory:
                     if div_too_big:
                         # redundant information
                         div_too_big = False
-                        cluster.loc[dt, 'div_too_big'] = False
                         n_failed_checks -= 1
                     if div_exceeds_adj:
                         # false-positive
                         div_exceeds_adj = False
-                        cluster.loc[dt, 'div_exceeds_adj'] = False
                         n_failed_checks -= 1
 
                 if div_pre_split:
                     if adj_exceeds_prices:
                         # redundant information
                         adj_exceeds_prices = False
-                        cluster.loc[dt, 'adj_exceeds_prices'] = False
                         n_failed_checks -= 1
 
                 if n_failed_checks == 1:
@@ -2550,11 +2741,7 @@ class PriceHistory:
                         k = 'too-small div-adjust' if div_exceeds_adj else 'too-big div-adjust'
                         div_repairs.setdefault(k, []).append(dt)
                         adj_correction = (1.0 - row['%']) / row['present adj']
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
 
                     elif div_too_small:
                         # Fix both dividend and adjustment
@@ -2562,17 +2749,13 @@ class PriceHistory:
                         k = 'too-small div'
                         correction = currency_divide
                         correct_div = row['div'] * correction
-                        df2.loc[dt, 'Dividends'] = correct_div
+                        dividends[div_pos] = correct_div
                         # adj is correct *compared to the present div*, so needs rescaling
                         # to match corrected dividend
                         k += ' & div-adjust'
                         target_adj = 1.0 - ((1.0 - row['present adj']) * correction)
                         adj_correction = target_adj / row['present adj']
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
 
                     elif div_too_big:
@@ -2580,7 +2763,7 @@ class PriceHistory:
                         correction = 1.0/currency_divide
 
                         correct_div = row['div'] * correction
-                        df2.loc[dt, 'Dividends'] = correct_div
+                        dividends[div_pos] = correct_div
 
                         target_div_pct = row['%'] * correction
                         target_adj = 1.0 - target_div_pct
@@ -2588,23 +2771,14 @@ class PriceHistory:
                         # Also correct adjustment to match corrected dividend
                         k += ' & div-adjust'
                         adj_correction = target_adj / present_adj
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
 
                     elif adj_missing:
                         k = 'missing div-adjust'
                         div_repairs.setdefault(k, []).append(dt)
                         adj_correction = 1.0-row['%']
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
 
                     elif div_date_wrong:
                         k = 'wrong ex-div date'
@@ -2612,49 +2786,39 @@ class PriceHistory:
 
                         # First rollback the present adj
                         adj_correction = 1.0/row['present adj']
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
+                        _apply_adj_correction(i, adj_correction, mark_repaired=False)
 
                         # Apply correct adj from correct date
                         div_true_date = row['div_true_date']
-                        close_before = df2['Close'].iloc[row['idx']]
+                        close_before = close[div_pos]
                         div = row['div']
                         true_adj = 1.0 - div/close_before
                         enddt2 = div_true_date-_datetime.timedelta(seconds=1)
-                        df2.loc[    :enddt2, 'Adj Close'] *= true_adj
-                        df2_nan.loc[:enddt2, 'Adj Close'] *= true_adj
+                        adj_close[:df2.index.searchsorted(enddt2, side='right')] *= true_adj
+                        nan_adj_close[:df2_nan.index.searchsorted(enddt2, side='right')] *= true_adj
 
                         # Move div to correct date
-                        df2.loc[div_true_date, 'Dividends'] += div
-                        df2.loc[dt, 'Dividends'] = 0
+                        dividends[df2.index.get_loc(div_true_date)] += div
+                        dividends[div_pos] = 0
 
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        f_repaired[:end_positions[i]] = True
+                        f_nan_repaired[:nan_end_positions[i]] = True
 
                     elif adj_exceeds_prices:
-                        # Nothing else wrong => probably false positive, 
+                        # Nothing else wrong => probably false positive,
                         # but no harm checking the adjustment
                         target_adj = 1.0 - row['%']
                         present_adj = row['present adj']
                         if abs((target_adj/present_adj)-1) > 0.05:
                             # Also correct adjustment to match corrected dividend
-                            k += ' & div-adjust'
                             adj_correction = target_adj / present_adj
-                            df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                            df2.loc[    :enddt, 'Repaired?'] = True
-                            df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                            df2_nan.loc[:enddt, 'Repaired?'] = True
-                            cluster.loc[dt, 'Fixed?'] = True
-                        else:
-                            div_status_df = div_status_df.drop(dt)
-                            cluster = cluster.drop(dt)
+                            _apply_adj_correction(i, adj_correction)
 
                     elif div_pre_split:
                         k = 'pre-split div'
-                        correction = 1.0/df2['Stock Splits'].loc[dt]
+                        correction = 1.0/splits[div_pos]
                         correct_div = row['div'] * correction
-                        df2.loc[dt, 'Dividends'] = correct_div
+                        dividends[div_pos] = correct_div
 
                         target_div_pct = row['%'] * correction
                         target_adj = 1.0 - target_div_pct
@@ -2662,11 +2826,7 @@ class PriceHistory:
                         # Also correct adjustment to match corrected dividend
                         k += ' & div-adjust'
                         adj_correction = target_adj / present_adj
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
 
                 elif n_failed_checks == 2:
@@ -2675,35 +2835,23 @@ class PriceHistory:
                         k = 'too-big div and missing div-adjust'
                         div_repairs.setdefault(k, []).append(dt)
                         adj_correction = 1.0 - row['%']/currency_divide
-                        df2.loc[dt, 'Dividends'] /= currency_divide
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        dividends[div_pos] /= currency_divide
+                        _apply_adj_correction(i, adj_correction)
 
                     elif div_too_small and adj_missing:
                         # A currency unit mixup AND adjustment missing
                         k = 'too-small div and missing div-adjust'
                         div_repairs.setdefault(k, []).append(dt)
                         adj_correction = 1.0 - row['%']*currency_divide
-                        df2.loc[dt, 'Dividends'] *= currency_divide
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        dividends[div_pos] *= currency_divide
+                        _apply_adj_correction(i, adj_correction)
 
                     elif div_too_big and div_exceeds_adj:
-                        div = row['div']
-                        close = div/row['%']
-                        adj_present = row['present adj']
                         # Adj Close is correct, just need to fix Dividend.
                         # Probably just a currency unit mixup.
-                        df2.loc[dt, 'Dividends'] /= currency_divide
+                        dividends[div_pos] /= currency_divide
                         k = 'div-too-big'
                         div_repairs.setdefault(k, []).append(dt)
-                        cluster.loc[dt, 'Fixed?'] = True
 
                     elif div_too_big and adj_exceeds_prices:
                         # Assume div 100x error, and that Yahoo used this wrong dividend.
@@ -2714,57 +2862,42 @@ class PriceHistory:
                         target_div_pct = row['%']/currency_divide
                         target_adj = 1.0 - target_div_pct
                         adj_correction = target_adj / row['present adj']
-                        df2.loc[dt, 'Dividends'] /= currency_divide
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        dividends[div_pos] /= currency_divide
+                        _apply_adj_correction(i, adj_correction)
 
                     elif div_too_small and adj_exceeds_div:
                         # Adj Close is correct, just need to fix Dividend.
                         # Probably just a currency unit mixup.
-                        df2.loc[dt, 'Dividends'] *= currency_divide
+                        dividends[div_pos] *= currency_divide
                         k = 'too-small div'
-                        if 'FX was repaired' in row and row['FX was repaired']:
+                        if status_flags['FX was repaired'][i]:
                             # Complication: not just a currency unit mixup, but
-                            # mixed up the local currency with $. So need to 
+                            # mixed up the local currency with $. So need to
                             # recalculate adjustment.
-                            msg = None
                             div_adj = 1.0 - (row['%']*currency_divide)
                             adj_correction = div_adj / row['present adj']
-                            df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                            df2.loc[    :enddt, 'Repaired?'] = True
-                            df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                            df2_nan.loc[:enddt, 'Repaired?'] = True
+                            _apply_adj_correction(i, adj_correction)
                             # Currently not logging this FX-fix event, since I refactored fixing.
                             k += " and FX mixup"
                         div_repairs.setdefault(k, []).append(dt)
-                        cluster.loc[dt, 'Fixed?'] = True
 
                     elif div_pre_split and div_exceeds_adj:
                         k = 'pre-split & too-small div-adjust'
-                        correction = 1.0/df2['Stock Splits'].loc[dt]
+                        correction = 1.0/splits[div_pos]
                         correct_div = row['div'] * correction
-                        df2.loc[dt, 'Dividends'] = correct_div
+                        dividends[div_pos] = correct_div
 
                         target_div_pct = row['%'] * correction
-                        target_adj = 1.0 - target_div_pct
-
                         adj_correction = (1.0 - target_div_pct) / row['present adj']
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
 
                 elif n_failed_checks == 3:
                     if div_too_big and div_exceeds_adj and div_pre_split:
                         k = 'too-big div & pre-split'
-                        correction = (1.0/currency_divide) * (1.0/df2['Stock Splits'].loc[dt])
+                        correction = (1.0/currency_divide) * (1.0/splits[div_pos])
                         correct_div = row['div'] * correction
-                        df2.loc[dt, 'Dividends'] = correct_div
+                        dividends[div_pos] = correct_div
 
                         target_div_pct = row['%'] * correction
                         target_adj = 1.0 - target_div_pct
@@ -2772,36 +2905,34 @@ class PriceHistory:
                         # Also correct adjustment to match corrected dividend
                         k += ' & div-adjust'
                         adj_correction = target_adj / present_adj
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
-                        cluster.loc[dt, 'Fixed?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
 
                     elif div_too_big and div_exceeds_adj and adj_too_small:
                         # Need to fix dividend AND adj close.
                         # Probably just a currency unit mixup.
                         div = row['div']
-                        close = div/row['%']
+                        close_before = div/row['%']
                         adj_present = row['present adj']
                         k = 'div-too-big and adj-too-small'
                         #
                         div_true = div/currency_divide
-                        pct_true = div_true / close
-                        df2.loc[dt, 'Dividends'] = div_true
+                        pct_true = div_true / close_before
+                        dividends[div_pos] = div_true
                         #
                         adj_correct = 1.0 - pct_true
                         adj_correction = adj_correct / adj_present
-                        df2.loc[    :enddt, 'Adj Close'] *= adj_correction
-                        df2.loc[    :enddt, 'Repaired?'] = True
-                        df2_nan.loc[:enddt, 'Adj Close'] *= adj_correction
-                        df2_nan.loc[:enddt, 'Repaired?'] = True
+                        _apply_adj_correction(i, adj_correction)
                         div_repairs.setdefault(k, []).append(dt)
-                        cluster.loc[dt, 'Fixed?'] = True
 
-            if cluster.empty:
-                continue
+        df2['Adj Close'] = adj_close
+        df2['Dividends'] = dividends
+        if f_repaired.any():
+            df2.loc[f_repaired, 'Repaired?'] = True
+        if not df2_nan.empty:
+            df2_nan['Adj Close'] = nan_adj_close
+            if f_nan_repaired.any():
+                df2_nan.loc[f_nan_repaired, 'Repaired?'] = True
 
         for k in div_repairs:
             msg = f"Repaired {k}: {[str(dt.date()) for dt in sorted(div_repairs[k])]}"
@@ -2918,7 +3049,8 @@ class PriceHistory:
         return df
 
     @utils.log_indent_decorator
-    def _fix_prices_sudden_change(self, df, interval, tz_exchange, change, unit_switch=False, correct_volume=False, correct_dividend=False):
+    def _fix_prices_sudden_change(self, df, interval, tz_exchange, change, unit_switch=False, correct_volume=False, correct_dividend=False,
+                                  prior=None, state=None):
         if df.empty:
             return df
 
@@ -2943,6 +3075,24 @@ class PriceHistory:
             start_min = (df.index[f].min() - _dateutil.relativedelta.relativedelta(years=1)).date()
         logger.debug(f'start_min={start_min} change={change:.4f} (rcp={1.0/change:.4f})', extra=log_extras)
 
+        # Incremental repair: df is only the recent bars, so continue from the
+        # previous scan of full history (1D change stats, switch points).
+        # If the window can't be judged in isolation, raise _RepairWindowInvalid.
+        # prior/state are {change: scan}, from here on just this change's scan.
+        if unit_switch and prior is not None:
+            prior = prior.get(change)
+            if prior is None or prior['changes'] is None or len(prior['changes']) < 2:
+                raise _RepairWindowInvalid()
+        else:
+            prior = None
+        if unit_switch and state is not None:
+            state[change] = {'dt': None, 'changes': None, 'vol_changes': None, 'signals': None,
+                             'split_ages': None, 'individually': False, 'repaired': False,
+                             'split_abort': prior is not None and prior['split_abort']}
+            state = state[change]
+        else:
+            state = None
+
         OHLC = ['Open', 'High', 'Low', 'Close']
 
         correct_columns_individually = False
@@ -2952,6 +3102,10 @@ class PriceHistory:
             # fixing FX unit-switches, as stock-split errors affect entire rows equally.
             if unit_switch:
                 correct_columns_individually = True
+        if prior is not None and prior['individually']:
+            correct_columns_individually = True
+        if state is not None:
+            state['individually'] = correct_columns_individually
         logger.debug(f'correct_columns_individually={correct_columns_individually}', extra=log_extras)
 
         # Do not attempt repair of the split is small,
@@ -2995,6 +3149,31 @@ class PriceHistory:
             log_msg += f' ({df2.index[idx_latest_active].date()})'
         logger.debug(log_msg, extra=log_extras)
 
+        if prior is not None:
+            # Window rows from previous scan's newest bar onwards replace its first rows
+            m = int((df2.index >= prior['dt']).sum())
+            if appears_suspended or idx_latest_active is None or m == 0 or df2.index[m-1] != prior['dt'] \
+                    or n <= m + _SUDDEN_CHANGE_VOLUME_MARGIN:
+                raise _RepairWindowInvalid()
+        if state is not None and n > 0:
+            state['dt'] = df2.index[0]
+            # Splits as number of bars before newest bar (df2 is reverse-sorted)
+            state['split_ages'] = np.where(df2['Stock Splits'].to_numpy() != 0)[0]
+            if prior is not None:
+                state['split_ages'] = np.union1d(state['split_ages'], prior['split_ages'] + m-1)
+
+        def continue_prior(values, key, k):
+            # This window's values for rows affected by new bars, previous scan's for the rest
+            if prior[key] is None:
+                return None
+            return np.concatenate([values[:m+k], prior[key][1+k:]])
+
+        def record_signals(signal_dts):
+            if state is not None:
+                if prior is not None and prior['signals'] is not None:
+                    signal_dts = prior['signals'].union(signal_dts)
+                state['signals'] = signal_dts
+
         df_workings = df2.copy()
         df_workings = df_workings.drop(['Adj Close', 'Dividends', 'Stock Splits', 'Repaired?'], axis=1, errors='ignore')
         df_workings = df_workings.rename(columns={'Volume': 'Vol'})
@@ -3058,6 +3237,8 @@ class PriceHistory:
             # missing stock split.
             # And no Volume probably means prices are garbage.
             logger.debug("No Volume data", extra=log_extras)
+            if prior is not None:
+                raise _RepairWindowInvalid()
             return df
         # Must be on denoised Volume
         def denoise_volume(vol):
@@ -3087,6 +3268,28 @@ class PriceHistory:
             )
             return vol_denoised
 
+        def calc_volume_changes(indices):
+            # Denoise in chunks, marked by price spikes/drops
+            idx1 = indices[0] if len(indices) > 0 else n
+            vol_denoised = np.full(n, 0)
+            vol_denoised[:idx1] = denoise_volume(vol[:idx1])
+            for i in range(len(indices)):
+                if i == len(indices)-1:
+                    idx0 = indices[i]
+                    idx1 = n
+                else:
+                    idx0 = indices[i]
+                    idx1 = indices[i+1]
+                vol_denoised[idx0:idx1] = denoise_volume(vol[idx0:idx1])
+            _1d_volChg = np.full(n, 1.0)
+            f_zero = vol_denoised[:-1] == 0
+            if not f_zero.any():
+                _1d_volChg[1:] = vol_denoised[1:] / vol_denoised[:-1]
+            else:
+                _1d_volChg[1:][f_zero] = 1
+                _1d_volChg[1:][~f_zero] = vol_denoised[1:][~f_zero] / vol_denoised[:-1][~f_zero]
+            return _1d_volChg
+
         f_zero_num_denom = f_zero | np.roll(f_zero, 1, axis=0)
         if f_zero_num_denom.any():
             _1d_change_x[f_zero_num_denom] = 1.0
@@ -3105,20 +3308,32 @@ class PriceHistory:
             # Possible if data was too old for reconstruction.
             _1d_change_denoised[f_na] = 1.0
 
+        # Statistics are of full history, even if repairing just a window
+        stats_changes = _1d_change_denoised
+        if prior is not None:
+            stats_changes = continue_prior(_1d_change_denoised, 'changes', 1)
+        if state is not None:
+            state['changes'] = stats_changes
+            # Volume changes if no price spikes, for a later incremental repair
+            state['vol_changes'] = calc_volume_changes([])
+            if prior is not None:
+                state['vol_changes'] = continue_prior(state['vol_changes'], 'vol_changes', _SUDDEN_CHANGE_VOLUME_MARGIN)
+
         # If all 1D changes are closer to 1.0 than split, exit
-        if np.max(_1d_change_denoised) < (split_max - 1) * 0.5 + 1 and np.min(_1d_change_denoised) > 1.0 / ((split_max - 1) * 0.5 + 1):
+        if np.max(stats_changes) < (split_max - 1) * 0.5 + 1 and np.min(stats_changes) > 1.0 / ((split_max - 1) * 0.5 + 1):
             logger.debug(f'No {fix_type}s detected', extra=log_extras)
+            record_signals(df2.index[:0])
             return df
 
         # Calculate the true price variance, i.e. remove effect of bad split-adjustments.
         # Key = ignore 1D changes outside of interquartile range
-        q1, q3 = np.percentile(_1d_change_denoised, [25, 75])
+        q1, q3 = np.percentile(stats_changes, [25, 75])
         iqr = q3 - q1
         lower_bound = q1 - 1.5 * iqr
         upper_bound = q3 + 1.5 * iqr
-        f = (_1d_change_denoised >= lower_bound) & (_1d_change_denoised <= upper_bound)
-        avg = np.mean(_1d_change_denoised[f])
-        sd = np.std(_1d_change_denoised[f])
+        f = (stats_changes >= lower_bound) & (stats_changes <= upper_bound)
+        avg = np.mean(stats_changes[f])
+        sd = np.std(stats_changes[f])
         # Now can calculate SD as % of mean
         sd_pct = sd / avg
         logger.debug(f"Estimation of true 1D change stats: mean = {avg:.2f}, StdDev = {sd:.4f} ({sd_pct*100.0:.1f}% of mean)", extra=log_extras)
@@ -3133,6 +3348,9 @@ class PriceHistory:
             logger.debug("Split ratio too close to normal price volatility. Won't repair", extra=log_extras)
             logger.debug(f"sd_pct = {sd_pct:.4f}  largest_change_pct = {largest_change_pct:.4f}", extra=log_extras)
             return df
+        if prior is not None and prior['signals'] is None:
+            # Previous scan stopped before finding switch points
+            raise _RepairWindowInvalid()
 
         # Now can detect bad split adjustments
         # Set threshold to halfway between split ratio and largest expected normal price change
@@ -3177,25 +3395,14 @@ class PriceHistory:
             # Difference = FX unit-switch repair doesn't modify Volume.
 
             # But first, need to "denoise" the volume.
-            # Denoise in chunks, marked by price spikes/drops
-            idx1 = indices[0]
-            vol_denoised = np.full(n, 0)
-            vol_denoised[:idx1] = denoise_volume(vol[:idx1])
-            for i in range(len(indices)):
-                if i == len(indices)-1:
-                    idx0 = indices[i]
-                    idx1 = n
-                else:
-                    idx0 = indices[i]
-                    idx1 = indices[i+1]
-                vol_denoised[idx0:idx1] = denoise_volume(vol[idx0:idx1])
-            _1d_volChg = np.full(n, 1.0)
-            f_zero = vol_denoised[:-1] == 0
-            if not f_zero.any():
-                _1d_volChg[1:] = vol_denoised[1:] / vol_denoised[:-1]
-            else:
-                _1d_volChg[1:][f_zero] = 1
-                _1d_volChg[1:][~f_zero] = vol_denoised[1:][~f_zero] / vol_denoised[:-1][~f_zero]
+            _1d_volChg = calc_volume_changes(indices)
+            stats_volChg = _1d_volChg
+            if prior is not None:
+                stats_volChg = continue_prior(_1d_volChg, 'vol_changes', _SUDDEN_CHANGE_VOLUME_MARGIN)
+                if stats_volChg is None:
+                    raise _RepairWindowInvalid()
+            if state is not None:
+                state['vol_changes'] = stats_volChg
 
             if correct_columns_individually:
                 df_workings['vol 1D %'] = _1d_volChg
@@ -3205,13 +3412,13 @@ class PriceHistory:
                 df_workings['vol 1D %'] = df_workings['vol 1D %'].round(3)
 
             # Carefully calculate largest normal volume change %.
-            q1, q3 = np.percentile(_1d_volChg, [25, 75])
+            q1, q3 = np.percentile(stats_volChg, [25, 75])
             iqr = q3 - q1
             lower_bound = q1 - 1.5 * iqr
             upper_bound = q3 + 1.5 * iqr
-            f = (_1d_volChg >= lower_bound) & (_1d_volChg <= upper_bound)
-            avg = np.mean(_1d_volChg[f])
-            sd = np.std(_1d_volChg[f])
+            f = (stats_volChg >= lower_bound) & (stats_volChg <= upper_bound)
+            avg = np.mean(stats_volChg[f])
+            sd = np.std(stats_volChg[f])
             # Now can calculate SD as % of mean
             sd_pct = sd / avg
             logger.debug(f"Estimation of true 1D volChg stats: mean = {avg:.2f}, StdDev = {sd:.4f} ({sd_pct*100.0:.1f}% of mean)", extra=log_extras)
@@ -3384,6 +3591,8 @@ class PriceHistory:
                     f_down[:, j] = f_down[:, j] & df_workings[c+'_f']
                     f_up[:, j] = f_up[:, j] & df_workings[c+'_f']
         f = f_down | f_up
+        f_signal_rows = f if f.ndim == 1 else f.any(axis=1)
+        record_signals(df2.index[f_signal_rows])
 
         if not f.any():
             logger.debug(f'No {fix_type}s detected', extra=log_extras)
@@ -3392,6 +3601,28 @@ class PriceHistory:
         # Update: if any 100x changes are soon after a stock split, so could be confused with split error, then abort
         threshold_days = 30
         f_splits = df2['Stock Splits'].to_numpy() != 0.0
+
+        def gap_within_threshold(gap, dt):
+            # Is gap of bars within threshold_days
+            gap_td = utils._interval_to_timedelta(interval) * gap
+            if isinstance(gap_td, _dateutil.relativedelta.relativedelta):
+                threshold = _dateutil.relativedelta.relativedelta(days=threshold_days)
+                return (dt + gap_td) < (dt + threshold)
+            return gap_td < _datetime.timedelta(days=threshold_days)
+
+        if prior is not None:
+            # New switch points must pair up among the new bars, then repairs of
+            # older data are unchanged. Else repair spans the window boundary.
+            signal_rows = np.where(f_signal_rows)[0]
+            # Is most recent split before new bars too near the oldest new switch point?
+            # Measured in bars like the split check below, which sees whole history.
+            split_near = False
+            if len(prior['split_ages']) > 0:
+                gap = m-1 + prior['split_ages'].min() - signal_rows[-1]
+                split_near = gap <= 0 or gap_within_threshold(gap, df2.index[signal_rows[-1]])
+            if signal_rows[-1] > m or (f.sum(axis=0) % 2 != 0).any() or prior['split_abort'] or split_near \
+                    or (correct_columns_individually and len(prior['signals']) > 0):
+                raise _RepairWindowInvalid()
         if change in [100.0, 0.01] and f_splits.any():
             indices_A = np.where(f_splits)[0]
             indices_B = np.where(f)[0]
@@ -3403,19 +3634,11 @@ class PriceHistory:
             f_pos = gaps > 0
             if f_pos.any():
                 gap_min = gaps[f_pos].min()
-                gap_td = utils._interval_to_timedelta(interval) * gap_min
-                if isinstance(gap_td, _dateutil.relativedelta.relativedelta):
-                    threshold = _dateutil.relativedelta.relativedelta(days=threshold_days)
-                else:
-                    threshold = _datetime.timedelta(days=threshold_days)
-                if isinstance(threshold, _dateutil.relativedelta.relativedelta) and isinstance(gap_td, _dateutil.relativedelta.relativedelta):
-                    idx = np.where(gaps==gap_min)[0][0]
-                    dt = df2.index[idx]
-                    within_threshold = (dt + gap_td) < (dt + threshold)
-                else:
-                    within_threshold = gap_td < threshold
-                if within_threshold:
+                idx = np.where(gaps==gap_min)[0][0]
+                if gap_within_threshold(gap_min, df2.index[idx]):
                     logger.info('100x changes are too soon after stock split events, aborting', extra=log_extras)
+                    if state is not None:
+                        state['split_abort'] = True
                     return df
 
         if logger.isEnabledFor(logging.DEBUG):
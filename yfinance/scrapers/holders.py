@@ -3,18 +3,19 @@ import pandas as pd
 
 from yfinance import utils
 from yfinance.config import YfConfig
-from yfinance.const import _BASE_URL_
 from yfinance.data import YfData
 from yfinance.exceptions import YFDataException
-
-_QUOTE_SUMMARY_URL_ = f"{_BASE_URL_}/v10/finance/quoteSummary"
+from yfinance.scrapers.quote import QuoteSummary
 
 class Holders:
     _SCRAPE_URL_ = 'https://finance.yahoo.com/quote'
 
-    def __init__(self, data: YfData, symbol: str):
+    _MODULES = ["institutionOwnership", "fundOwnership", "majorDirectHolders", "majorHoldersBreakdown", "insiderTransactions", "insiderHolders", "netSharePurchaseActivity"]
+
+    def __init__(self, data: YfData, symbol: str, quote_summary: QuoteSummary = None):
         self._data = data
         self._symbol = symbol
+        self._quote_summary = QuoteSummary(data, symbol) if quote_summary is None else quote_summary
 
         self._major = None
         self._major_direct_holders = None
@@ -62,11 +63,7 @@ class Holders:
         return self._insider_roster
 
     def _fetch(self):
-        modules = ','.join(
-            ["institutionOwnership", "fundOwnership", "majorDirectHolders", "majorHoldersBreakdown", "insiderTransactions", "insiderHolders", "netSharePurchaseActivity"])
-        params_dict = {"modules": modules, "corsDomain": "finance.yahoo.com", "formatted": "false"}
-        result = self._data.get_raw_json(f"{_QUOTE_SUMMARY_URL_}/{self._symbol}", params=params_dict)
-        return result
+        return self._quote_summary.get(self._MODULES)
 
     def _fetch_and_parse(self):
         try:
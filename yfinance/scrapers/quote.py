@@ -1,11 +1,14 @@
 from yfinance._http import HTTPError
+import copy
 import datetime
 import json
 import numbers
+import threading
+import time
 import numpy as _np
 import pandas as pd
 
-from yfinance import utils
+from yfinance import cache, utils
 from yfinance.config import YfConfig
 from yfinance.const import quote_summary_valid_modules, _BASE_URL_, _QUERY1_URL_
 from yfinance.data import YfData
@@ -43,6 +46,89 @@ info_retired_keys = info_retired_keys_price | info_retired_keys_exchange | info_
 _QUOTE_SUMMARY_URL_ = f"{_BASE_URL_}/v10/finance/quoteSummary"
 
 
+class _QuoteSummaryBatch:
+    def __init__(self):
+        self.modules = []
+        self.done = threading.Event()
+        self.error = None
+
+
+class QuoteSummary:
+    """
+    quoteSummary modules of one symbol, shared by the scrapers of a Ticker.
+    Each module is fetched once: modules requested together (by prefetch(),
+    or by scrapers within yf.config.network.coalesce_window seconds of each
+    other) share one request.
+    """
+
+    def __init__(self, data: YfData, symbol: str):
+        self._data = data
+        self._symbol = symbol
+        self._modules = {}  # module -> data, None if Yahoo didn't return it
+        self._lock = threading.Lock()
+        self._batch = None
+
+    def get(self, modules: list) -> dict:
+        """Return modules as a quoteSummary response, fetching those not held"""
+        result = self._fetch_missing(modules)
+        if result is not None:
+            # Yahoo returned an error, pass to caller
+            return result
+        with self._lock:
+            data = {m: self._modules[m] for m in modules if self._modules.get(m) is not None}
+        # Parsers modify the data, so each gets own copy
+        return {"quoteSummary": {"result": [copy.deepcopy(data)], "error": None}}
+
+    def prefetch(self, modules: list):
+        self._fetch_missing(modules)
+
+    def _fetch_missing(self, modules):
+        with self._lock:
+            missing = [m for m in modules if m not in self._modules]
+            if not missing:
+                return None
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _QuoteSummaryBatch()
+            batch.modules.extend(m for m in missing if m not in batch.modules)
+
+        if not leader:
+            batch.done.wait()
+            if batch.error is not None:
+                raise batch.error
+            with self._lock:
+                missing = [m for m in modules if m not in self._modules]
+            # Anything still missing is a failed response
+            return None if not missing else self._fetch(missing)
+
+        window = YfConfig.network.coalesce_window
+        if window:
+            # Let other requests for this symbol join
+            time.sleep(window)
+        with self._lock:
+            self._batch = None
+        try:
+            return self._fetch(batch.modules)
+        except Exception as e:
+            batch.error = e
+            raise
+        finally:
+            batch.done.set()
+
+    def _fetch(self, modules):
+        params_dict = {"modules": ','.join(modules), "corsDomain": "finance.yahoo.com", "formatted": "false", "symbol": self._symbol, "lang": YfConfig.locale.lang, "region": YfConfig.locale.region}
+        result = self._data.get_raw_json(_QUOTE_SUMMARY_URL_ + f"/{self._symbol}", params=params_dict)
+        try:
+            data = result["quoteSummary"]["result"][0]
+        except (KeyError, IndexError, TypeError):
+            return result
+        with self._lock:
+            for m in modules:
+                self._modules[m] = data.get(m)
+        return None
+
+
 class FastInfo:
     # Contain small subset of info[] items that can be fetched faster elsewhere.
     # Imitates a dict.
@@ -50,6 +136,7 @@ class FastInfo:
         self._tkr = tickerBaseObject
 
         self._prices_1y = None
+        self._prices_5d = None
         self._prices_1wk_1h_prepost = None
         self._prices_1wk_1h_reg = None
         self._md = None
@@ -145,20 +232,36 @@ class FastInfo:
     def toJSON(self, indent=4):
         return json.dumps({k: self[k] for k in self.keys()}, indent=indent)
 
+    def _load_metadata(self):
+        # Metadata of the daily chart request just made. Everything FastInfo
+        # reads is in it, so skip the intraday fetch of get_history_metadata().
+        self._md = self._tkr._lazy_load_price_history()._get_last_history_metadata()
+        try:
+            ctp = self._md["currentTradingPeriod"]
+            self._today_open = pd.to_datetime(ctp["regular"]["start"], unit='s', utc=True).tz_convert(self.timezone)
+            self._today_close = pd.to_datetime(ctp["regular"]["end"], unit='s', utc=True).tz_convert(self.timezone)
+            self._today_midnight = self._today_close.ceil("D")
+        except Exception:
+            self._today_open = None
+            self._today_close = None
+            self._today_midnight = None
+            raise
+
+    def _get_recent_prices(self):
+        # Last few daily bars, enough for the latest session's fields.
+        # Reuse the 1y prices if already fetched, else a 5d request is enough.
+        if self._prices_1y is not None:
+            return self._prices_1y
+        if self._prices_5d is None:
+            self._prices_5d = self._tkr.history(period="5d", auto_adjust=False, keepna=True)
+            self._load_metadata()
+        return self._prices_5d
+
     def _get_1y_prices(self, fullDaysOnly=False):
+        # Only for the fields that need a full year: averages, year high/low/change
         if self._prices_1y is None:
             self._prices_1y = self._tkr.history(period="1y", auto_adjust=False, keepna=True)
-            self._md = self._tkr.get_history_metadata()
-            try:
-                ctp = self._md["currentTradingPeriod"]
-                self._today_open = pd.to_datetime(ctp["regular"]["start"], unit='s', utc=True).tz_convert(self.timezone)
-                self._today_close = pd.to_datetime(ctp["regular"]["end"], unit='s', utc=True).tz_convert(self.timezone)
-                self._today_midnight = self._today_close.ceil("D")
-            except Exception:
-                self._today_open = None
-                self._today_close = None
-                self._today_midnight = None
-                raise
+            self._load_metadata()
 
         if self._prices_1y.empty:
             return self._prices_1y
@@ -185,8 +288,7 @@ class FastInfo:
         if self._md is not None:
             return self._md
 
-        self._get_1y_prices()
-        self._md = self._tkr.get_history_metadata()
+        self._get_recent_prices()
         return self._md
 
     def _exchange_open_now(self):
@@ -205,7 +307,7 @@ class FastInfo:
         # else:
         #     r = t < self._today_midnight
 
-        last_day_cutoff = self._get_1y_prices().index[-1] + datetime.timedelta(days=1)
+        last_day_cutoff = self._get_recent_prices().index[-1] + datetime.timedelta(days=1)
         last_day_cutoff += datetime.timedelta(minutes=20)
         r = t < last_day_cutoff
 
@@ -217,8 +319,7 @@ class FastInfo:
         if self._currency is not None:
             return self._currency
 
-        md = self._tkr.get_history_metadata()
-        self._currency = md["currency"]
+        self._currency = self._get_exchange_metadata()["currency"]
         return self._currency
 
     @property
@@ -226,8 +327,7 @@ class FastInfo:
         if self._quote_type is not None:
             return self._quote_type
 
-        md = self._tkr.get_history_metadata()
-        self._quote_type = md["instrumentType"]
+        self._quote_type = self._get_exchange_metadata()["instrumentType"]
         return self._quote_type
 
     @property
@@ -267,7 +367,7 @@ class FastInfo:
     def last_price(self):
         if self._last_price is not None:
             return self._last_price
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         if prices.empty:
             md = self._get_exchange_metadata()
             if "regularMarketPrice" in md:
@@ -308,7 +408,7 @@ class FastInfo:
     def regular_market_previous_close(self):
         if self._reg_prev_close is not None:
             return self._reg_prev_close
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         if prices.shape[0] == 1:
             # Tiny % of tickers don't return daily history before last trading day,
             # so backup option is hourly history:
@@ -330,7 +430,7 @@ class FastInfo:
     def open(self):
         if self._open is not None:
             return self._open
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         if prices.empty:
             self._open = None
         else:
@@ -343,7 +443,7 @@ class FastInfo:
     def day_high(self):
         if self._day_high is not None:
             return self._day_high
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         if prices.empty:
             self._day_high = None
         else:
@@ -356,7 +456,7 @@ class FastInfo:
     def day_low(self):
         if self._day_low is not None:
             return self._day_low
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         if prices.empty:
             self._day_low = None
         else:
@@ -369,7 +469,7 @@ class FastInfo:
     def last_volume(self):
         if self._last_volume is not None:
             return self._last_volume
-        prices = self._get_1y_prices()
+        prices = self._get_recent_prices()
         self._last_volume = None if prices.empty else int(prices["Volume"].iloc[-1])
         return self._last_volume
 
@@ -503,9 +603,12 @@ class FastInfo:
 
 
 class Quote:
-    def __init__(self, data: YfData, symbol: str):
+    _INFO_MODULES = ['financialData', 'quoteType', 'defaultKeyStatistics', 'assetProfile', 'summaryDetail']
+
+    def __init__(self, data: YfData, symbol: str, quote_summary: QuoteSummary = None):
         self._data = data
         self._symbol = symbol
+        self._quote_summary = QuoteSummary(data, symbol) if quote_summary is None else quote_summary
 
         self._info = None
         self._retired_info = None
@@ -652,12 +755,11 @@ class Quote:
         if not isinstance(modules, list):
             raise YFException("Should provide a list of modules, see available modules using `valid_modules`")
 
-        modules = ','.join([m for m in modules if m in quote_summary_valid_modules])
+        modules = [m for m in modules if m in quote_summary_valid_modules]
         if len(modules) == 0:
             raise YFException("No valid modules provided, see available modules using `valid_modules`")
-        params_dict = {"modules": modules, "corsDomain": "finance.yahoo.com", "formatted": "false", "symbol": self._symbol, "lang": YfConfig.locale.lang, "region": YfConfig.locale.region}
         try:
-            result = self._data.get_raw_json(_QUOTE_SUMMARY_URL_ + f"/{self._symbol}", params=params_dict)
+            result = self._quote_summary.get(modules)
         except HTTPError as e:
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -680,8 +782,7 @@ class Quote:
         if self._already_fetched:
             return
         self._already_fetched = True
-        modules = ['financialData', 'quoteType', 'defaultKeyStatistics', 'assetProfile', 'summaryDetail']
-        result = self._fetch(modules=modules)
+        result = self._fetch(modules=self._INFO_MODULES)
         additional_info = self._fetch_additional_info()
 
         if result is None:
@@ -747,17 +848,11 @@ class Quote:
         # display-formatted strings (e.g. '3.76T', '32.39'). ``freq``
         # ('quarterly' / 'monthly' / 'yearly' / 'trailing') selects the period
         # columns; 'Current' always comes from the trailing series.
-        prefix = _VALUATION_FREQ_PREFIX.get(freq)
-        if prefix is None:
-            raise ValueError(f"freq must be one of {list(_VALUATION_FREQ_PREFIX)}, not '{freq}'")
-        keys = list(_VALUATION_MEASURE_LABELS.keys())
-        # Always also fetch the 'trailing' series for the 'Current' column.
-        prefixes = sorted({prefix, "trailing"})
-        types = ",".join(f"{p}{k}" for k in keys for p in prefixes)
+        types = self._valuation_types(freq)
         period1 = int(datetime.datetime(2016, 12, 31).timestamp())
         period2 = int(pd.Timestamp.now("UTC").ceil("D").timestamp())
         url = f"{_BASE_URL_}/ws/fundamentals-timeseries/v1/finance/timeseries/{self._symbol}"
-        params = {"symbol": self._symbol, "type": types, "period1": period1, "period2": period2}
+        params = {"symbol": self._symbol, "type": ",".join(types), "period1": period1, "period2": period2}
         try:
             # cache_get (not get_raw_json) to match scrapers/fundamentals.py and
             # benefit from response caching for the same timeseries endpoint.
@@ -769,8 +864,22 @@ class Quote:
             utils.get_yf_logger().error(f"Failed to fetch valuation measures: {e}")
             return pd.DataFrame()
 
+        result = (data.get("timeseries") or {}).get("result") or []
+        return self._parse_valuation_measures(result, freq)
+
+    @staticmethod
+    def _valuation_types(freq) -> list:
+        # fundamentals-timeseries types needed for valuation measures at `freq`
+        prefix = _VALUATION_FREQ_PREFIX.get(freq)
+        if prefix is None:
+            raise ValueError(f"freq must be one of {list(_VALUATION_FREQ_PREFIX)}, not '{freq}'")
+        # Always also fetch the 'trailing' series for the 'Current' column.
+        prefixes = sorted({prefix, "trailing"})
+        return [f"{p}{k}" for k in _VALUATION_MEASURE_LABELS for p in prefixes]
+
+    def _parse_valuation_measures(self, result: list, freq) -> pd.DataFrame:
+        prefix = _VALUATION_FREQ_PREFIX[freq]
         try:
-            result = (data.get("timeseries") or {}).get("result") or []
             period = {}      # label -> {Timestamp: raw value}  (the requested freq)
             trailing = {}    # label -> {Timestamp: raw value}
             for item in result:
@@ -909,6 +1018,9 @@ class Quote:
                 self._calendar['Revenue High'] = earnings.get('revenueHigh', None)
                 self._calendar['Revenue Low'] = earnings.get('revenueLow', None)
                 self._calendar['Revenue Average'] = earnings.get('revenueAverage', None)
+                if YfConfig.cache.fundamentals and self._calendar['Earnings Date']:
+                    # Tells the fundamentals store when statements will change
+                    cache.get_fundamentals_store().set_earnings_date(self._symbol, min(self._calendar['Earnings Date']))
         except (KeyError, IndexError):
             if not YfConfig.debug.hide_exceptions:
                 raise
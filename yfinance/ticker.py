@@ -22,11 +22,16 @@
 from __future__ import print_function
 
 from collections import namedtuple as _namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as _pd
 
+from . import utils
+from ._http import size_pool
 from .base import TickerBase
+from .config import YfConfig
 from .const import _BASE_URL_
+from .exceptions import YFRateLimitError
 from .scrapers.funds import FundsData
 
 
@@ -104,6 +109,76 @@ class Ticker(TickerBase):
             "underlying": options['underlying']
         })
 
+    def option_chains(self, dates=None, tz=None, max_workers=8) -> _pd.DataFrame:
+        """
+        Fetch the option chains of several expirations concurrently.
+        :Parameters:
+            dates : None, "all", str, list
+                Expirations as in Ticker.options. Default is all
+            tz : str
+                Convert lastTradeDate to this timezone
+            max_workers: int
+                How many expirations to fetch concurrently. Default is 8
+        :Returns:
+            DataFrame with one row per contract, the columns of
+            option_chain() plus 'expiration' and 'type' ('call' or 'put').
+        """
+        first = None
+        if not self._expirations:
+            # Listing expirations also returns the nearest chain
+            first = self._download_options()
+        if dates is None or dates == "all":
+            dates = list(self._expirations)
+        elif isinstance(dates, str):
+            dates = [dates]
+        invalid = [d for d in dates if d not in self._expirations]
+        if invalid:
+            raise ValueError(
+                f"Expirations {invalid} cannot be found. "
+                f"Available expirations are: [{', '.join(self._expirations)}]")
+
+        chains = {}
+        if first and 'expirationDate' in first:
+            date = _pd.Timestamp(first['expirationDate'], unit='s').strftime('%Y-%m-%d')
+            if date in dates:
+                chains[date] = first
+
+        to_fetch = [d for d in dates if d not in chains]
+        if to_fetch:
+            max_workers = max(min(int(max_workers), len(to_fetch)), 1)
+            size_pool(self._data._session, max_workers)
+            logger = utils.get_yf_logger()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(d, executor.submit(self._download_options, self._expirations[d])) for d in to_fetch]
+                for date, future in futures:
+                    try:
+                        chains[date] = future.result()
+                    except YFRateLimitError:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    except Exception as e:
+                        if not YfConfig.debug.hide_exceptions:
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            raise
+                        logger.error(f"{self.ticker}: Failed to get options expiring {date}: {e}")
+
+        frames = []
+        for date in dates:
+            options = chains.get(date)
+            if not options:
+                continue
+            for option_type in ['calls', 'puts']:
+                df = self._options2df(options.get(option_type, []), tz=tz)
+                df.insert(0, 'expiration', date)
+                df.insert(1, 'type', option_type[:-1])
+                frames.append(df)
+        if not frames:
+            df = self._options2df([], tz=tz)
+            df.insert(0, 'expiration', None)
+            df.insert(1, 'type', None)
+            return df
+        return _pd.concat(frames, ignore_index=True)
+
     # ------------------------
 
     @property
@@ -21,10 +21,39 @@
 
 from __future__ import print_function
 
-from . import Ticker, multi
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as _pd
+
+from . import Ticker, multi, utils
+from ._http import size_pool
+from .config import YfConfig
 from .live import WebSocket
 from .data import YfData
 from .const import period_default
+from .exceptions import YFRateLimitError
+from .scrapers.holders import Holders
+from .scrapers.quote import FastInfo
+
+
+# Ticker attributes fetch_modules() supports -> quoteSummary modules they parse
+_QUOTE_SUMMARY_ATTRIBUTES = {
+    'major_holders': Holders._MODULES,
+    'institutional_holders': Holders._MODULES,
+    'mutualfund_holders': Holders._MODULES,
+    'insider_transactions': Holders._MODULES,
+    'insider_purchases': Holders._MODULES,
+    'insider_roster_holders': Holders._MODULES,
+    'earnings_estimate': ['earningsTrend'],
+    'revenue_estimate': ['earningsTrend'],
+    'eps_trend': ['earningsTrend'],
+    'eps_revisions': ['earningsTrend'],
+    'growth_estimates': ['earningsTrend', 'industryTrend', 'sectorTrend', 'indexTrend'],
+    'earnings_history': ['earningsHistory'],
+    'sustainability': ['esgScores'],
+    'recommendations': ['recommendationTrend'],
+    'upgrades_downgrades': ['upgradeDowngradeHistory'],
+}
 
 
 class Tickers:
@@ -89,6 +118,116 @@ class Tickers:
 
         return data
 
+    def fetch_modules(self, modules, max_workers=8) -> dict:
+        """
+        Fetch holders, analysis and ESG data of all tickers concurrently.
+        Each ticker's modules are fetched in one request, then parsed
+        like the Ticker attributes, which are also set.
+        :Parameters:
+            modules : str, list
+                Ticker attributes e.g. 'institutional_holders', 'insider_transactions',
+                'earnings_estimate', 'sustainability'
+            max_workers: int
+                How many tickers to fetch concurrently. Default is 8
+        :Returns:
+            dict of attribute -> DataFrame, all tickers concatenated,
+            with a 'ticker' column first.
+        """
+        if isinstance(modules, str):
+            modules = [modules]
+        invalid = [m for m in modules if m not in _QUOTE_SUMMARY_ATTRIBUTES]
+        if invalid:
+            raise ValueError(f"Unsupported modules {invalid}, must be in {list(_QUOTE_SUMMARY_ATTRIBUTES)}")
+        quote_summary_modules = list(dict.fromkeys(m for a in modules for m in _QUOTE_SUMMARY_ATTRIBUTES[a]))
+
+        def fetch(symbol):
+            ticker = self.tickers[symbol]
+            ticker._quote_summary.prefetch(quote_summary_modules)
+            return {m: getattr(ticker, m) for m in modules}
+
+        results = self._fetch_concurrently(fetch, max_workers)
+
+        tables = {}
+        for m in modules:
+            frames = []
+            for symbol in self.symbols:
+                df = results.get(symbol, {}).get(m)
+                if not isinstance(df, _pd.DataFrame) or df.empty:
+                    continue
+                if not isinstance(df.index, _pd.RangeIndex):
+                    df = df.reset_index()
+                df = df.copy()
+                df.insert(0, 'ticker', symbol)
+                frames.append(df)
+            tables[m] = _pd.concat(frames, ignore_index=True) if frames else _pd.DataFrame(columns=['ticker'])
+        return tables
+
+    def fast_info_frame(self, fields=None, max_workers=8) -> _pd.DataFrame:
+        """
+        Fetch fast_info of all tickers concurrently, as one table.
+        Only the requested fields are computed, so e.g. prices of the
+        latest session cost one short chart request per ticker.
+        :Parameters:
+            fields : str, list
+                fast_info keys e.g. 'lastPrice', 'dayHigh', 'marketCap'.
+                Default is all keys
+            max_workers: int
+                How many tickers to fetch concurrently. Default is 8
+        :Returns:
+            DataFrame indexed by ticker, one column per field.
+            Tickers that failed have a row of NaN.
+        """
+        keys = FastInfo(None)
+        if fields is None:
+            fields = keys.keys()
+        elif isinstance(fields, str):
+            fields = [fields]
+        invalid = [f for f in fields if f not in keys._keys]
+        if invalid:
+            raise ValueError(f"Unsupported fields {invalid}, must be in {keys.keys()}")
+
+        def fetch(symbol):
+            fast_info = self.tickers[symbol].fast_info
+            return {f: fast_info[f] for f in fields}
+
+        results = self._fetch_concurrently(fetch, max_workers)
+        df = _pd.DataFrame.from_dict(results, orient='index', columns=fields)
+        df = df.reindex(self.symbols)
+        df.index.name = 'ticker'
+        return df
+
+    def _fetch_concurrently(self, fetch, max_workers) -> dict:
+        # Run fetch(symbol) for every ticker, logging failures like download()
+        max_workers = max(min(int(max_workers), len(self.symbols)), 1)
+        size_pool(self._data._session, max_workers)
+
+        logger = utils.get_yf_logger()
+        results = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(s, executor.submit(fetch, s)) for s in self.symbols]
+            for symbol, future in futures:
+                try:
+                    results[symbol] = future.result()
+                except YFRateLimitError:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                except Exception as e:
+                    if not YfConfig.debug.hide_exceptions:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    errors[symbol] = repr(e)
+
+        if errors:
+            logger.error('\n%.f Failed download%s:' % (
+                len(errors), 's' if len(errors) > 1 else ''))
+            grouped = {}
+            for symbol, err in errors.items():
+                grouped.setdefault(err, []).append(symbol)
+            for err, syms in grouped.items():
+                logger.error(f'{syms}: ' + err)
+        return results
+
     def news(self):
         return {ticker: [item for item in Ticker(ticker).news] for ticker in self.symbols}
 